@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Benchmark the paper adapter JSON codecs.
+
+Measures decoding of a large /orders history and a /tickers sweep, and
+encoding of order payloads, for every codec installed in the current
+environment.
+
+Usage:
+    python benchmarks/bench_codec.py [--orders 5000] [--tickers 2000] [--repeat 20]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mockexchange_gateway.adapters.codec import get_codec  # noqa: E402
+
+
+def make_orders(count):
+    return [
+        {
+            "id": f"order-{i}",
+            "symbol": "BTC/USDT",
+            "side": "buy" if i % 2 else "sell",
+            "type": "limit",
+            "status": "filled",
+            "price": 30000.0 + i * 0.5,
+            "amount": 0.01 + i * 1e-5,
+            "filled": 0.01 + i * 1e-5,
+            "notion_currency": "USDT",
+            "fee_rate": 0.001,
+            "fee_cost": 0.3,
+            "ts_create": 1700000000000 + i,
+            "ts_update": 1700000000500 + i,
+            "history": [{"ts": 1700000000000 + i, "status": "new", "price": 30000.0}],
+        }
+        for i in range(count)
+    ]
+
+
+def make_tickers(count):
+    return {
+        f"SYM{i}/USDT": {
+            "symbol": f"SYM{i}/USDT",
+            "timestamp": 1700000000000 + i,
+            "price": 1.0 + i,
+            "bid": 0.99 + i,
+            "ask": 1.01 + i,
+            "bid_volume": 10.0,
+            "ask_volume": 12.0,
+        }
+        for i in range(count)
+    }
+
+
+def best_of(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=5000)
+    parser.add_argument("--tickers", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    stdlib = get_codec("json")
+    orders_body = stdlib.dumps(make_orders(args.orders))
+    tickers_body = stdlib.dumps(make_tickers(args.tickers))
+    payload = make_orders(1)[0]
+
+    print(f"/orders body: {len(orders_body) / 1e6:.2f} MB", end=", ")
+    print(f"/tickers body: {len(tickers_body) / 1e6:.2f} MB")
+    print(f"{'codec':<10}{'orders ms':>12}{'tickers ms':>12}{'encode us':>12}{'speedup':>10}")
+
+    baseline = None
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print(f"{name:<10}{'not installed':>34}")
+            continue
+
+        orders = best_of(lambda codec=codec: codec.loads(orders_body), args.repeat)
+        tickers = best_of(lambda codec=codec: codec.loads(tickers_body), args.repeat)
+        encode = best_of(
+            lambda codec=codec: [codec.dumps(payload) for _ in range(1000)], args.repeat
+        )
+        total = orders + tickers
+        baseline = baseline or total
+        print(
+            f"{name:<10}{orders * 1e3:>12.2f}{tickers * 1e3:>12.2f}"
+            f"{encode * 1e3:>12.2f}{baseline / total:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
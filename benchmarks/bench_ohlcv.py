@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Benchmark the fetch_ohlcv result formats.
+
+Converts ccxt-style OHLCV rows for several symbols into every format and
+reports the conversion time, the memory the result holds on to, and the
+time to compute a mean close over every candle.
+
+Usage:
+    python benchmarks/bench_ohlcv.py [--candles 20000] [--symbols 20] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from mockexchange_gateway.adapters.columnar import (  # noqa: E402
+    OHLCV_FORMATS,
+    check_ohlcv_format,
+    ohlcv_to_array,
+)
+
+
+def make_rows(count):
+    return [
+        [1700000000000 + i * 60000, 100.0 + i, 101.0 + i, 99.0 + i, 100.5 + i, 3.25]
+        for i in range(count)
+    ]
+
+
+def mean_close(result, format):
+    if format == "list":
+        return sum(row[4] for row in result) / len(result)
+    if format == "array":
+        closes = result[4::6]
+        return sum(closes) / len(closes)
+    if format == "structured":
+        return float(result["close"].mean())
+    return float(result[:, 4].mean())
+
+
+def best_of(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def retained_bytes(build):
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candles", type=int, default=20000)
+    parser.add_argument("--symbols", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.symbols} symbols x {args.candles} candles")
+    print(f"{'format':<12}{'convert ms':>12}{'memory MB':>12}{'mean close ms':>15}")
+
+    for format in OHLCV_FORMATS:
+        try:
+            check_ohlcv_format(format)
+        except ImportError:
+            print(f"{format:<12}{'numpy not installed':>39}")
+            continue
+
+        batches = [make_rows(args.candles) for _ in range(args.symbols)]
+        convert = best_of(
+            lambda format=format, batches=batches: [
+                ohlcv_to_array(rows, format) for rows in batches
+            ],
+            args.repeat,
+        )
+        # Memory of the result alone (for "list", the rows ccxt returns)
+        memory = retained_bytes(
+            lambda format=format: [
+                ohlcv_to_array(make_rows(args.candles), format) for _ in range(args.symbols)
+            ]
+        )
+        results = [ohlcv_to_array(rows, format) for rows in batches]
+        reduce = best_of(
+            lambda format=format, results=results: [
+                mean_close(result, format) for result in results
+            ],
+            args.repeat,
+        )
+        print(f"{format:<12}{convert * 1e3:>12.2f}{memory / 1e6:>12.1f}{reduce * 1e3:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,10 @@ This package provides a unified interface that works with both MockExchange
 for testing and real exchanges via CCXT for production trading.
 """
 
+from .core.batch import BatchResult
+from .core.cache import TickerCache
 from .core.capabilities import get_has_dict, has_feature
+from .core.deadline import deadline
 from .core.errors import (
     AuthenticationError,
     BadRequest,
@@ -19,9 +22,13 @@ from .core.errors import (
     NetworkError,
     NotSupported,
     OrderNotFound,
+    RateLimitExceeded,
     RequestTimeout,
 )
 from .core.facade import MockXGateway
+from .core.facade_async import AsyncMockXGateway
+from .core.ratelimit import RateLimiter
+from .core.retry import RetryPolicy
 from .runtime.factory import ExchangeFactory
 
 __version__ = "0.2.0"
@@ -29,6 +36,7 @@ __version__ = "0.2.0"
 __all__ = [
     # Main gateway class
     "MockXGateway",
+    "AsyncMockXGateway",
     # Factory class
     "ExchangeFactory",
     # Error classes
@@ -43,6 +51,15 @@ __all__ = [
     "NotSupported",
     "NetworkError",
     "RequestTimeout",
+    "RateLimitExceeded",
+    # Result types
+    "BatchResult",
+    # Caching
+    "TickerCache",
+    # Rate limiting and retries
+    "RateLimiter",
+    "RetryPolicy",
+    "deadline",
     # Utility functions
     "get_has_dict",
     "has_feature",
@@ -1,12 +1,30 @@
 """Adapters package for MockX Gateway."""
 
-from .mapping import DataMapper, ResponseMapper
+from .codec import JsonCodec, get_codec
+from .columnar import Columns, to_columns
+from .mapping import DataMapper, LazyOrder, LazyTicker, PartialDict, PartialList, ResponseMapper
 from .paper import PaperAdapter
+from .paper_async import AsyncPaperAdapter
 from .prod import ProdAdapter
+from .prod_async import AsyncProdAdapter
+from .session import PoolConfig, SessionRegistry, get_session_registry
 
 __all__ = [
     "PaperAdapter",
+    "AsyncPaperAdapter",
     "ProdAdapter",
+    "AsyncProdAdapter",
     "DataMapper",
     "ResponseMapper",
+    "PartialList",
+    "PartialDict",
+    "LazyOrder",
+    "LazyTicker",
+    "Columns",
+    "to_columns",
+    "PoolConfig",
+    "SessionRegistry",
+    "get_session_registry",
+    "JsonCodec",
+    "get_codec",
 ]
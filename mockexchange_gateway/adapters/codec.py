@@ -0,0 +1,120 @@
+"""adapters/codec.py
+
+JSON codecs for paper adapter request and response bodies.
+
+Decoding large /orders histories and ticker sweeps is CPU bound, so the
+paper adapters accept a codec that can use a faster JSON library. The
+stdlib json module is the default; orjson and msgspec are optional and
+opt-in ("orjson", "msgspec", or "auto" for the fastest installed), since
+they differ from json on edge cases such as NaN and very large integers.
+"""
+
+import json
+from typing import Any, Dict, Optional, Union
+
+Codec = Union[str, "JsonCodec", None]
+
+
+class JsonCodec:
+    """Encode and decode JSON bodies with the standard library.
+
+    Subclasses swap in a faster library. Every codec encodes to UTF-8 bytes
+    and raises ValueError for malformed input, so the adapters' error
+    mapping does not depend on the library in use.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Parse JSON bytes or text."""
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes."""
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Parse JSON bytes or text."""
+        # orjson.JSONDecodeError is a ValueError subclass
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._error = msgspec.DecodeError
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes."""
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Parse JSON bytes or text."""
+        try:
+            return self._decoder.decode(data)
+        except self._error as e:
+            raise ValueError(str(e)) from e
+
+
+_CODECS = {"json": JsonCodec, "orjson": OrjsonCodec, "msgspec": MsgspecCodec}
+
+# Preference order for "auto"
+_AUTO_ORDER = ("orjson", "msgspec", "json")
+
+_instances: Dict[str, JsonCodec] = {}
+
+
+def get_codec(codec: Codec = "json") -> JsonCodec:
+    """Resolve a codec name or instance.
+
+    Args:
+        codec: A JsonCodec instance, one of "json" (or None), "orjson",
+            "msgspec", or "auto" for the fastest installed library
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the named library is not installed
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+
+    name = codec or "json"
+    if name == "auto":
+        for candidate in _AUTO_ORDER:
+            try:
+                return get_codec(candidate)
+            except ImportError:
+                continue
+
+    if name not in _CODECS:
+        raise ValueError(f"Unknown JSON codec '{name}'. Available: auto, {', '.join(_CODECS)}")
+
+    instance: Optional[JsonCodec] = _instances.get(name)
+    if instance is None:
+        instance = _instances[name] = _CODECS[name]()
+    return instance
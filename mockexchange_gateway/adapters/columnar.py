@@ -0,0 +1,235 @@
+"""adapters/columnar.py
+
+Columnar mapping of order and ticker lists, and array formats for OHLCV.
+
+``to_columns`` turns a list of records into one array per field in a single
+pass, without building a CCXT dict per row, so PnL and exposure can be
+computed with vectorized arithmetic over thousands of orders:
+
+    >>> orders = gateway.fetch_orders_columnar("BTC/USDT")
+    >>> signed = np.where(orders["side"] == "buy", 1.0, -1.0)
+    >>> exposure = (signed * orders["filled"] * orders["price"]).sum()
+
+Numeric columns are float64 or int64 NumPy arrays when NumPy is installed
+(``backend="numpy"``), and ``array.array`` ("d" / "q") otherwise
+(``backend="array"``); string columns are object arrays or lists. NumPy is
+optional: ``backend="auto"`` uses it when it can be imported.
+
+``ohlcv_to_array`` does the same for candles: ``fetch_ohlcv(...,
+format="numpy")`` returns one (n, 6) float64 block instead of n lists.
+"""
+
+from array import array
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .mapping import ccxt_order_status
+
+BACKENDS = ("auto", "numpy", "array")
+
+# Column kinds: "str" (object), "float" (float64, NaN if missing), "int" (int64, 0 if missing)
+Column = Tuple[str, str, str, Optional[Callable[[Any], Any]]]
+
+# (column, kind, record key, converter) for raw MockExchange orders
+ORDER_COLUMNS: Tuple[Column, ...] = (
+    ("id", "str", "id", None),
+    ("symbol", "str", "symbol", None),
+    ("side", "str", "side", None),
+    ("type", "str", "type", None),
+    ("status", "str", "status", ccxt_order_status),
+    ("price", "float", "price", None),
+    ("amount", "float", "amount", None),
+    ("filled", "float", "filled", None),
+    ("remaining", "float", "remaining", None),
+    ("cost", "float", "cost", None),
+    ("timestamp", "int", "created_at", None),
+)
+
+# The same columns read from CCXT orders (production mode)
+CCXT_ORDER_COLUMNS: Tuple[Column, ...] = tuple(
+    (name, kind, name, None) for name, kind, _, _ in ORDER_COLUMNS
+)
+
+# (column, kind, record key, converter) for raw MockExchange tickers
+TICKER_COLUMNS: Tuple[Column, ...] = (
+    ("symbol", "str", "symbol", None),
+    ("bid", "float", "bid", None),
+    ("ask", "float", "ask", None),
+    ("last", "float", "last", None),
+    ("bidVolume", "float", "bid_volume", None),
+    ("askVolume", "float", "ask_volume", None),
+    ("timestamp", "int", "timestamp", None),
+)
+
+# The same columns read from CCXT tickers (production mode)
+CCXT_TICKER_COLUMNS: Tuple[Column, ...] = tuple(
+    (name, kind, name, None) for name, kind, _, _ in TICKER_COLUMNS
+)
+
+_TYPECODES = {"float": "d", "int": "q"}
+_MISSING = {"float": float("nan"), "int": 0}
+
+
+def _coerce(value: Any, kind: str) -> Any:
+    # Values a typed array rejects: float timestamps, numeric strings, ...
+    try:
+        return int(float(value)) if kind == "int" else float(value)
+    except (TypeError, ValueError, OverflowError):
+        return _MISSING[kind]
+
+
+def resolve_backend(backend: str = "auto") -> str:
+    """Resolve "auto" to "numpy" when NumPy is installed, else "array".
+
+    Raises:
+        ValueError: If the backend is unknown
+        ImportError: If "numpy" is requested but NumPy is not installed
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown columnar backend '{backend}'. Available: {', '.join(BACKENDS)}")
+    if backend == "array":
+        return backend
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        if backend == "numpy":
+            raise
+        return "array"
+    return "numpy"
+
+
+class Columns(dict):
+    """Column name -> array, all of the same length.
+
+    Attributes:
+        rows: Number of records
+        backend: "numpy" or "array"
+        skipped: Keys (e.g. symbols) missing because their request failed
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, Any],
+        rows: int,
+        backend: str,
+        skipped: Optional[Dict[Any, Exception]] = None,
+    ):
+        super().__init__(columns)
+        self.rows = rows
+        self.backend = backend
+        self.skipped: Dict[Any, Exception] = skipped or {}
+
+
+def to_columns(
+    records: Iterable[Dict[str, Any]],
+    spec: Tuple[Column, ...],
+    backend: str = "auto",
+    skipped: Optional[Dict[Any, Exception]] = None,
+) -> Columns:
+    """Map records to one array per column of spec in a single pass.
+
+    Numeric values of another type (float timestamps, numeric strings) are
+    converted; values that cannot be converted become the missing value.
+    """
+    backend = resolve_backend(backend)
+    columns: List[Any] = [
+        [] if kind == "str" else array(_TYPECODES[kind]) for _, kind, _, _ in spec
+    ]
+    plan = [
+        (column.append, key, convert, kind, _MISSING.get(kind))
+        for column, (_, kind, key, convert) in zip(columns, spec)
+    ]
+
+    rows = 0
+    for record in records:
+        get = record.get
+        for append, key, convert, kind, missing in plan:
+            value = get(key)
+            if convert is not None:
+                value = convert(value)
+            if value is None and missing is not None:
+                value = missing
+            try:
+                append(value)
+            except (TypeError, OverflowError):
+                append(_coerce(value, kind))
+        rows += 1
+
+    if backend == "numpy":
+        import numpy as np
+
+        dtypes = {"str": object, "float": np.float64, "int": np.int64}
+        columns = [
+            # Numeric columns are zero-copy views over the array buffers
+            np.frombuffer(column, dtype=dtypes[kind])
+            if kind != "str" and rows
+            else np.array(column, dtype=dtypes[kind])
+            for column, (_, kind, _, _) in zip(columns, spec)
+        ]
+
+    return Columns(
+        {name: column for column, (name, _, _, _) in zip(columns, spec)}, rows, backend, skipped
+    )
+
+
+# Fields of a CCXT OHLCV row, in order
+OHLCV_FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
+
+OHLCV_FORMATS = ("list", "numpy", "structured", "array")
+
+
+def check_ohlcv_format(format: str) -> None:
+    """Fail before fetching if format is unknown or needs NumPy that is missing.
+
+    Raises:
+        ValueError: If the format is unknown
+        ImportError: If "numpy" or "structured" is requested without NumPy
+    """
+    if format not in OHLCV_FORMATS:
+        raise ValueError(f"Unknown OHLCV format '{format}'. Available: {', '.join(OHLCV_FORMATS)}")
+    if format in ("numpy", "structured"):
+        resolve_backend("numpy")
+
+
+def ohlcv_to_array(rows: List[List[Any]], format: str = "numpy") -> Any:
+    """Convert CCXT OHLCV rows into one contiguous block.
+
+    Formats:
+        list: rows unchanged
+        numpy: (n, 6) float64 array; millisecond timestamps are exact in float64
+        structured: NumPy record array with an int64 ``timestamp`` and float64
+            open/high/low/close/volume fields
+        array: flat row-major ``array.array("d")`` of n * 6 values (no NumPy)
+
+    Missing values (ccxt reports None for unknown volume) become NaN.
+    """
+    check_ohlcv_format(format)
+    if format == "list":
+        return rows
+
+    width = len(OHLCV_FIELDS)
+    if format == "array":
+        try:
+            return array("d", chain.from_iterable(rows))
+        except TypeError:
+            nan = float("nan")
+            return array("d", (nan if v is None else v for v in chain.from_iterable(rows)))
+
+    import numpy as np
+
+    # One conversion in C from the row lists; None becomes NaN
+    block = np.array(rows, dtype=np.float64).reshape(-1, width)
+    if format == "numpy":
+        return block
+
+    records = np.empty(len(block), dtype=ohlcv_dtype())
+    for i, name in enumerate(OHLCV_FIELDS):
+        records[name] = block[:, i]
+    return records
+
+
+def ohlcv_dtype() -> Any:
+    """Return the NumPy dtype used for format="structured"."""
+    import numpy as np
+
+    return np.dtype([("timestamp", np.int64)] + [(name, np.float64) for name in OHLCV_FIELDS[1:]])
@@ -6,8 +6,32 @@ This module handles the translation of data structures between MockExchange
 and CCXT to ensure consistent API responses.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+# A payload mapper: raw MockExchange dict -> CCXT structure (dict or LazyRecord)
+Mapper = Callable[[Dict[str, Any]], Mapping]
+
+# MockExchange order statuses mapped to CCXT standard statuses
+ORDER_STATUSES = {
+    "new": "open",
+    "partially_filled": "partially_filled",
+    "filled": "closed",
+    "canceled": "canceled",
+    "rejected": "rejected",
+    "expired": "expired",
+    "partially_canceled": "canceled",
+    "partially_rejected": "rejected",
+    "partially_expired": "expired",
+}
+
+
+def ccxt_order_status(status: Any) -> str:
+    """Map a MockExchange order status to CCXT ("unknown" if missing)."""
+    if not status:
+        return "unknown"
+    return ORDER_STATUSES.get(str(status), str(status))
 
 
 class DataMapper:
@@ -91,34 +115,17 @@ class DataMapper:
         - MockExchange 'canceled' -> CCXT 'canceled'
         - MockExchange 'rejected' -> CCXT 'rejected'
         - MockExchange 'expired' -> CCXT 'expired'
-        """
-        # Map MockExchange statuses to CCXT standard statuses
-        status_mapping = {
-            "new": "open",
-            "partially_filled": "partially_filled",
-            "filled": "closed",
-            "canceled": "canceled",
-            "rejected": "rejected",
-            "expired": "expired",
-            "partially_canceled": "canceled",
-            "partially_rejected": "rejected",
-            "partially_expired": "expired",
-        }
-
-        mockexchange_status = order_data.get("status")
-        ccxt_status = (
-            status_mapping.get(str(mockexchange_status), str(mockexchange_status))
-            if mockexchange_status
-            else "unknown"
-        )
 
+        See ORDER_STATUSES for the full table, and LazyOrder for a read-only
+        view that maps fields on access.
+        """
         return {
             "id": order_data.get("id"),
-            "clientOrderId": None,
+            "clientOrderId": order_data.get("client_order_id") or order_data.get("clientOrderId"),
             "datetime": DataMapper._timestamp_to_datetime(order_data.get("created_at")),
             "timestamp": order_data.get("created_at"),
             "lastTradeTimestamp": order_data.get("updated_at"),
-            "status": ccxt_status,  # Use mapped CCXT status
+            "status": ccxt_order_status(order_data.get("status")),
             "symbol": order_data.get("symbol"),
             "type": order_data.get("type"),
             "timeInForce": None,
@@ -217,8 +224,6 @@ class DataMapper:
             timestamp = int(timestamp / 1000)
 
         # Use UTC to align with CCXT's iso8601 semantics
-        from datetime import timezone
-
         return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat().replace("+00:00", "Z")
 
     @staticmethod
@@ -257,6 +262,167 @@ class DataMapper:
             raise ValueError("Price is required for limit orders")
 
 
+def _field(name: str) -> Callable[[Dict[str, Any]], Any]:
+    return lambda data: data.get(name)
+
+
+def _none(data: Dict[str, Any]) -> None:
+    return None
+
+
+def _info(data: Dict[str, Any]) -> Dict[str, Any]:
+    return data
+
+
+class LazyRecord(Mapping):
+    """Read-only CCXT view of a raw MockExchange payload.
+
+    Subclasses list their CCXT fields in ``FIELDS``, in CCXT key order, as
+    functions of the raw payload. A field is only mapped when it is first
+    read and is then cached, so results nobody inspects cost one small
+    object instead of a full dict. Records compare equal to the dict the
+    eager mapper builds; use ``to_dict()`` (or ``dict(record)``) where a
+    real dict is needed, e.g. for JSON serialization or mutation.
+
+    Attributes:
+        info: The raw MockExchange payload
+    """
+
+    __slots__ = ("info", "_values")
+
+    FIELDS: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+
+    def __init__(self, info: Dict[str, Any]):
+        self.info = info
+        self._values: Optional[Dict[str, Any]] = None
+
+    def __getitem__(self, key: str) -> Any:
+        values = self._values
+        if values is None:
+            values = self._values = {}
+        elif key in values:
+            return values[key]
+        value = values[key] = self.FIELDS[key](self.info)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a plain dict with every field mapped."""
+        return {key: self[key] for key in self.FIELDS}
+
+    def copy(self) -> Dict[str, Any]:
+        """Return a mutable dict copy, like dict.copy()."""
+        return self.to_dict()
+
+
+class LazyOrder(LazyRecord):
+    """Lazy counterpart of DataMapper.mockexchange_order_to_ccxt."""
+
+    __slots__ = ()
+
+    FIELDS = {
+        "id": _field("id"),
+        "clientOrderId": lambda data: data.get("client_order_id") or data.get("clientOrderId"),
+        "datetime": lambda data: DataMapper._timestamp_to_datetime(data.get("created_at")),
+        "timestamp": _field("created_at"),
+        "lastTradeTimestamp": _field("updated_at"),
+        "status": lambda data: ccxt_order_status(data.get("status")),
+        "symbol": _field("symbol"),
+        "type": _field("type"),
+        "timeInForce": _none,
+        "postOnly": _none,
+        "side": _field("side"),
+        "price": _field("price"),
+        "stopPrice": _none,
+        "amount": _field("amount"),
+        "filled": _field("filled"),
+        "remaining": _field("remaining"),
+        "cost": _field("cost"),
+        "trades": _none,
+        "fee": _none,
+        "info": _info,
+    }
+
+
+class LazyTicker(LazyRecord):
+    """Lazy counterpart of DataMapper.mockexchange_ticker_to_ccxt."""
+
+    __slots__ = ()
+
+    FIELDS = {
+        "symbol": _field("symbol"),
+        "timestamp": _field("timestamp"),
+        "datetime": lambda data: DataMapper._timestamp_to_datetime(data.get("timestamp")),
+        "high": _none,
+        "low": _none,
+        "bid": _field("bid"),
+        "bidVolume": _field("bid_volume"),
+        "ask": _field("ask"),
+        "askVolume": _field("ask_volume"),
+        "vwap": _none,
+        "open": _none,
+        "close": _field("last"),
+        "last": _field("last"),
+        "previousClose": _none,
+        "change": _none,
+        "percentage": _none,
+        "average": _none,
+        "baseVolume": _none,
+        "quoteVolume": _none,
+        "info": _info,
+    }
+
+
+class PartialList(list):
+    """List result that also reports what could not be fetched.
+
+    Behaves exactly like a list of results. Items that were skipped because
+    their individual request failed are listed in ``skipped``, mapping the
+    item key (e.g. an order id) to the exception raised for it.
+    """
+
+    def __init__(self, items: Iterable[Any] = (), skipped: Optional[Dict[Any, Exception]] = None):
+        super().__init__(items)
+        self.skipped: Dict[Any, Exception] = skipped or {}
+
+    @property
+    def complete(self) -> bool:
+        """True if nothing was skipped."""
+        return not self.skipped
+
+
+class PartialDict(dict):
+    """Dict result that also reports what could not be fetched.
+
+    The dict counterpart of PartialList: ``skipped`` maps each key that is
+    missing because its request failed (e.g. a symbol) to the exception.
+    """
+
+    def __init__(
+        self,
+        items: Optional[Dict[Any, Any]] = None,
+        skipped: Optional[Dict[Any, Exception]] = None,
+    ):
+        super().__init__(items or {})
+        self.skipped: Dict[Any, Exception] = skipped or {}
+
+    @property
+    def complete(self) -> bool:
+        """True if nothing was skipped."""
+        return not self.skipped
+
+
 class ResponseMapper:
     """Response mapper for handling different response formats."""
 
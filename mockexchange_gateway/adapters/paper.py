@@ -6,22 +6,231 @@ This adapter translates CCXT-style calls to MockExchange HTTP API calls
 and converts responses back to CCXT format.
 """
 
-from typing import Any, Dict, List, Optional
+import logging
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
 
 import requests
 
 from ..config.symbols import normalize_symbol
+from ..core.batch import BatchResult, iter_batch, order_spec_args, run_batch
+from ..core.calllog import add_phase, current_phases
 from ..core.capabilities import require_support
+from ..core.circuit import CircuitBreakers
+from ..core.deadline import check_deadline
+from ..core.endpoints import paper_endpoint
 from ..core.errors import (
     AuthenticationError,
     BadRequest,
+    ErrorMapper,
     ExchangeError,
+    ExchangeNotAvailable,
     InsufficientFunds,
+    MockXError,
     NetworkError,
     OrderNotFound,
     RequestTimeout,
 )
-from .mapping import DataMapper, ResponseMapper
+from ..core.hedging import HedgePolicy
+from ..core.ratelimit import RateLimiter
+from ..core.retry import RetryPolicy
+from ..core.singleflight import SingleFlight, make_key
+from ..core.stats import GatewayStats, add_io
+from ..core.tracing import SpanFactory, record_status, span
+from .codec import Codec, get_codec
+from .columnar import ORDER_COLUMNS, TICKER_COLUMNS, Columns, to_columns
+from .mapping import (
+    DataMapper,
+    LazyOrder,
+    LazyTicker,
+    Mapper,
+    PartialDict,
+    PartialList,
+    ResponseMapper,
+)
+from .session import PoolConfig, create_session, get_session_registry, pool_stats
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# MockExchange statuses for orders that are not in a final state
+OPEN_ORDER_STATUSES = frozenset({"new", "partially_filled"})
+
+# Conservative URL length accepted by common HTTP servers and proxies
+DEFAULT_MAX_URL_LENGTH = 2048
+
+
+def error_for_status(status_code: int, message: str) -> MockXError:
+    """Map a MockExchange HTTP error status to a CCXT-style error.
+
+    Shared by the sync and async paper adapters so both surface the same
+    exception types for the same backend responses. Throttling (429) and
+    server errors (5xx) map to retryable NetworkError subclasses, which the
+    circuit breaker counts as backend failures.
+    """
+    if status_code == 400:
+        return BadRequest(message)
+    elif status_code == 401:
+        return AuthenticationError(message)
+    elif status_code == 404:
+        return OrderNotFound(message)
+    elif status_code == 422:  # MockExchange uses 422 for insufficient funds
+        return InsufficientFunds(message)
+    elif status_code in (403, 429, 502, 503, 504):
+        return ErrorMapper.map_http_status(status_code, message)
+    elif 500 <= status_code < 600:
+        return ExchangeNotAvailable(f"HTTP {status_code}: {message}")
+    else:
+        return ExchangeError(f"HTTP {status_code}: {message}")
+
+
+def markets_from_symbols(symbols: List[str]) -> Dict[str, Any]:
+    """Build a CCXT markets dict from MockExchange's /tickers symbol list."""
+    markets = {}
+    for symbol in symbols:
+        base, quote = symbol.split("/")
+        market_data = {
+            "symbol": symbol,
+            "base": base,
+            "quote": quote,
+            "active": True,
+            "precision": {},
+            "limits": {},
+            "info": {},
+        }
+        markets[symbol] = DataMapper.mockexchange_market_to_ccxt(market_data)
+    return markets
+
+
+def chunk_symbols(symbols: List[str], max_path_length: int) -> List[List[str]]:
+    """Split symbols so each /tickers/{a,b,...} path stays within max_path_length.
+
+    A symbol that is too long on its own still gets a chunk of its own.
+    """
+    prefix = len("/tickers/")
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    length = prefix
+
+    for symbol in symbols:
+        added = len(symbol) + (1 if current else 0)
+        if current and length + added > max_path_length:
+            chunks.append(current)
+            current, length, added = [], prefix, len(symbol)
+        current.append(symbol)
+        length += added
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def raw_ticker_chunks(
+    chunks: List[List[str]], results: List[BatchResult]
+) -> Tuple[List[Dict[str, Any]], Dict[str, Exception]]:
+    """Collect raw tickers from per-chunk /tickers responses and the symbols skipped."""
+    tickers: List[Dict[str, Any]] = []
+    skipped: Dict[str, Exception] = {}
+    for chunk, item in zip(chunks, results):
+        if item.ok:
+            tickers.extend(item.result.values())
+        else:
+            skipped.update(dict.fromkeys(chunk, item.error))
+    return tickers, skipped
+
+
+def merge_ticker_chunks(
+    chunks: List[List[str]],
+    results: List[BatchResult],
+    to_ccxt: Mapper = DataMapper.mockexchange_ticker_to_ccxt,
+) -> PartialDict:
+    """Merge per-chunk /tickers responses, recording failed chunks as skipped."""
+    merged = PartialDict()
+    for chunk, item in zip(chunks, results):
+        if item.ok:
+            for symbol, ticker_data in item.result.items():
+                merged[symbol] = to_ccxt(ticker_data)
+        else:
+            merged.skipped.update(dict.fromkeys(chunk, item.error))
+
+    if merged.skipped:
+        failed = [item for item in results if not item.ok]
+        logger.warning(
+            "fetch_tickers skipped %d symbols in %d of %d chunks (first error: %s)",
+            len(merged.skipped),
+            len(failed),
+            len(results),
+            failed[0].error,
+        )
+    return merged
+
+
+def unwrap_ticker(data: Any, symbol: str) -> Any:
+    """Extract a single ticker from a /tickers/{symbol} response."""
+    # Handle MockExchange response format
+    if isinstance(data, dict) and symbol in data:
+        return data[symbol]
+    return data
+
+
+def unwrap_canceled_order(data: Any) -> Any:
+    """Extract the order from a /orders/{id}/cancel response."""
+    # MockExchange returns the canceled order in a nested structure
+    if isinstance(data, dict) and "canceled_order" in data:
+        return data["canceled_order"]
+    return data
+
+
+def is_open_order(order_data: Dict[str, Any]) -> bool:
+    """Check whether a raw MockExchange order is still open."""
+    return str(order_data.get("status", "")).lower() in OPEN_ORDER_STATUSES
+
+
+def build_order_payload(
+    symbol: str,
+    type: str,
+    side: str,
+    amount: float,
+    price: Optional[float] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Build the JSON body for /orders and /orders/can_execute."""
+    order_data = {
+        "symbol": normalize_symbol(symbol, "paper"),
+        "type": type,
+        "side": side,
+        "amount": amount,
+    }
+
+    if price is not None:
+        order_data["limit_price"] = price
+
+    if params:
+        order_data.update(params)
+
+    return order_data
+
+
+def build_orders_query(
+    symbol: Optional[str] = None,
+    since: Optional[int] = None,
+    limit: Optional[int] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Build the query parameters for /orders and /orders/list."""
+    query_params: Dict[str, Any] = {}
+
+    if symbol:
+        query_params["symbol"] = normalize_symbol(symbol, "paper")
+    if since:
+        query_params["since"] = str(since)
+    if limit:
+        query_params["tail"] = str(limit)  # MockExchange uses 'tail' instead of 'limit'
+    if params:
+        query_params.update(params)
+
+    return query_params
 
 
 class PaperAdapter:
@@ -47,13 +256,66 @@ class PaperAdapter:
     4. **Authentication**: Handles API key authentication with MockExchange
     """
 
-    def __init__(self, base_url: str, api_key: str, timeout: float = 10.0):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 10.0,
+        coalesce_reads: bool = False,
+        max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+        pool_config: Optional[PoolConfig] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        share_session: bool = False,
+        codec: Codec = "json",
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        stats: Optional[GatewayStats] = None,
+        lazy_results: bool = False,
+    ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({"x-api-key": api_key, "Content-Type": "application/json"})
+        self.max_url_length = max_url_length
+        self.pool_config = pool_config or PoolConfig()
+        # Separate connect/read timeouts fall back to the overall timeout
+        self.connect_timeout = connect_timeout if connect_timeout is not None else timeout
+        self.read_timeout = read_timeout if read_timeout is not None else timeout
+        self.share_session = share_session
+        self._borrowed = share_session
+        if share_session:
+            # Borrow a process-wide pool for this host; credentials stay per instance
+            self.session = get_session_registry().acquire(self.base_url, self.pool_config)
+        else:
+            self.session = create_session(self.pool_config)
+        self._headers = {"x-api-key": api_key, "Content-Type": "application/json"}
+        # Request bodies and responses go through the codec instead of requests' stdlib json
+        self.codec = get_codec(codec)
+        # Client-side budget, usually shared by every gateway for this account
+        self.rate_limiter = rate_limiter
+        # Transient failures are retried when set; writes only with an idempotency key
+        self.retry_policy = retry_policy
+        # Fail fast per endpoint class while the backend is down
+        self.circuit_breakers = circuit_breakers
+        # Slow reads get a backup request when set
+        self.hedge_policy = hedge_policy
+        # Per-endpoint counters and latency histograms when set
+        self.stats = stats
+        # Fetched orders and tickers are read-only views mapped on access when set
+        self.lazy_results = lazy_results
+        self._order_mapper: Mapper = (
+            LazyOrder if lazy_results else DataMapper.mockexchange_order_to_ccxt
+        )
+        self._ticker_mapper: Mapper = (
+            LazyTicker if lazy_results else DataMapper.mockexchange_ticker_to_ccxt
+        )
+        # Span factory set through MockXGateway.set_tracer
+        self.tracer: Optional[SpanFactory] = None
         self._markets_cache: Dict[str, Any] = {}
+        # Identical concurrent GETs share one request when enabled
+        self._flight: Optional[SingleFlight] = SingleFlight() if coalesce_reads else None
 
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Any:
         """Make HTTP request to MockExchange.
@@ -69,6 +331,16 @@ class PaperAdapter:
         - HTTP error status code mapping
         - JSON response parsing
         - Network error handling
+        - Optional coalescing of identical concurrent GETs (never writes)
+        - Optional retries of transient failures of GETs; timed-out writes are
+          not resent (recover them with ``fetch_order_by_client_id``)
+        - Optional circuit breaking: fails fast with ExchangeNotAvailable
+          while the endpoint class is open
+        - Optional hedging of slow GETs with a backup request
+        - Deadline propagation: inside ``gateway.deadline(...)`` socket
+          timeouts shrink to the time left and spent budgets fail fast
+        - Optional per-endpoint stats: call count, errors, bytes and latency
+        - Optional tracing: one span per HTTP attempt with the status code
 
         Args:
             method: HTTP method (GET, POST, etc.)
@@ -85,46 +357,130 @@ class PaperAdapter:
             BadRequest: If request is malformed
             ExchangeError: For other HTTP errors
         """
+        if self.stats is not None:
+            return self.stats.measure(
+                paper_endpoint(method, endpoint),
+                lambda: self._send_coalesced(method, endpoint, **kwargs),
+            )
+        return self._send_coalesced(method, endpoint, **kwargs)
+
+    def _send_coalesced(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Send a request, sharing identical concurrent GETs when coalescing is enabled."""
+        if self._flight is not None and method.upper() == "GET":
+            key = make_key(method.upper(), endpoint, kwargs.get("params"))
+            return self._flight.do(key, lambda: self._send_with_breaker(method, endpoint, **kwargs))
+
+        return self._send_with_breaker(method, endpoint, **kwargs)
+
+    def _send_with_breaker(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Send a request through the circuit breaker, if any."""
+        if self.circuit_breakers is None:
+            return self._send_with_retry(method, endpoint, **kwargs)
+
+        breaker = self.circuit_breakers.for_endpoint(paper_endpoint(method, endpoint))
+        return breaker.call(lambda: self._send_with_retry(method, endpoint, **kwargs))
+
+    def _send_with_retry(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Send a request under the retry policy, if any."""
+        if self.retry_policy is None:
+            return self._send_hedged(method, endpoint, **kwargs)
+
+        # Writes are never resent: MockExchange is not known to reject duplicate
+        # client order ids, so a retried POST /orders could place a second order
+        idempotent = method.upper() == "GET"
+        return self.retry_policy.call(
+            lambda: self._send_hedged(method, endpoint, **kwargs), idempotent
+        )
+
+    def _send_hedged(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Send a request, hedging it if it is a read covered by the hedge policy."""
+        if self.hedge_policy is not None and method.upper() == "GET":
+            name = paper_endpoint(method, endpoint)
+            if self.hedge_policy.applies_to(name):
+                return self.hedge_policy.call(
+                    name, lambda: self._send_request(method, endpoint, **kwargs)
+                )
+        return self._send_request(method, endpoint, **kwargs)
+
+    def _send_request(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Send one HTTP request to MockExchange, inside a span when tracing."""
+        if self.tracer is None:
+            return self._send_http(method, endpoint, **kwargs)
+
+        name = paper_endpoint(method, endpoint)
+        attributes = {"endpoint": name, "http.method": method, "http.route": endpoint}
+        with span(self.tracer, f"mockexchange.{name}", attributes):
+            return self._send_http(method, endpoint, **kwargs)
+
+    def _send_http(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Send one HTTP request to MockExchange and decode the response."""
         url = f"{self.base_url}{endpoint}"
+        check_deadline(f"{method} {endpoint}")
+        if "json" in kwargs:
+            kwargs["data"] = self.codec.dumps(kwargs.pop("json"))
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(paper_endpoint(method, endpoint))
 
+        started = time.perf_counter()
         try:
-            response = self.session.request(method=method, url=url, timeout=self.timeout, **kwargs)
-
-            # Handle HTTP errors
-            if response.status_code >= 400:
-                self._handle_http_error(response)
-
-            return response.json()
-
+            response = self.session.request(
+                method=method,
+                url=url,
+                timeout=(self.connect_timeout, self.read_timeout),
+                headers=self._headers,
+                **kwargs,
+            )
         except requests.exceptions.Timeout:
             raise RequestTimeout(f"Request timeout: {url}")
         except requests.exceptions.ConnectionError:
             raise NetworkError(f"Connection error: {url}")
         except requests.exceptions.RequestException as e:
             raise NetworkError(f"Network error: {str(e)}")
+        finally:
+            add_phase("server", time.perf_counter() - started)
+
+        add_io(len(kwargs.get("data") or b""), len(response.content))
+        record_status(response.status_code)
+
+        # Handle HTTP errors
+        if response.status_code >= 400:
+            self._handle_http_error(response)
+
+        started = time.perf_counter()
+        try:
+            return self.codec.loads(response.content)
         except ValueError as e:
             raise ExchangeError(f"Invalid JSON response: {str(e)}")
+        finally:
+            add_phase("decode", time.perf_counter() - started)
+
+    def _map(self, endpoint: str, func: Callable[..., T], *args: Any) -> T:
+        """Run a response mapping step, timing and tracing it when enabled."""
+        if self.tracer is None and self.stats is None and current_phases() is None:
+            return func(*args)
+        started = time.perf_counter()
+        try:
+            if self.tracer is None:
+                return func(*args)
+            with span(self.tracer, f"map.{endpoint}", {"endpoint": endpoint}):
+                return func(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            add_phase("map", elapsed)
+            if self.stats is not None:
+                self.stats.record_mapping(endpoint, elapsed)
 
     def _handle_http_error(self, response: requests.Response) -> None:
         """Handle HTTP error responses."""
         status_code = response.status_code
 
         try:
-            error_data = response.json()
+            error_data = self.codec.loads(response.content)
             message = error_data.get("message", error_data.get("error", "Unknown error"))
-        except ValueError:
+        except (ValueError, AttributeError):
             message = response.text or f"HTTP {status_code}"
 
-        if status_code == 400:
-            raise BadRequest(message)
-        elif status_code == 401:
-            raise AuthenticationError(message)
-        elif status_code == 404:
-            raise OrderNotFound(message)
-        elif status_code == 422:  # MockExchange uses 422 for insufficient funds
-            raise InsufficientFunds(message)
-        else:
-            raise ExchangeError(f"HTTP {status_code}: {message}")
+        raise error_for_status(status_code, message)
 
     # Market data methods
     def load_markets(self, reload: bool = False) -> Dict[str, Any]:
@@ -133,21 +489,7 @@ class PaperAdapter:
             return self._markets_cache
 
         data = self._make_request("GET", "/tickers")
-
-        # Convert to CCXT format
-        markets = {}
-        for symbol in data:
-            base, quote = symbol.split("/")
-            market_data = {
-                "symbol": symbol,
-                "base": base,
-                "quote": quote,
-                "active": True,
-                "precision": {},
-                "limits": {},
-                "info": {},
-            }
-            markets[symbol] = DataMapper.mockexchange_market_to_ccxt(market_data)
+        markets = markets_from_symbols(data)
 
         self._markets_cache = markets
         return markets
@@ -156,14 +498,7 @@ class PaperAdapter:
         """Fetch ticker for a symbol."""
         symbol = normalize_symbol(symbol, "paper")
         data = self._make_request("GET", f"/tickers/{symbol}")
-
-        # Handle MockExchange response format
-        if isinstance(data, dict) and symbol in data:
-            ticker_data = data[symbol]
-        else:
-            ticker_data = data
-
-        return DataMapper.mockexchange_ticker_to_ccxt(ticker_data)
+        return self._map("fetch_ticker", self._ticker_mapper, unwrap_ticker(data, symbol))
 
     def fetch_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Any]:
         """Fetch tickers for multiple symbols.
@@ -171,7 +506,32 @@ class PaperAdapter:
         Note: MockExchange's /tickers endpoint returns a list of symbols, not ticker data.
         To get actual ticker data, we need to fetch individual tickers or use the
         comma-separated symbols endpoint.
+
+        Large symbol lists are split into chunks so that no request URL exceeds
+        max_url_length, and the chunks are fetched in parallel. If a chunk
+        fails, the other chunks are still returned; the result is a PartialDict
+        whose ``skipped`` attribute maps each missing symbol to its error.
         """
+        fetched = self._fetch_ticker_chunks(symbols)
+        if fetched is None:
+            return {}
+        chunks, results = fetched
+        return self._map("fetch_tickers", merge_ticker_chunks, chunks, results, self._ticker_mapper)
+
+    def fetch_tickers_columnar(
+        self, symbols: Optional[List[str]] = None, backend: str = "auto"
+    ) -> Columns:
+        """Fetch tickers as columns (see adapters.columnar); failed chunks are skipped."""
+        fetched = self._fetch_ticker_chunks(symbols)
+        if fetched is None:
+            return to_columns([], TICKER_COLUMNS, backend)
+        tickers, skipped = raw_ticker_chunks(*fetched)
+        return self._map("fetch_tickers", to_columns, tickers, TICKER_COLUMNS, backend, skipped)
+
+    def _fetch_ticker_chunks(
+        self, symbols: Optional[List[str]]
+    ) -> Optional[Tuple[List[List[str]], List[BatchResult]]]:
+        """Fetch raw tickers in URL-sized chunks; None if there are no symbols."""
         # Get the list of symbols to fetch
         if symbols:
             # Use provided symbols
@@ -180,22 +540,16 @@ class PaperAdapter:
             # Get all available symbols from MockExchange
             symbols_list = self._make_request("GET", "/tickers")
             if not symbols_list:
-                return {}
+                return None
             # Use all available symbols (no limit to match CCXT behavior)
             symbols_to_fetch = symbols_list
 
         # Fetch tickers for the symbols using comma-separated endpoint
-        symbols_str = ",".join(symbols_to_fetch)
-
-        try:
-            data = self._make_request("GET", f"/tickers/{symbols_str}")
-            result = {}
-            for symbol, ticker_data in data.items():
-                result[symbol] = DataMapper.mockexchange_ticker_to_ccxt(ticker_data)
-            return result
-        except Exception:
-            # If bulk fetch fails, return empty dict
-            return {}
+        chunks = chunk_symbols(symbols_to_fetch, self.max_url_length - len(self.base_url))
+        results = run_batch(
+            lambda chunk: self._make_request("GET", f"/tickers/{','.join(chunk)}"), chunks
+        )
+        return chunks, results
 
     # Balance methods
     def fetch_balance(self, asset: Optional[str] = None) -> Dict[str, Any]:
@@ -207,11 +561,11 @@ class PaperAdapter:
         if asset:
             # Fetch specific asset balance
             data = self._make_request("GET", f"/balance/{asset}")
-            return DataMapper.mockexchange_balance_to_ccxt(data)
+            return self._map("fetch_balance", DataMapper.mockexchange_balance_to_ccxt, data)
         else:
             # Fetch full balance
             data = self._make_request("GET", "/balance")
-            return DataMapper.mockexchange_balance_to_ccxt(data)
+            return self._map("fetch_balance", DataMapper.mockexchange_balance_to_ccxt, data)
 
     def fetch_balance_list(self) -> Dict[str, Any]:
         """Fetch list of assets with balances."""
@@ -259,21 +613,7 @@ class PaperAdapter:
 
         Note: This is MockExchange-specific and not part of standard CCXT.
         """
-        symbol = normalize_symbol(symbol, "paper")
-
-        order_data = {
-            "symbol": symbol,
-            "type": type,
-            "side": side,
-            "amount": amount,
-        }
-
-        if price is not None:
-            order_data["limit_price"] = price
-
-        if params:
-            order_data.update(params)
-
+        order_data = build_order_payload(symbol, type, side, amount, price, params)
         data = self._make_request("POST", "/orders/can_execute", json=order_data)
         return data
 
@@ -288,28 +628,26 @@ class PaperAdapter:
         params: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Create an order."""
-        symbol = normalize_symbol(symbol, "paper")
-
-        order_data = {
-            "symbol": symbol,
-            "type": type,
-            "side": side,
-            "amount": amount,
-        }
-
-        if price is not None:
-            order_data["limit_price"] = price
+        order_data = build_order_payload(symbol, type, side, amount, price, params)
+        data = self._make_request("POST", "/orders", json=order_data)
+        return self._map("create_order", DataMapper.mockexchange_order_to_ccxt, data)
 
-        if params:
-            order_data.update(params)
+    def create_orders(
+        self, orders: List[Dict[str, Any]], max_concurrency: Optional[int] = None
+    ) -> List[BatchResult]:
+        """Create several orders concurrently.
 
-        data = self._make_request("POST", "/orders", json=order_data)
-        return DataMapper.mockexchange_order_to_ccxt(data)
+        MockExchange has no batch endpoint, so each order is its own
+        POST /orders, with at most max_concurrency requests in flight.
+        """
+        return run_batch(
+            lambda spec: self.create_order(*order_spec_args(spec)), orders, max_concurrency
+        )
 
     def fetch_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Fetch a specific order."""
         data = self._make_request("GET", f"/orders/{order_id}")
-        return DataMapper.mockexchange_order_to_ccxt(data)
+        return self._map("fetch_order", self._order_mapper, data)
 
     def fetch_orders(
         self,
@@ -319,21 +657,28 @@ class PaperAdapter:
         params: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """Fetch orders."""
-        query_params = {}
-
-        if symbol:
-            query_params["symbol"] = normalize_symbol(symbol, "paper")
-        if since:
-            query_params["since"] = str(since)
-        if limit:
-            query_params["tail"] = str(limit)  # MockExchange uses 'tail' instead of 'limit'
-        if params:
-            query_params.update(params)
+        query_params = build_orders_query(symbol, since, limit, params)
+
+        data = self._make_request("GET", "/orders", params=query_params)
+        orders = ResponseMapper.ensure_list_response(data)
+
+        return self._map("fetch_orders", lambda: [self._order_mapper(o) for o in orders])
+
+    def fetch_orders_columnar(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+        backend: str = "auto",
+    ) -> Columns:
+        """Fetch orders as columns (see adapters.columnar)."""
+        query_params = build_orders_query(symbol, since, limit, params)
 
         data = self._make_request("GET", "/orders", params=query_params)
         orders = ResponseMapper.ensure_list_response(data)
 
-        return [DataMapper.mockexchange_order_to_ccxt(order) for order in orders]
+        return self._map("fetch_orders", to_columns, orders, ORDER_COLUMNS, backend)
 
     def fetch_open_orders(
         self,
@@ -348,16 +693,7 @@ class PaperAdapter:
         """
         # MockExchange doesn't have a single "open" status, so we need to fetch all orders
         # and filter for open ones
-        query_params = {}
-
-        if symbol:
-            query_params["symbol"] = normalize_symbol(symbol, "paper")
-        if since:
-            query_params["since"] = str(since)
-        if limit:
-            query_params["tail"] = str(limit)  # MockExchange uses 'tail' instead of 'limit'
-        if params:
-            query_params.update(params)
+        query_params = build_orders_query(symbol, since, limit, params)
 
         # Fetch all orders and filter for open ones
         try:
@@ -365,47 +701,80 @@ class PaperAdapter:
             orders = ResponseMapper.ensure_list_response(data)
 
             # Filter for open orders (not in final state)
-            open_statuses = {"new", "partially_filled"}
-            open_orders = []
-
-            for order in orders:
-                order_status = order.get("status", "").lower()
-                if order_status in open_statuses:
-                    open_orders.append(DataMapper.mockexchange_order_to_ccxt(order))
-
-            return open_orders
+            return self._map(
+                "fetch_orders",
+                lambda: [self._order_mapper(order) for order in orders if is_open_order(order)],
+            )
 
         except Exception:
             # Fallback to simpler orders/list endpoint
             data = self._make_request("GET", "/orders/list", params=query_params)
             # This returns a simpler format, we need to fetch full order details
-            if isinstance(data, dict) and "orders" in data:
-                order_ids = data["orders"]
-                orders = []
-                for order_id in order_ids:
-                    try:
-                        order_data = self._make_request("GET", f"/orders/{order_id}")
-                        # Check if this order is open
-                        order_status = order_data.get("status", "").lower()
-                        if order_status in {"new", "partially_filled"}:
-                            orders.append(DataMapper.mockexchange_order_to_ccxt(order_data))
-                    except (requests.RequestException, ValueError, KeyError):
-                        # Skip orders that can't be fetched due to network or data issues
-                        continue
-                return orders
-            return []
+            if not (isinstance(data, dict) and "orders" in data):
+                return []
+
+            order_ids = data["orders"]
+            orders = PartialList()
+            for item in self.iter_orders_by_id(order_ids, raw=True):
+                if not item.ok:
+                    # Report orders that can't be fetched instead of dropping them silently
+                    orders.skipped[order_ids[item.index]] = item.error
+                elif is_open_order(item.result):
+                    orders.append(self._order_mapper(item.result))
+
+            if orders.skipped:
+                logger.warning(
+                    "fetch_open_orders skipped %d of %d orders that could not be fetched",
+                    len(orders.skipped),
+                    len(order_ids),
+                )
+            return orders
+
+    def iter_orders_by_id(
+        self,
+        order_ids: List[str],
+        max_concurrency: Optional[int] = None,
+        raw: bool = False,
+    ) -> Iterator[BatchResult]:
+        """Fetch many orders by id concurrently, yielding each as it arrives.
+
+        MockExchange has no multi-id order endpoint, so this issues one
+        GET /orders/{id} per id with at most max_concurrency in flight.
+        Results are yielded in completion order; ``BatchResult.index`` is the
+        position of the id in order_ids and failed ids carry their error.
+
+        Args:
+            order_ids: Order ids to fetch
+            max_concurrency: Maximum requests in flight (default 8)
+            raw: Yield raw MockExchange payloads instead of CCXT orders
+        """
+
+        def fetch(order_id: str) -> Dict[str, Any]:
+            data = self._make_request("GET", f"/orders/{order_id}")
+            if raw:
+                return data
+            return self._map("fetch_order", self._order_mapper, data)
+
+        return iter_batch(fetch, order_ids, max_concurrency)
 
     def cancel_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Cancel an order."""
         data = self._make_request("POST", f"/orders/{order_id}/cancel")
 
-        # MockExchange returns the canceled order in a nested structure
-        if isinstance(data, dict) and "canceled_order" in data:
-            order_data = data["canceled_order"]
-        else:
-            order_data = data
+        return self._map(
+            "cancel_order", DataMapper.mockexchange_order_to_ccxt, unwrap_canceled_order(data)
+        )
 
-        return DataMapper.mockexchange_order_to_ccxt(order_data)
+    def cancel_orders(
+        self,
+        order_ids: List[str],
+        symbol: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[BatchResult]:
+        """Cancel several orders concurrently (one POST per order)."""
+        return run_batch(
+            lambda order_id: self.cancel_order(order_id, symbol), order_ids, max_concurrency
+        )
 
     def fetch_my_trades(
         self,
@@ -443,7 +812,27 @@ class PaperAdapter:
         require_support("fetch_trades", "paper")
         return []
 
+    def pool_stats(self) -> Dict[str, Any]:
+        """Return HTTP connection pool statistics (see adapters.session.pool_stats)."""
+        stats = pool_stats(self.session)
+        stats["config"] = {
+            "pool_connections": self.pool_config.pool_connections,
+            "pool_maxsize": self.pool_config.pool_maxsize,
+            "pool_block": self.pool_config.pool_block,
+            "keep_alive": self.pool_config.keep_alive,
+            "connect_timeout": self.connect_timeout,
+            "read_timeout": self.read_timeout,
+        }
+        return stats
+
     def close(self) -> None:
         """Close the adapter and clean up resources."""
-        if self.session:
+        if self.share_session:
+            # Release the borrowed pool once; the registry closes it with the last borrower
+            if self._borrowed:
+                get_session_registry().release(self.base_url, self.pool_config)
+                self._borrowed = False
+        elif self.session:
             self.session.close()
+        if self.hedge_policy is not None:
+            self.hedge_policy.close()
@@ -0,0 +1,495 @@
+"""adapters/paper_async.py
+
+Asyncio paper adapter for MockExchange backend.
+
+This adapter mirrors PaperAdapter with coroutines, so that many requests
+can share one event loop and one aiohttp connection pool.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import aiohttp
+
+from ..config.symbols import normalize_symbol
+from ..core.batch import BatchResult, order_spec_args, run_batch_async
+from ..core.calllog import add_phase, current_phases
+from ..core.capabilities import require_support
+from ..core.circuit import CircuitBreakers
+from ..core.deadline import bound_timeout, check_deadline
+from ..core.endpoints import paper_endpoint
+from ..core.errors import ExchangeError, NetworkError, RequestTimeout
+from ..core.hedging import HedgePolicy
+from ..core.ratelimit import RateLimiter
+from ..core.retry import RetryPolicy
+from ..core.stats import GatewayStats, add_io
+from ..core.tracing import SpanFactory, record_status, span
+from .codec import Codec, get_codec
+from .columnar import ORDER_COLUMNS, TICKER_COLUMNS, Columns, to_columns
+from .mapping import DataMapper, LazyOrder, LazyTicker, Mapper, PartialList, ResponseMapper
+from .paper import (
+    DEFAULT_MAX_URL_LENGTH,
+    build_order_payload,
+    build_orders_query,
+    chunk_symbols,
+    error_for_status,
+    is_open_order,
+    markets_from_symbols,
+    merge_ticker_chunks,
+    raw_ticker_chunks,
+    unwrap_canceled_order,
+    unwrap_ticker,
+)
+
+T = TypeVar("T")
+
+
+class AsyncPaperAdapter:
+    """Asyncio adapter for MockExchange backend (paper mode).
+
+    This is the coroutine counterpart of PaperAdapter. It exposes the same
+    methods with the same arguments and return shapes, and it uses the same
+    DataMapper conversions and HTTP error mapping, so strategies can move
+    between the sync and async gateways without touching their data handling.
+
+    All requests go through a single aiohttp ClientSession whose connector
+    caps the number of open connections. The session is created lazily on
+    first use so the adapter can be constructed outside of a running loop.
+
+    aiohttp is already installed as a dependency of ccxt, so no extra
+    package is required.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: float = 10.0,
+        max_connections: int = 100,
+        max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+        codec: Codec = "json",
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        stats: Optional[GatewayStats] = None,
+        lazy_results: bool = False,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_url_length = max_url_length
+        self.codec = get_codec(codec)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.circuit_breakers = circuit_breakers
+        self.hedge_policy = hedge_policy
+        self.stats = stats
+        self.lazy_results = lazy_results
+        self._order_mapper: Mapper = (
+            LazyOrder if lazy_results else DataMapper.mockexchange_order_to_ccxt
+        )
+        self._ticker_mapper: Mapper = (
+            LazyTicker if lazy_results else DataMapper.mockexchange_ticker_to_ccxt
+        )
+        self.tracer: Optional[SpanFactory] = None
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._markets_cache: Dict[str, Any] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared ClientSession, creating it on first use."""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                headers={"x-api-key": self.api_key, "Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+            )
+        return self.session
+
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Make HTTP request to MockExchange.
+
+        Async equivalent of PaperAdapter._make_request. Errors are mapped to
+        the same CCXT-style exceptions.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path (e.g., "/tickers", "/orders")
+            **kwargs: Additional request parameters (json, params, etc.)
+
+        Returns:
+            Any: Parsed JSON response from MockExchange
+
+        Raises:
+            RequestTimeout: If request times out
+            NetworkError: If network connection fails
+            AuthenticationError: If API key is invalid
+            BadRequest: If request is malformed
+            ExchangeError: For other HTTP errors
+        """
+        if self.stats is not None:
+            return await self.stats.measure_async(
+                paper_endpoint(method, endpoint),
+                lambda: self._send_with_breaker(method, endpoint, **kwargs),
+            )
+        return await self._send_with_breaker(method, endpoint, **kwargs)
+
+    async def _send_with_breaker(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Send a request through the circuit breaker, if any."""
+        if self.circuit_breakers is None:
+            return await self._send_with_retry(method, endpoint, **kwargs)
+
+        breaker = self.circuit_breakers.for_endpoint(paper_endpoint(method, endpoint))
+        return await breaker.call_async(lambda: self._send_with_retry(method, endpoint, **kwargs))
+
+    async def _send_with_retry(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Send a request under the retry policy, if any."""
+        if self.retry_policy is None:
+            return await self._send_hedged(method, endpoint, **kwargs)
+
+        # Writes are never resent: MockExchange is not known to reject duplicate
+        # client order ids, so a retried POST /orders could place a second order
+        idempotent = method.upper() == "GET"
+        return await self.retry_policy.call_async(
+            lambda: self._send_hedged(method, endpoint, **kwargs), idempotent
+        )
+
+    async def _send_hedged(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Send a request, hedging it if it is a read covered by the hedge policy."""
+        if self.hedge_policy is not None and method.upper() == "GET":
+            name = paper_endpoint(method, endpoint)
+            if self.hedge_policy.applies_to(name):
+                return await self.hedge_policy.call_async(
+                    name, lambda: self._send_request(method, endpoint, **kwargs)
+                )
+        return await self._send_request(method, endpoint, **kwargs)
+
+    async def _send_request(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Send one HTTP request to MockExchange, inside a span when tracing."""
+        if self.tracer is None:
+            return await self._send_http(method, endpoint, **kwargs)
+
+        name = paper_endpoint(method, endpoint)
+        attributes = {"endpoint": name, "http.method": method, "http.route": endpoint}
+        with span(self.tracer, f"mockexchange.{name}", attributes):
+            return await self._send_http(method, endpoint, **kwargs)
+
+    async def _send_http(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Send one HTTP request to MockExchange and decode the response."""
+        url = f"{self.base_url}{endpoint}"
+        check_deadline(f"{method} {endpoint}")
+        if "json" in kwargs:
+            kwargs["data"] = self.codec.dumps(kwargs.pop("json"))
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.reserve(paper_endpoint(method, endpoint))
+            if wait > 0:
+                add_phase("rate_limit", wait)
+                await asyncio.sleep(wait)
+        if check_deadline(f"{method} {endpoint}") is not None:
+            # Cap the whole request at the time left in the deadline
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=bound_timeout(self.timeout))
+
+        started = time.perf_counter()
+        try:
+            async with self._get_session().request(method, url, **kwargs) as response:
+                status = response.status
+                body = await response.read()
+        except asyncio.TimeoutError:
+            raise RequestTimeout(f"Request timeout: {url}")
+        except aiohttp.ClientConnectionError:
+            raise NetworkError(f"Connection error: {url}")
+        except aiohttp.ClientError as e:
+            raise NetworkError(f"Network error: {str(e)}")
+        finally:
+            add_phase("server", time.perf_counter() - started)
+
+        add_io(len(kwargs.get("data") or b""), len(body))
+        record_status(status)
+
+        # Handle HTTP errors
+        if status >= 400:
+            self._handle_http_error(status, body)
+
+        started = time.perf_counter()
+        try:
+            return self.codec.loads(body)
+        except ValueError as e:
+            raise ExchangeError(f"Invalid JSON response: {str(e)}")
+        finally:
+            add_phase("decode", time.perf_counter() - started)
+
+    def _map(self, endpoint: str, func: Callable[..., T], *args: Any) -> T:
+        """Run a response mapping step, timing and tracing it when enabled."""
+        if self.tracer is None and self.stats is None and current_phases() is None:
+            return func(*args)
+        started = time.perf_counter()
+        try:
+            if self.tracer is None:
+                return func(*args)
+            with span(self.tracer, f"map.{endpoint}", {"endpoint": endpoint}):
+                return func(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            add_phase("map", elapsed)
+            if self.stats is not None:
+                self.stats.record_mapping(endpoint, elapsed)
+
+    def _handle_http_error(self, status_code: int, body: bytes) -> None:
+        """Handle HTTP error responses."""
+        text = body.decode("utf-8", errors="replace")
+        try:
+            error_data = self.codec.loads(text)
+            message = error_data.get("message", error_data.get("error", "Unknown error"))
+        except (ValueError, AttributeError):
+            message = text or f"HTTP {status_code}"
+
+        raise error_for_status(status_code, message)
+
+    # Market data methods
+    async def load_markets(self, reload: bool = False) -> Dict[str, Any]:
+        """Load markets from MockExchange."""
+        if not reload and self._markets_cache:
+            return self._markets_cache
+
+        data = await self._make_request("GET", "/tickers")
+        self._markets_cache = markets_from_symbols(data)
+        return self._markets_cache
+
+    async def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
+        """Fetch ticker for a symbol."""
+        symbol = normalize_symbol(symbol, "paper")
+        data = await self._make_request("GET", f"/tickers/{symbol}")
+        return self._map("fetch_ticker", self._ticker_mapper, unwrap_ticker(data, symbol))
+
+    async def fetch_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Fetch tickers for multiple symbols."""
+        fetched = await self._fetch_ticker_chunks(symbols)
+        if fetched is None:
+            return {}
+        chunks, results = fetched
+        return self._map("fetch_tickers", merge_ticker_chunks, chunks, results, self._ticker_mapper)
+
+    async def fetch_tickers_columnar(
+        self, symbols: Optional[List[str]] = None, backend: str = "auto"
+    ) -> Columns:
+        """Fetch tickers as columns (see adapters.columnar); failed chunks are skipped."""
+        fetched = await self._fetch_ticker_chunks(symbols)
+        if fetched is None:
+            return to_columns([], TICKER_COLUMNS, backend)
+        tickers, skipped = raw_ticker_chunks(*fetched)
+        return self._map("fetch_tickers", to_columns, tickers, TICKER_COLUMNS, backend, skipped)
+
+    async def _fetch_ticker_chunks(
+        self, symbols: Optional[List[str]]
+    ) -> Optional[Tuple[List[List[str]], List[BatchResult]]]:
+        """Fetch raw tickers in URL-sized chunks; None if there are no symbols."""
+        if symbols:
+            symbols_to_fetch = [normalize_symbol(s, "paper") for s in symbols]
+        else:
+            symbols_to_fetch = await self._make_request("GET", "/tickers")
+            if not symbols_to_fetch:
+                return None
+
+        # Chunk by URL length and fetch the chunks concurrently
+        chunks = chunk_symbols(symbols_to_fetch, self.max_url_length - len(self.base_url))
+        results = await run_batch_async(
+            lambda chunk: self._make_request("GET", f"/tickers/{','.join(chunk)}"), chunks
+        )
+        return chunks, results
+
+    # Balance methods
+    async def fetch_balance(self, asset: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch account balance.
+
+        Args:
+            asset: Optional specific asset to fetch balance for
+        """
+        endpoint = f"/balance/{asset}" if asset else "/balance"
+        data = await self._make_request("GET", endpoint)
+        return self._map("fetch_balance", DataMapper.mockexchange_balance_to_ccxt, data)
+
+    async def fetch_balance_list(self) -> Dict[str, Any]:
+        """Fetch list of assets with balances."""
+        return await self._make_request("GET", "/balance/list")
+
+    async def deposit(
+        self, asset: str, amount: float, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Deposit asset to account (MockExchange-specific)."""
+        deposit_data = {"amount": amount, **(params or {})}
+        return await self._make_request("POST", f"/balance/{asset}/deposit", json=deposit_data)
+
+    async def withdraw(
+        self, asset: str, amount: float, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Withdraw asset from account (MockExchange-specific)."""
+        withdraw_data = {"amount": amount, **(params or {})}
+        return await self._make_request("POST", f"/balance/{asset}/withdrawal", json=withdraw_data)
+
+    async def can_execute_order(
+        self,
+        symbol: str,
+        type: str,
+        side: str,
+        amount: float,
+        price: Optional[float] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Check if an order can be executed (MockExchange-specific dry run)."""
+        order_data = build_order_payload(symbol, type, side, amount, price, params)
+        return await self._make_request("POST", "/orders/can_execute", json=order_data)
+
+    # Order methods
+    async def create_order(
+        self,
+        symbol: str,
+        type: str,
+        side: str,
+        amount: float,
+        price: Optional[float] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Create an order."""
+        order_data = build_order_payload(symbol, type, side, amount, price, params)
+        data = await self._make_request("POST", "/orders", json=order_data)
+        return self._map("create_order", DataMapper.mockexchange_order_to_ccxt, data)
+
+    async def create_orders(
+        self, orders: List[Dict[str, Any]], max_concurrency: Optional[int] = None
+    ) -> List[BatchResult]:
+        """Create several orders concurrently (one POST /orders each)."""
+        return await run_batch_async(
+            lambda spec: self.create_order(*order_spec_args(spec)), orders, max_concurrency
+        )
+
+    async def fetch_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch a specific order."""
+        data = await self._make_request("GET", f"/orders/{order_id}")
+        return self._map("fetch_order", self._order_mapper, data)
+
+    async def fetch_orders(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch orders."""
+        query_params = build_orders_query(symbol, since, limit, params)
+        data = await self._make_request("GET", "/orders", params=query_params)
+        orders = ResponseMapper.ensure_list_response(data)
+        return self._map("fetch_orders", lambda: [self._order_mapper(o) for o in orders])
+
+    async def fetch_orders_columnar(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+        backend: str = "auto",
+    ) -> Columns:
+        """Fetch orders as columns (see adapters.columnar)."""
+        query_params = build_orders_query(symbol, since, limit, params)
+        data = await self._make_request("GET", "/orders", params=query_params)
+        orders = ResponseMapper.ensure_list_response(data)
+        return self._map("fetch_orders", to_columns, orders, ORDER_COLUMNS, backend)
+
+    async def fetch_open_orders(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch open orders.
+
+        In MockExchange, open orders are those with status: 'new', 'partially_filled'
+        """
+        query_params = build_orders_query(symbol, since, limit, params)
+
+        try:
+            data = await self._make_request("GET", "/orders", params=query_params)
+            orders = ResponseMapper.ensure_list_response(data)
+            return self._map(
+                "fetch_orders",
+                lambda: [self._order_mapper(order) for order in orders if is_open_order(order)],
+            )
+
+        except Exception:
+            # Fallback to simpler orders/list endpoint, fetching details concurrently
+            data = await self._make_request("GET", "/orders/list", params=query_params)
+            if not (isinstance(data, dict) and "orders" in data):
+                return []
+
+            order_ids = data["orders"]
+            results = await run_batch_async(
+                lambda oid: self._make_request("GET", f"/orders/{oid}"), order_ids
+            )
+            orders = PartialList()
+            for item in results:
+                if not item.ok:
+                    orders.skipped[order_ids[item.index]] = item.error
+                elif is_open_order(item.result):
+                    orders.append(self._order_mapper(item.result))
+            return orders
+
+    async def cancel_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
+        """Cancel an order."""
+        data = await self._make_request("POST", f"/orders/{order_id}/cancel")
+        return self._map(
+            "cancel_order", DataMapper.mockexchange_order_to_ccxt, unwrap_canceled_order(data)
+        )
+
+    async def cancel_orders(
+        self,
+        order_ids: List[str],
+        symbol: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[BatchResult]:
+        """Cancel several orders concurrently (one POST per order)."""
+        return await run_batch_async(
+            lambda order_id: self.cancel_order(order_id, symbol), order_ids, max_concurrency
+        )
+
+    async def fetch_my_trades(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch user's trade history."""
+        # MockExchange doesn't have a trades endpoint yet
+        return []
+
+    # Unsupported methods (will raise NotSupported)
+    async def fetch_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str = "1m",
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch OHLCV data (not supported in paper mode)."""
+        require_support("fetch_ohlcv", "paper")
+        return []
+
+    async def fetch_order_book(self, symbol: str, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Fetch order book (not supported in paper mode)."""
+        require_support("fetch_order_book", "paper")
+        return {}
+
+    async def fetch_trades(
+        self, symbol: str, since: Optional[int] = None, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch public trades (not supported in paper mode)."""
+        require_support("fetch_trades", "paper")
+        return []
+
+    async def close(self) -> None:
+        """Close the adapter and clean up resources."""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
@@ -7,12 +7,86 @@ ensuring consistent interface with the paper adapter.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 import ccxt
+import requests
 
 from ..config.symbols import normalize_symbol
+from ..core.batch import BatchResult, order_spec_args, run_batch, spread_batch_results
+from ..core.calllog import add_phase
+from ..core.circuit import CircuitBreakers
+from ..core.deadline import check_deadline
 from ..core.errors import ExchangeError
+from ..core.hedging import HedgePolicy
+from ..core.ratelimit import RateLimiter
+from ..core.retry import RetryPolicy, idempotency_key
+from ..core.singleflight import SingleFlight, make_key
+from ..core.stats import GatewayStats, io_hook
+from ..core.tracing import SpanFactory, span, status_hook
+from .columnar import CCXT_ORDER_COLUMNS, CCXT_TICKER_COLUMNS, Columns, to_columns
+from .session import mount_deadline_adapter
+
+# ccxt methods that only read state and are safe to coalesce
+READ_METHODS = frozenset(
+    {
+        "load_markets",
+        "fetch_ticker",
+        "fetch_tickers",
+        "fetch_ohlcv",
+        "fetch_order_book",
+        "fetch_trades",
+        "fetch_balance",
+        "fetch_positions",
+        "fetch_order",
+        "fetch_orders",
+        "fetch_open_orders",
+        "fetch_my_trades",
+        "fetch_leverage",
+        "fetch_funding_rate",
+        "fetch_funding_history",
+    }
+)
+
+
+def native_order_batch(
+    orders: List[Dict[str, Any]],
+) -> Tuple[List[BatchResult], List[Dict[str, Any]], List[int]]:
+    """Build a ccxt createOrders batch from order specs.
+
+    Returns the results list (with errors already set for invalid specs),
+    the orders to send and the position of each sent order in the input.
+    """
+    results: List[BatchResult] = [BatchResult(i) for i in range(len(orders))]
+    batch, positions = [], []
+    for i, spec in enumerate(orders):
+        try:
+            symbol, type, side, amount, price, params = order_spec_args(spec)
+        except Exception as e:
+            results[i].error = e
+            continue
+        positions.append(i)
+        batch.append(
+            {
+                "symbol": normalize_symbol(symbol, "prod"),
+                "type": type,
+                "side": side,
+                "amount": amount,
+                "price": price,
+                "params": params or {},
+            }
+        )
+    return results, batch, positions
+
+
+def merge_batch_results(
+    results: List[BatchResult], positions: List[int], native: List[BatchResult]
+) -> None:
+    """Copy the outcome of each sent order back to its input position."""
+    for position, item in zip(positions, native):
+        results[position].result = item.result
+        results[position].error = item.error
 
 
 class ProdAdapter:
@@ -39,11 +113,35 @@ class ProdAdapter:
     4. **Error Propagation**: Passes through CCXT errors appropriately
     """
 
-    def __init__(self, exchange_id: str, config: Dict[str, Any]):
+    def __init__(
+        self,
+        exchange_id: str,
+        config: Dict[str, Any],
+        coalesce_reads: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        stats: Optional[GatewayStats] = None,
+    ):
         self.exchange_id = exchange_id
         self.config = config
+        # Client-side budget shared by every gateway for this account
+        self.rate_limiter = rate_limiter
+        # Transient failures are retried when set; writes only with a client order id
+        self.retry_policy = retry_policy
+        # Fail fast per endpoint class while the exchange is down
+        self.circuit_breakers = circuit_breakers
+        # Slow reads get a backup call when set
+        self.hedge_policy = hedge_policy
+        # Per-endpoint counters and latency histograms when set
+        self.stats = stats
+        # Span factory set through MockXGateway.set_tracer
+        self.tracer: Optional[SpanFactory] = None
         self._exchange = None
         self._markets_cache: Dict[str, Any] = {}
+        # Identical concurrent reads share one ccxt call when enabled
+        self._flight: Optional[SingleFlight] = SingleFlight() if coalesce_reads else None
         self._initialize_exchange()
 
     def _initialize_exchange(self) -> None:
@@ -51,6 +149,11 @@ class ProdAdapter:
         try:
             exchange_class = getattr(ccxt, self.exchange_id)
             self._exchange = exchange_class(self.config)
+            # Let gateway deadlines shrink ccxt's socket timeouts; count bytes and
+            # status codes for stats and tracing
+            if isinstance(getattr(self._exchange, "session", None), requests.Session):
+                mount_deadline_adapter(self._exchange.session)
+                self._exchange.session.hooks["response"].extend([io_hook, status_hook])
 
             # Enable sandbox mode if requested (before loading markets)
             if self.config.get("sandbox", False) and self._exchange is not None:
@@ -82,26 +185,91 @@ class ProdAdapter:
             raise RuntimeError("Failed to initialize exchange")
         return self._exchange
 
+    def _call(self, method: str, *args: Any) -> Any:
+        """Invoke a ccxt exchange method.
+
+        Every delegation to the exchange goes through here so that
+        cross-cutting behavior is applied in one place. Read methods
+        (``fetch_*`` and ``load_markets``) are coalesced when enabled;
+        writes always run on their own. With a rate limiter every call that
+        reaches the exchange first waits for its budget. With a retry policy
+        ccxt network errors are retried for reads and for writes whose
+        params carry a client order id. With circuit breakers a call fails
+        fast with ExchangeNotAvailable while its endpoint class is open.
+        With a hedge policy slow reads get a duplicate call. Inside a
+        deadline no attempt is started once the budget is spent. With stats
+        every call is timed by method name; ccxt parses responses inside
+        the call, so prod stats carry network time only. With a tracer
+        every attempt runs inside a ``ccxt.<method>`` span.
+        """
+        func = getattr(self.exchange, method)
+
+        def send() -> Any:
+            check_deadline(method)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(method)
+            started = time.perf_counter()
+            try:
+                if self.tracer is None:
+                    return func(*args)
+                with span(self.tracer, f"ccxt.{method}", {"endpoint": method}):
+                    return func(*args)
+            finally:
+                add_phase("server", time.perf_counter() - started)
+
+        def invoke() -> Any:
+            hedge = self.hedge_policy
+            if hedge is not None and method in READ_METHODS and hedge.applies_to(method):
+                return hedge.call(method, send)
+            return send()
+
+        def retried() -> Any:
+            if self.retry_policy is None:
+                return invoke()
+            idempotent = method in READ_METHODS or idempotency_key(args[-1] if args else None)
+            return self.retry_policy.call(invoke, bool(idempotent), retry_on=(ccxt.NetworkError,))
+
+        def attempt() -> Any:
+            if self.circuit_breakers is None:
+                return retried()
+            breaker = self.circuit_breakers.for_endpoint(method)
+            return breaker.call(retried, failure_on=(ccxt.NetworkError,))
+
+        def run() -> Any:
+            if self._flight is not None and method in READ_METHODS:
+                return self._flight.do(make_key(method, *args), attempt)
+            return attempt()
+
+        if self.stats is not None:
+            return self.stats.measure(method, run)
+        return run()
+
     # Market data methods
     def load_markets(self, reload: bool = False) -> Dict[str, Any]:
         """Load markets from CCXT."""
         if reload or not self._markets_cache:
-            self._markets_cache = self.exchange.load_markets()
+            self._markets_cache = self._call("load_markets")
 
         return self._markets_cache
 
     def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
         """Fetch ticker for a symbol."""
         symbol = normalize_symbol(symbol, "prod")
-        return self.exchange.fetch_ticker(symbol)
+        return self._call("fetch_ticker", symbol)
 
     def fetch_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Any]:
         """Fetch tickers for multiple symbols."""
         if symbols:
             symbols = [normalize_symbol(s, "prod") for s in symbols]
-            return self.exchange.fetch_tickers(symbols)
+            return self._call("fetch_tickers", symbols)
         else:
-            return self.exchange.fetch_tickers()
+            return self._call("fetch_tickers")
+
+    def fetch_tickers_columnar(
+        self, symbols: Optional[List[str]] = None, backend: str = "auto"
+    ) -> Columns:
+        """Fetch tickers as columns (see adapters.columnar)."""
+        return to_columns(self.fetch_tickers(symbols).values(), CCXT_TICKER_COLUMNS, backend)
 
     def fetch_ohlcv(
         self,
@@ -112,19 +280,19 @@ class ProdAdapter:
     ) -> List[Dict[str, Any]]:
         """Fetch OHLCV data."""
         symbol = normalize_symbol(symbol, "prod")
-        return self.exchange.fetch_ohlcv(symbol, timeframe, since, limit)
+        return self._call("fetch_ohlcv", symbol, timeframe, since, limit)
 
     def fetch_order_book(self, symbol: str, limit: Optional[int] = None) -> Dict[str, Any]:
         """Fetch order book."""
         symbol = normalize_symbol(symbol, "prod")
-        return self.exchange.fetch_order_book(symbol, limit)
+        return self._call("fetch_order_book", symbol, limit)
 
     def fetch_trades(
         self, symbol: str, since: Optional[int] = None, limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Fetch public trades."""
         symbol = normalize_symbol(symbol, "prod")
-        return self.exchange.fetch_trades(symbol, since, limit)
+        return self._call("fetch_trades", symbol, since, limit)
 
     # Balance methods
     def fetch_balance(self, asset: Optional[str] = None) -> Dict[str, Any]:
@@ -135,11 +303,11 @@ class ProdAdapter:
         """
         # In production mode, we ignore the asset parameter and fetch full balance
         # CCXT doesn't support fetching single asset balance in the same way
-        return self.exchange.fetch_balance()
+        return self._call("fetch_balance")
 
     def fetch_positions(self, symbols: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Fetch open positions."""
-        return self.exchange.fetch_positions(symbols)
+        return self._call("fetch_positions", symbols)
 
     # Order methods
     def create_order(
@@ -153,13 +321,34 @@ class ProdAdapter:
     ) -> Dict[str, Any]:
         """Create an order."""
         symbol = normalize_symbol(symbol, "prod")
-        return self.exchange.create_order(symbol, type, side, amount, price, params or {})
+        return self._call("create_order", symbol, type, side, amount, price, params or {})
+
+    def create_orders(
+        self, orders: List[Dict[str, Any]], max_concurrency: Optional[int] = None
+    ) -> List[BatchResult]:
+        """Create several orders.
+
+        Uses the exchange's native batch endpoint (ccxt ``createOrders``) when
+        available, otherwise places the orders concurrently one by one.
+        """
+        if not orders or not self.exchange.has.get("createOrders"):
+            return run_batch(
+                lambda spec: self.create_order(*order_spec_args(spec)), orders, max_concurrency
+            )
+
+        results, batch, positions = native_order_batch(orders)
+        if batch:
+            native = self._native_batch_results(
+                len(batch), lambda: self._call("create_orders", batch)
+            )
+            merge_batch_results(results, positions, native)
+        return results
 
     def fetch_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Fetch a specific order."""
         if symbol:
             symbol = normalize_symbol(symbol, "prod")
-        return self.exchange.fetch_order(order_id, symbol)
+        return self._call("fetch_order", order_id, symbol)
 
     def fetch_orders(
         self,
@@ -171,7 +360,19 @@ class ProdAdapter:
         """Fetch orders."""
         if symbol:
             symbol = normalize_symbol(symbol, "prod")
-        return self.exchange.fetch_orders(symbol, since, limit, params or {})
+        return self._call("fetch_orders", symbol, since, limit, params or {})
+
+    def fetch_orders_columnar(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+        backend: str = "auto",
+    ) -> Columns:
+        """Fetch orders as columns (see adapters.columnar)."""
+        orders = self.fetch_orders(symbol, since, limit, params)
+        return to_columns(orders, CCXT_ORDER_COLUMNS, backend)
 
     def fetch_open_orders(
         self,
@@ -183,13 +384,45 @@ class ProdAdapter:
         """Fetch open orders."""
         if symbol:
             symbol = normalize_symbol(symbol, "prod")
-        return self.exchange.fetch_open_orders(symbol, since, limit, params or {})
+        return self._call("fetch_open_orders", symbol, since, limit, params or {})
 
     def cancel_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Cancel an order."""
         if symbol:
             symbol = normalize_symbol(symbol, "prod")
-        return self.exchange.cancel_order(order_id, symbol)
+        return self._call("cancel_order", order_id, symbol)
+
+    def cancel_orders(
+        self,
+        order_ids: List[str],
+        symbol: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[BatchResult]:
+        """Cancel several orders.
+
+        Uses the exchange's native batch endpoint (ccxt ``cancelOrders``) when
+        available and a symbol is given, otherwise cancels concurrently.
+        """
+        if symbol:
+            symbol = normalize_symbol(symbol, "prod")
+        if not order_ids or not symbol or not self.exchange.has.get("cancelOrders"):
+            return run_batch(
+                lambda order_id: self.cancel_order(order_id, symbol), order_ids, max_concurrency
+            )
+        return self._native_batch_results(
+            len(order_ids), lambda: self._call("cancel_orders", order_ids, symbol)
+        )
+
+    @staticmethod
+    def _native_batch_results(count: int, call) -> List[BatchResult]:
+        """Run a native ccxt batch call and spread its outcome over count items."""
+        try:
+            results = call()
+        except Exception as e:
+            # The whole request failed, so every item in it failed
+            return [BatchResult(i, error=e) for i in range(count)]
+
+        return spread_batch_results(count, results)
 
     def fetch_my_trades(
         self,
@@ -201,30 +434,30 @@ class ProdAdapter:
         """Fetch user's trade history."""
         if symbol:
             symbol = normalize_symbol(symbol, "prod")
-        return self.exchange.fetch_my_trades(symbol, since, limit, params or {})
+        return self._call("fetch_my_trades", symbol, since, limit, params or {})
 
     # Advanced features
     def fetch_leverage(self, symbol: str) -> Dict[str, Any]:
         """Fetch current leverage."""
         symbol = normalize_symbol(symbol, "prod")
-        return self.exchange.fetch_leverage(symbol)
+        return self._call("fetch_leverage", symbol)
 
     def set_leverage(self, leverage: int, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Set leverage."""
         if symbol:
             symbol = normalize_symbol(symbol, "prod")
-        return self.exchange.set_leverage(leverage, symbol)
+        return self._call("set_leverage", leverage, symbol)
 
     def fetch_funding_rate(self, symbol: str) -> Dict[str, Any]:
         """Fetch funding rate."""
         symbol = normalize_symbol(symbol, "prod")
-        return self.exchange.fetch_funding_rate(symbol)
+        return self._call("fetch_funding_rate", symbol)
 
     def fetch_funding_history(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
         """Fetch funding history."""
         if symbol:
             symbol = normalize_symbol(symbol, "prod")
-        return self.exchange.fetch_funding_history(symbol)
+        return self._call("fetch_funding_history", symbol)
 
     # Properties that CCXT users expect
     @property
@@ -246,3 +479,5 @@ class ProdAdapter:
         """Close the adapter and clean up resources."""
         if self._exchange:
             self._exchange.close()
+        if self.hedge_policy is not None:
+            self.hedge_policy.close()
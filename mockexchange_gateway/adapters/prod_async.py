@@ -0,0 +1,378 @@
+"""adapters/prod_async.py
+
+Asyncio production adapter for CCXT backend.
+
+This adapter provides a thin pass-through to ccxt.async_support exchange
+instances, ensuring consistent interface with the async paper adapter.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Dict, List, Optional
+
+import ccxt.async_support as ccxt_async
+
+from ..config.symbols import normalize_symbol
+from ..core.batch import BatchResult, order_spec_args, run_batch_async, spread_batch_results
+from ..core.calllog import add_phase
+from ..core.circuit import CircuitBreakers
+from ..core.deadline import check_deadline
+from ..core.errors import ExchangeError, RequestTimeout
+from ..core.hedging import HedgePolicy
+from ..core.ratelimit import RateLimiter
+from ..core.retry import RetryPolicy, idempotency_key
+from ..core.stats import GatewayStats
+from ..core.tracing import SpanFactory, span
+from .columnar import CCXT_ORDER_COLUMNS, CCXT_TICKER_COLUMNS, Columns, to_columns
+from .prod import READ_METHODS, merge_batch_results, native_order_batch
+
+
+class AsyncProdAdapter:
+    """Asyncio adapter for CCXT backend (production mode).
+
+    This is the coroutine counterpart of ProdAdapter. It wraps the exchange
+    classes from ``ccxt.async_support`` so that market data and order calls
+    do not block the event loop, letting strategies fan out across symbols
+    and exchanges without a thread per request.
+
+    Symbol normalization is identical to ProdAdapter. Unlike the sync
+    adapter, markets are not loaded in the constructor (there is no running
+    loop yet); ccxt loads them on first use, or call load_markets() up front.
+    """
+
+    def __init__(
+        self,
+        exchange_id: str,
+        config: Dict[str, Any],
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        stats: Optional[GatewayStats] = None,
+    ):
+        self.exchange_id = exchange_id
+        self.config = config
+        # Client-side budget shared by every gateway (sync or async) for this account
+        self.rate_limiter = rate_limiter
+        # Transient failures are retried when set; writes only with a client order id
+        self.retry_policy = retry_policy
+        # Fail fast per endpoint class while the exchange is down
+        self.circuit_breakers = circuit_breakers
+        # Slow reads get a backup call when set
+        self.hedge_policy = hedge_policy
+        # Per-endpoint counters and latency histograms when set
+        self.stats = stats
+        # Span factory set through AsyncMockXGateway.set_tracer
+        self.tracer: Optional[SpanFactory] = None
+        self._exchange = None
+        self._markets_cache: Dict[str, Any] = {}
+        self._initialize_exchange()
+
+    def _initialize_exchange(self) -> None:
+        """Initialize the async CCXT exchange instance."""
+        try:
+            exchange_class = getattr(ccxt_async, self.exchange_id)
+            self._exchange = exchange_class(self.config)
+
+            # Enable sandbox mode if requested (before loading markets)
+            if self.config.get("sandbox", False) and self._exchange is not None:
+                try:
+                    self._exchange.setSandboxMode(True)
+                except AttributeError:
+                    # Some exchanges or older ccxt versions may not support sandbox mode
+                    pass
+
+        except AttributeError:
+            raise ExchangeError(f"Exchange '{self.exchange_id}' not found in CCXT")
+        except Exception as e:
+            raise ExchangeError(f"Failed to initialize {self.exchange_id}: {str(e)}")
+
+    @property
+    def exchange(self):
+        """Get the underlying async CCXT exchange instance."""
+        if self._exchange is None:
+            self._initialize_exchange()
+        if self._exchange is None:  # Type guard
+            raise RuntimeError("Failed to initialize exchange")
+        return self._exchange
+
+    async def _call(self, method: str, *args: Any) -> Any:
+        """Invoke an async ccxt exchange method.
+
+        The coroutine counterpart of ProdAdapter._call, with the same rate
+        limiting, retries, circuit breaking, hedging, stats and tracing;
+        rate-limit waits and retry backoffs sleep without blocking the loop.
+        Inside a deadline no attempt is started once the budget is spent,
+        and an attempt still running when it ends fails with RequestTimeout.
+        """
+        func = getattr(self.exchange, method)
+
+        async def send() -> Any:
+            check_deadline(method)
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve(method)
+                if wait > 0:
+                    add_phase("rate_limit", wait)
+                    await asyncio.sleep(wait)
+            left = check_deadline(method)
+            started = time.perf_counter()
+            try:
+                if self.tracer is None:
+                    return await self._bounded(method, func(*args), left)
+                with span(self.tracer, f"ccxt.{method}", {"endpoint": method}):
+                    return await self._bounded(method, func(*args), left)
+            finally:
+                add_phase("server", time.perf_counter() - started)
+
+        async def invoke() -> Any:
+            hedge = self.hedge_policy
+            if hedge is not None and method in READ_METHODS and hedge.applies_to(method):
+                return await hedge.call_async(method, send)
+            return await send()
+
+        async def retried() -> Any:
+            if self.retry_policy is None:
+                return await invoke()
+            idempotent = method in READ_METHODS or idempotency_key(args[-1] if args else None)
+            return await self.retry_policy.call_async(
+                invoke, bool(idempotent), retry_on=(ccxt_async.NetworkError,)
+            )
+
+        async def attempt() -> Any:
+            if self.circuit_breakers is None:
+                return await retried()
+            breaker = self.circuit_breakers.for_endpoint(method)
+            return await breaker.call_async(retried, failure_on=(ccxt_async.NetworkError,))
+
+        if self.stats is not None:
+            return await self.stats.measure_async(method, attempt)
+        return await attempt()
+
+    @staticmethod
+    async def _bounded(method: str, call: Awaitable[Any], left: Optional[float]) -> Any:
+        """Await a ccxt call, failing with RequestTimeout after left seconds."""
+        if left is None:
+            return await call
+        try:
+            return await asyncio.wait_for(call, left)
+        except asyncio.TimeoutError:
+            raise RequestTimeout(f"Deadline exceeded during {method}")
+
+    # Market data methods
+    async def load_markets(self, reload: bool = False) -> Dict[str, Any]:
+        """Load markets from CCXT."""
+        if reload or not self._markets_cache:
+            self._markets_cache = await self._call("load_markets", reload)
+
+        return self._markets_cache
+
+    async def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
+        """Fetch ticker for a symbol."""
+        symbol = normalize_symbol(symbol, "prod")
+        return await self._call("fetch_ticker", symbol)
+
+    async def fetch_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Fetch tickers for multiple symbols."""
+        if symbols:
+            symbols = [normalize_symbol(s, "prod") for s in symbols]
+            return await self._call("fetch_tickers", symbols)
+        else:
+            return await self._call("fetch_tickers")
+
+    async def fetch_tickers_columnar(
+        self, symbols: Optional[List[str]] = None, backend: str = "auto"
+    ) -> Columns:
+        """Fetch tickers as columns (see adapters.columnar)."""
+        tickers = await self.fetch_tickers(symbols)
+        return to_columns(tickers.values(), CCXT_TICKER_COLUMNS, backend)
+
+    async def fetch_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str = "1m",
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch OHLCV data."""
+        symbol = normalize_symbol(symbol, "prod")
+        return await self._call("fetch_ohlcv", symbol, timeframe, since, limit)
+
+    async def fetch_order_book(self, symbol: str, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Fetch order book."""
+        symbol = normalize_symbol(symbol, "prod")
+        return await self._call("fetch_order_book", symbol, limit)
+
+    async def fetch_trades(
+        self, symbol: str, since: Optional[int] = None, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch public trades."""
+        symbol = normalize_symbol(symbol, "prod")
+        return await self._call("fetch_trades", symbol, since, limit)
+
+    # Balance methods
+    async def fetch_balance(self, asset: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch account balance (asset is ignored in production mode)."""
+        return await self._call("fetch_balance")
+
+    async def fetch_positions(self, symbols: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Fetch open positions."""
+        return await self._call("fetch_positions", symbols)
+
+    # Order methods
+    async def create_order(
+        self,
+        symbol: str,
+        type: str,
+        side: str,
+        amount: float,
+        price: Optional[float] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Create an order."""
+        symbol = normalize_symbol(symbol, "prod")
+        return await self._call("create_order", symbol, type, side, amount, price, params or {})
+
+    async def create_orders(
+        self, orders: List[Dict[str, Any]], max_concurrency: Optional[int] = None
+    ) -> List[BatchResult]:
+        """Create several orders (see ProdAdapter.create_orders)."""
+        if not orders or not self.exchange.has.get("createOrders"):
+            return await run_batch_async(
+                lambda spec: self.create_order(*order_spec_args(spec)), orders, max_concurrency
+            )
+
+        results, batch, positions = native_order_batch(orders)
+        if batch:
+            native = await self._native_batch_results(
+                len(batch), self._call("create_orders", batch)
+            )
+            merge_batch_results(results, positions, native)
+        return results
+
+    async def fetch_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch a specific order."""
+        if symbol:
+            symbol = normalize_symbol(symbol, "prod")
+        return await self._call("fetch_order", order_id, symbol)
+
+    async def fetch_orders(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch orders."""
+        if symbol:
+            symbol = normalize_symbol(symbol, "prod")
+        return await self._call("fetch_orders", symbol, since, limit, params or {})
+
+    async def fetch_orders_columnar(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+        backend: str = "auto",
+    ) -> Columns:
+        """Fetch orders as columns (see adapters.columnar)."""
+        orders = await self.fetch_orders(symbol, since, limit, params)
+        return to_columns(orders, CCXT_ORDER_COLUMNS, backend)
+
+    async def fetch_open_orders(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch open orders."""
+        if symbol:
+            symbol = normalize_symbol(symbol, "prod")
+        return await self._call("fetch_open_orders", symbol, since, limit, params or {})
+
+    async def cancel_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
+        """Cancel an order."""
+        if symbol:
+            symbol = normalize_symbol(symbol, "prod")
+        return await self._call("cancel_order", order_id, symbol)
+
+    async def cancel_orders(
+        self,
+        order_ids: List[str],
+        symbol: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[BatchResult]:
+        """Cancel several orders (see ProdAdapter.cancel_orders)."""
+        if symbol:
+            symbol = normalize_symbol(symbol, "prod")
+        if not order_ids or not symbol or not self.exchange.has.get("cancelOrders"):
+            return await run_batch_async(
+                lambda order_id: self.cancel_order(order_id, symbol), order_ids, max_concurrency
+            )
+        return await self._native_batch_results(
+            len(order_ids), self._call("cancel_orders", order_ids, symbol)
+        )
+
+    @staticmethod
+    async def _native_batch_results(count: int, call: Awaitable[Any]) -> List[BatchResult]:
+        """Await a native ccxt batch call and spread its outcome over count items."""
+        try:
+            results = await call
+        except Exception as e:
+            # The whole request failed, so every item in it failed
+            return [BatchResult(i, error=e) for i in range(count)]
+        return spread_batch_results(count, results)
+
+    async def fetch_my_trades(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch user's trade history."""
+        if symbol:
+            symbol = normalize_symbol(symbol, "prod")
+        return await self._call("fetch_my_trades", symbol, since, limit, params or {})
+
+    # Advanced features
+    async def fetch_leverage(self, symbol: str) -> Dict[str, Any]:
+        """Fetch current leverage."""
+        symbol = normalize_symbol(symbol, "prod")
+        return await self._call("fetch_leverage", symbol)
+
+    async def set_leverage(self, leverage: int, symbol: Optional[str] = None) -> Dict[str, Any]:
+        """Set leverage."""
+        if symbol:
+            symbol = normalize_symbol(symbol, "prod")
+        return await self._call("set_leverage", leverage, symbol)
+
+    async def fetch_funding_rate(self, symbol: str) -> Dict[str, Any]:
+        """Fetch funding rate."""
+        symbol = normalize_symbol(symbol, "prod")
+        return await self._call("fetch_funding_rate", symbol)
+
+    async def fetch_funding_history(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Fetch funding history."""
+        if symbol:
+            symbol = normalize_symbol(symbol, "prod")
+        return await self._call("fetch_funding_history", symbol)
+
+    # Properties that CCXT users expect
+    @property
+    def has(self) -> Dict[str, bool]:
+        """Get the capabilities dict."""
+        return self.exchange.has
+
+    @property
+    def markets(self) -> Dict[str, Any]:
+        """Get the markets dict."""
+        return self.exchange.markets
+
+    async def close(self) -> None:
+        """Close the adapter and release the aiohttp session."""
+        if self._exchange:
+            await self._exchange.close()
+        if self.hedge_policy is not None:
+            self.hedge_policy.close()
@@ -0,0 +1,260 @@
+"""adapters/session.py
+
+HTTP session and connection pool management for the paper adapter.
+
+This module builds requests sessions with a tuned urllib3 connection pool,
+exposes pool statistics, and keeps a process-wide registry so that many
+gateways talking to the same host can share one pool.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from ..core.calllog import add_phase
+from ..core.deadline import bound_timeout, remaining
+
+
+class PoolConfig:
+    """Connection pool settings for a requests session.
+
+    Attributes:
+        pool_connections: Number of per-host pools to keep (one per host is
+            enough for a single MockExchange instance)
+        pool_maxsize: Maximum connections kept open per host; set this to at
+            least the number of threads sharing the gateway
+        pool_block: If True, wait for a free connection when the pool is
+            exhausted instead of opening a throwaway one
+        keep_alive: Reuse connections between requests (HTTP keep-alive)
+    """
+
+    __slots__ = ("pool_connections", "pool_maxsize", "pool_block", "keep_alive")
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ):
+        if pool_connections <= 0 or pool_maxsize <= 0:
+            raise ValueError("pool_connections and pool_maxsize must be > 0")
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+
+    def _key(self) -> tuple:
+        return (self.pool_connections, self.pool_maxsize, self.pool_block, self.keep_alive)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, PoolConfig) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return (
+            f"PoolConfig(pool_connections={self.pool_connections}, "
+            f"pool_maxsize={self.pool_maxsize}, pool_block={self.pool_block}, "
+            f"keep_alive={self.keep_alive})"
+        )
+
+
+class _TimedConnect:
+    """Connection mixin charging connection setup to the call log's connect phase.
+
+    Connecting happens inside the request the adapter times as the server
+    phase, so the same time is taken back out of it.
+    """
+
+    def connect(self) -> None:
+        started = time.perf_counter()
+        try:
+            super().connect()  # type: ignore[misc]
+        finally:
+            elapsed = time.perf_counter() - started
+            add_phase("connect", elapsed)
+            add_phase("server", -elapsed)
+
+
+class TimedHTTPConnection(_TimedConnect, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnect, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class DeadlineHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that shrinks socket timeouts to the current deadline.
+
+    Inside ``gateway.deadline(...)`` both the connect and read timeouts of
+    every request are capped at the time left, and a request whose budget
+    is already spent is never sent. Outside a deadline it behaves exactly
+    like HTTPAdapter, except that new connections report their setup time
+    to the call log (core.calllog).
+    """
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        left = remaining()
+        if left is not None:
+            if left <= 0:
+                raise requests.exceptions.Timeout("Deadline exceeded", request=request)
+            timeout = kwargs.get("timeout")
+            if isinstance(timeout, tuple):
+                kwargs["timeout"] = tuple(bound_timeout(part) for part in timeout)
+            else:
+                kwargs["timeout"] = bound_timeout(timeout)
+        return super().send(request, **kwargs)
+
+
+def mount_deadline_adapter(session: requests.Session) -> None:
+    """Replace the default adapters of a session created elsewhere (e.g. by ccxt)."""
+    adapter = DeadlineHTTPAdapter()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+
+def create_session(config: Optional[PoolConfig] = None) -> requests.Session:
+    """Create a requests session with a tuned connection pool."""
+    config = config or PoolConfig()
+    session = requests.Session()
+
+    adapter = DeadlineHTTPAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=config.pool_block,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    if not config.keep_alive:
+        session.headers["Connection"] = "close"
+
+    return session
+
+
+def pool_stats(session: requests.Session) -> Dict[str, Any]:
+    """Return connection pool statistics for a session.
+
+    For every host pool this reports how many connections were opened
+    (``connections_opened``), how many requests were served
+    (``requests_served``) and how many idle connections are ready for reuse
+    (``idle``). A high opened-to-served ratio means connections are being
+    thrown away, usually because pool_maxsize is below the thread count.
+    """
+    pools = []
+    seen = set()
+    for adapter in session.adapters.values():
+        if id(adapter) in seen or not isinstance(adapter, HTTPAdapter):
+            continue
+        seen.add(id(adapter))
+        manager = adapter.poolmanager
+        for key in list(manager.pools.keys()):
+            pool = manager.pools.get(key)
+            if pool is None:
+                continue
+            queue = list(pool.pool.queue) if pool.pool is not None else []
+            # The queue is pre-filled with None placeholders; real entries are idle connections
+            idle = sum(1 for conn in queue if conn is not None)
+            pools.append(
+                {
+                    "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                    "maxsize": pool.pool.maxsize if pool.pool is not None else 0,
+                    "connections_opened": pool.num_connections,
+                    "requests_served": pool.num_requests,
+                    "idle": idle,
+                }
+            )
+    return {"pools": pools}
+
+
+class SessionRegistry:
+    """Process-wide registry of shared sessions keyed by base URL.
+
+    Gateways created with ``share_session=True`` borrow their session from
+    here instead of opening their own TCP pool, so dozens of gateways
+    pointing at the same MockExchange host reuse the same connections.
+    Sessions are reference counted and closed when the last borrower
+    releases them.
+
+    Shared sessions carry no credentials: each adapter sends its own
+    API key header with every request.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sessions: Dict[Tuple[str, PoolConfig], Tuple[requests.Session, int]] = {}
+
+    def acquire(self, base_url: str, config: Optional[PoolConfig] = None) -> requests.Session:
+        """Borrow the shared session for base_url, creating it if needed."""
+        key = (base_url.rstrip("/"), config or PoolConfig())
+        with self._lock:
+            session, refs = self._sessions.get(key, (None, 0))
+            if session is None:
+                session = create_session(key[1])
+            self._sessions[key] = (session, refs + 1)
+            return session
+
+    def release(self, base_url: str, config: Optional[PoolConfig] = None) -> None:
+        """Return a borrowed session; the last release closes it."""
+        key = (base_url.rstrip("/"), config or PoolConfig())
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is None:
+                return
+            session, refs = entry
+            if refs > 1:
+                self._sessions[key] = (session, refs - 1)
+                return
+            del self._sessions[key]
+        session.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the shared sessions with their borrower counts and pool stats."""
+        with self._lock:
+            entries = list(self._sessions.items())
+        return {
+            "sessions": [
+                {"base_url": base_url, "borrowers": refs, **pool_stats(session)}
+                for (base_url, _), (session, refs) in entries
+            ]
+        }
+
+
+# Global session registry instance
+_session_registry: Optional[SessionRegistry] = None
+_session_registry_lock = threading.Lock()
+
+
+def get_session_registry() -> SessionRegistry:
+    """Get the global session registry instance."""
+    global _session_registry
+
+    if _session_registry is None:
+        with _session_registry_lock:
+            if _session_registry is None:
+                _session_registry = SessionRegistry()
+
+    return _session_registry
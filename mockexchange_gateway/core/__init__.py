@@ -1,5 +1,10 @@
 """Core package for MockX Gateway."""
 
+from .backfill import BackfillProgress
+from .batch import BatchResult
+from .cache import TickerCache
+from .calllog import CallLog
+from .candles import CandleStore
 from .capabilities import (
     Capabilities,
     get_capabilities,
@@ -7,6 +12,7 @@ from .capabilities import (
     has_feature,
     require_support,
 )
+from .circuit import CircuitBreaker, CircuitBreakers
 from .errors import (
     AuthenticationError,
     BadRequest,
@@ -21,9 +27,16 @@ from .errors import (
     RequestTimeout,
 )
 from .facade import MockXGateway
+from .facade_async import AsyncMockXGateway
+from .hedging import HedgePolicy
+from .orders import ClientOrderTable
+from .ratelimit import RateLimiter, TokenBucket, get_rate_limiter_registry
+from .retry import RetryPolicy
+from .stats import GatewayStats
 
 __all__ = [
     "MockXGateway",
+    "AsyncMockXGateway",
     "MockXError",
     "ExchangeError",
     "AuthenticationError",
@@ -40,4 +53,18 @@ __all__ = [
     "get_has_dict",
     "require_support",
     "Capabilities",
+    "BatchResult",
+    "TickerCache",
+    "RateLimiter",
+    "TokenBucket",
+    "get_rate_limiter_registry",
+    "RetryPolicy",
+    "ClientOrderTable",
+    "CircuitBreaker",
+    "CircuitBreakers",
+    "HedgePolicy",
+    "GatewayStats",
+    "CallLog",
+    "CandleStore",
+    "BackfillProgress",
 ]
@@ -0,0 +1,247 @@
+"""core/backfill.py
+
+Parallel OHLCV backfill into a CandleStore.
+
+Loading a long history through ``fetch_ohlcv`` takes thousands of
+since/limit pages. ``backfill`` splits the part of the range the store does
+not hold yet into windows and fetches the windows concurrently, each one
+page after page:
+
+    >>> progress = gateway.backfill_ohlcv("BTC/USDT", "1m", since=start, on_progress=print)
+
+Every page goes through the adapter, so the rate limiter still paces the
+requests; concurrency only fills its budget instead of waiting on one
+response at a time. Windows are whole numbers of candles and the store
+keeps each timestamp once, so candles on window boundaries are not
+duplicated. Pages are stored as they arrive: after an interruption or a
+failed window, running the same backfill again fetches only what is missing.
+
+When the store holds nothing before the range, a one-candle request finds
+the first candle the exchange has, and only the range from there on is
+split into windows. A range starting before the listing (``since=0``) is
+thus not spread over windows that are all empty. The range before the
+first candle is not recorded as fetched, since an exchange that ignores
+``since`` would make that permanent; a later run pays one request for the
+probe again.
+"""
+
+import threading
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+from .batch import DEFAULT_BATCH_CONCURRENCY, run_batch, run_batch_async
+from .candles import CandleStore, Fetcher, Range, timeframe_ms
+
+
+class BackfillProgress:
+    """Progress of a backfill, updated after every stored page.
+
+    Attributes:
+        symbol: Symbol being backfilled
+        timeframe: Candle timeframe
+        start: Start of the range (ms): the first candle the exchange has,
+            if it is later than the requested start
+        end: End of the range (ms, exclusive)
+        done_ms: Milliseconds of the range stored, including what the store
+            already held
+        rows: Candles added by this backfill
+        requests: Requests made by this backfill (pages and the first-candle probe)
+        windows: Number of windows the missing ranges were split into
+    """
+
+    __slots__ = ("symbol", "timeframe", "start", "end", "done_ms", "rows", "requests", "windows")
+
+    def __init__(self, symbol: str, timeframe: str, start: int, end: int, done_ms: int = 0):
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.start = start
+        self.end = end
+        self.done_ms = done_ms
+        self.rows = 0
+        self.requests = 0
+        self.windows = 0
+
+    @property
+    def fraction(self) -> float:
+        """Share of the range stored, from 0.0 to 1.0."""
+        total = self.end - self.start
+        return self.done_ms / total if total > 0 else 1.0
+
+    def __repr__(self) -> str:
+        return (
+            f"BackfillProgress({self.symbol} {self.timeframe}, {self.fraction:.1%}, "
+            f"rows={self.rows}, requests={self.requests})"
+        )
+
+
+ProgressCallback = Callable[[BackfillProgress], None]
+
+
+def split_windows(ranges: List[Range], size: int) -> List[Range]:
+    """Split ranges into consecutive windows of at most size milliseconds."""
+    windows = []
+    for lo, hi in ranges:
+        while lo < hi:
+            windows.append((lo, min(hi, lo + size)))
+            lo += size
+    return windows
+
+
+def plan_windows(
+    store: CandleStore,
+    missing: List[Range],
+    timeframe: str,
+    workers: int,
+    window: Optional[int] = None,
+) -> List[Range]:
+    """Split missing ranges into windows of window candles.
+
+    By default the windows are whole pages, sized so that each worker gets
+    about one; fewer, longer windows keep the store's segment files few.
+    """
+    tf = timeframe_ms(timeframe)
+    if window is None:
+        candles = sum(hi - lo for lo, hi in missing) // tf
+        pages = -(-candles // (store.page_limit * workers))
+        window = max(1, pages) * store.page_limit
+    if window <= 0:
+        raise ValueError("window must be > 0")
+    return split_windows(missing, window * tf)
+
+
+class _Tracker:
+    """Thread-safe page counter that reports progress."""
+
+    def __init__(self, progress: BackfillProgress, on_progress: Optional[ProgressCallback]):
+        self.progress = progress
+        self.on_progress = on_progress
+        self._lock = threading.Lock()
+
+    def __call__(self, start: int, end: int, rows: int) -> None:
+        with self._lock:
+            self.progress.done_ms += end - start
+            self.progress.rows += rows
+            self.progress.requests += 1
+            if self.on_progress is not None:
+                self.on_progress(self.progress)
+
+
+def _probe_from(
+    store: CandleStore, exchange_id: str, symbol: str, timeframe: str, start: int, end: int
+) -> Tuple[List[Range], Optional[int]]:
+    # Return the missing ranges and where to look for the first candle, or
+    # None when the store already holds candles before the first missing range
+    missing = store.missing(exchange_id, symbol, timeframe, start, end)
+    if not missing or any(
+        lo < missing[0][0] for lo, _ in store.covered(exchange_id, symbol, timeframe)
+    ):
+        return missing, None
+    return missing, missing[0][0]
+
+
+def _prepare(
+    store: CandleStore,
+    missing: List[Range],
+    probe: Optional[int],
+    rows: List[List[Any]],
+    symbol: str,
+    timeframe: str,
+    start: int,
+    end: int,
+    workers: int,
+    window: Optional[int],
+) -> Tuple[BackfillProgress, List[Range]]:
+    # rows is the answer to the one-candle request made at probe, if any
+    to_fetch = missing
+    if probe is not None:
+        first = min((int(row[0]) for row in rows if probe <= row[0] < end), default=None)
+        if first is None:
+            # No candles from the exchange (yet); leave the range missing
+            to_fetch = []
+        elif first > start:
+            start = first
+            missing = to_fetch = [(max(lo, first), hi) for lo, hi in missing if hi > first]
+    progress = BackfillProgress(
+        symbol, timeframe, start, end, (end - start) - sum(hi - lo for lo, hi in missing)
+    )
+    progress.requests = 0 if probe is None else 1
+    windows = plan_windows(store, to_fetch, timeframe, workers, window)
+    progress.windows = len(windows)
+    return progress, windows
+
+
+def backfill(
+    store: CandleStore,
+    fetch: Fetcher,
+    exchange_id: str,
+    symbol: str,
+    timeframe: str,
+    start: int,
+    end: int,
+    max_concurrency: Optional[int] = None,
+    window: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> BackfillProgress:
+    """Fetch every missing candle of [start, end) into store, windows in parallel.
+
+    Args:
+        store: Store the candles are written to
+        fetch: ``fetch_ohlcv(symbol, timeframe, since, limit)``
+        max_concurrency: Windows fetched at once (default 8)
+        window: Candles per window (default: about one window per worker)
+        on_progress: Called with the BackfillProgress after every stored
+            page, from the worker threads (one call at a time)
+
+    Returns:
+        BackfillProgress: Final progress
+
+    Raises:
+        Exception: The first error of a failed window, once the other
+            windows have finished; what they fetched is kept
+    """
+    workers = max_concurrency or DEFAULT_BATCH_CONCURRENCY
+    missing, probe = _probe_from(store, exchange_id, symbol, timeframe, start, end)
+    rows = fetch(symbol, timeframe, probe, 1) if probe is not None else []
+    progress, windows = _prepare(
+        store, missing, probe, rows, symbol, timeframe, start, end, workers, window
+    )
+    tracker = _Tracker(progress, on_progress)
+
+    def run(window: Range) -> int:
+        return store.fill(fetch, exchange_id, symbol, timeframe, *window, on_page=tracker)
+
+    for result in run_batch(run, windows, workers):
+        if not result.ok:
+            raise result.error  # type: ignore[misc]
+    return progress
+
+
+async def backfill_async(
+    store: CandleStore,
+    fetch: Callable[..., Awaitable[List[List[Any]]]],
+    exchange_id: str,
+    symbol: str,
+    timeframe: str,
+    start: int,
+    end: int,
+    max_concurrency: Optional[int] = None,
+    window: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> BackfillProgress:
+    """Async variant of backfill (windows run as tasks)."""
+    workers = max_concurrency or DEFAULT_BATCH_CONCURRENCY
+    missing, probe = _probe_from(store, exchange_id, symbol, timeframe, start, end)
+    rows = await fetch(symbol, timeframe, probe, 1) if probe is not None else []
+    progress, windows = _prepare(
+        store, missing, probe, rows, symbol, timeframe, start, end, workers, window
+    )
+    tracker = _Tracker(progress, on_progress)
+
+    async def run(window: Range) -> int:
+        return await store.fill_async(
+            fetch, exchange_id, symbol, timeframe, *window, on_page=tracker
+        )
+
+    for result in await run_batch_async(run, windows, workers):
+        if not result.ok:
+            raise result.error  # type: ignore[misc]
+    return progress
@@ -0,0 +1,182 @@
+"""core/batch.py
+
+Concurrent batch execution helpers for the MockX Gateway.
+
+This module runs many independent gateway calls (for example order
+creation or cancellation during a rebalance) with a bounded number of
+requests in flight, and reports per-item outcomes in input order.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .deadline import bind_context
+from .errors import BadRequest, ExchangeError
+
+T = TypeVar("T")
+
+# Default number of requests in flight for batch operations
+DEFAULT_BATCH_CONCURRENCY = 8
+
+
+class BatchResult:
+    """Outcome of a single item in a batch operation.
+
+    Batch methods never raise for an individual item. Instead each input
+    item gets a BatchResult at the same position in the returned list,
+    carrying either the result or the exception that item produced.
+
+    Attributes:
+        index: Position of the item in the input sequence
+        result: Result of the call (None if it failed)
+        error: Exception raised by the call (None if it succeeded)
+    """
+
+    __slots__ = ("index", "result", "error")
+
+    def __init__(self, index: int, result: Any = None, error: Optional[BaseException] = None):
+        self.index = index
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """True if the item succeeded."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        if self.ok:
+            return f"BatchResult(index={self.index}, ok=True)"
+        return f"BatchResult(index={self.index}, error={self.error!r})"
+
+
+def order_spec_args(spec: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Unpack an order spec dict into create_order positional arguments.
+
+    Order specs use the same keys as ccxt's createOrders:
+    ``symbol``, ``type``, ``side``, ``amount`` and optional ``price`` and ``params``.
+    """
+    try:
+        return (
+            spec["symbol"],
+            spec["type"],
+            spec["side"],
+            spec["amount"],
+            spec.get("price"),
+            spec.get("params"),
+        )
+    except KeyError as e:
+        raise BadRequest(f"Order spec is missing required field: {e.args[0]}")
+
+
+def spread_batch_results(count: int, results: Any) -> List[BatchResult]:
+    """Turn the response of a native batch endpoint into count BatchResults.
+
+    A list with one entry per item is spread over the items. Anything else
+    (some exchanges only acknowledge the batch) says nothing about the
+    individual items, so each gets an ExchangeError: its outcome is unknown
+    and has to be checked with fetch_order or fetch_open_orders.
+    """
+    if isinstance(results, list) and len(results) == count:
+        return [BatchResult(i, result=result) for i, result in enumerate(results)]
+    error = ExchangeError(
+        f"Batch response does not have one result per item ({count} sent); "
+        "the outcome of each item is unknown",
+        response=repr(results),
+    )
+    return [BatchResult(i, error=error) for i in range(count)]
+
+
+def run_batch(
+    func: Callable[[T], Any], items: Iterable[T], max_concurrency: Optional[int] = None
+) -> List[BatchResult]:
+    """Call func on every item with at most max_concurrency calls in flight.
+
+    Args:
+        func: Callable applied to each item
+        items: Items to process
+        max_concurrency: Maximum number of concurrent calls
+            (defaults to DEFAULT_BATCH_CONCURRENCY)
+
+    Returns:
+        List[BatchResult]: One result per item, in input order
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    workers = max(1, min(max_concurrency or DEFAULT_BATCH_CONCURRENCY, len(items)))
+
+    def call(index: int, item: T) -> BatchResult:
+        try:
+            return BatchResult(index, result=func(item))
+        except Exception as e:
+            return BatchResult(index, error=e)
+
+    if workers == 1:
+        return [call(i, item) for i, item in enumerate(items)]
+
+    # Worker threads run in the caller's context so deadlines follow the work
+    call = bind_context(call)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mockx-batch") as pool:
+        return list(pool.map(call, range(len(items)), items))
+
+
+def iter_batch(
+    func: Callable[[T], Any], items: Iterable[T], max_concurrency: Optional[int] = None
+) -> Iterator[BatchResult]:
+    """Like run_batch, but yield each BatchResult as soon as it completes.
+
+    Results arrive in completion order; use ``BatchResult.index`` to relate
+    them to the input. Closing the generator early cancels queued calls.
+    """
+    items = list(items)
+    if not items:
+        return
+
+    workers = max(1, min(max_concurrency or DEFAULT_BATCH_CONCURRENCY, len(items)))
+
+    def call(index: int, item: T) -> BatchResult:
+        try:
+            return BatchResult(index, result=func(item))
+        except Exception as e:
+            return BatchResult(index, error=e)
+
+    call = bind_context(call)
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mockx-batch")
+    try:
+        futures = [pool.submit(call, i, item) for i, item in enumerate(items)]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_batch_async(
+    func: Callable[[T], Awaitable[Any]],
+    items: Iterable[T],
+    max_concurrency: Optional[int] = None,
+) -> List[BatchResult]:
+    """Async counterpart of run_batch, bounded by a semaphore."""
+    semaphore = asyncio.Semaphore(max_concurrency or DEFAULT_BATCH_CONCURRENCY)
+
+    async def call(index: int, item: T) -> BatchResult:
+        async with semaphore:
+            try:
+                return BatchResult(index, result=await func(item))
+            except Exception as e:
+                return BatchResult(index, error=e)
+
+    return list(await asyncio.gather(*(call(i, item) for i, item in enumerate(items))))
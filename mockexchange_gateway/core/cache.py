@@ -0,0 +1,106 @@
+"""core/cache.py
+
+Ticker cache for the MockX Gateway.
+
+This module provides an opt-in, thread-safe LRU cache with a staleness
+bound that sits in front of fetch_ticker/fetch_tickers, so that many
+components asking for the same symbol do not each hit the backend.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class TickerCache:
+    """LRU ticker cache with a per-call staleness bound.
+
+    Every entry remembers when it was stored. A lookup returns the cached
+    ticker only if it is younger than ``max_age_ms`` (the per-call value if
+    given, otherwise the cache-wide ``ttl_ms``). When the cache is full the
+    least recently used symbol is evicted.
+
+    Cached tickers are the exact dicts returned by the adapter, so the
+    output shape is unchanged. They are shared between callers and should
+    be treated as read-only.
+
+    Attributes:
+        ttl_ms: Default maximum age of a cached ticker in milliseconds
+        max_size: Maximum number of symbols kept in the cache
+    """
+
+    def __init__(self, ttl_ms: int = 1000, max_size: int = 1024):
+        if ttl_ms < 0:
+            raise ValueError("ttl_ms must be >= 0")
+        if max_size <= 0:
+            raise ValueError("max_size must be > 0")
+        self.ttl_ms = ttl_ms
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, symbol: str, max_age_ms: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Return the cached ticker for symbol if it is fresh enough, else None."""
+        max_age = (self.ttl_ms if max_age_ms is None else max_age_ms) / 1000.0
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is not None and now - entry[0] <= max_age:
+                self._entries.move_to_end(symbol)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def put(self, symbol: str, ticker: Dict[str, Any]) -> None:
+        """Store a ticker for symbol."""
+        self.put_many([(symbol, ticker)])
+
+    def put_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store several tickers with the same timestamp."""
+        now = time.monotonic()
+
+        with self._lock:
+            for symbol, ticker in items:
+                self._entries[symbol] = (now, ticker)
+                self._entries.move_to_end(symbol)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """Drop one symbol, or every symbol if none is given."""
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(symbol, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_ms": self.ttl_ms,
+            }
+
+    def reset_stats(self) -> None:
+        """Reset the hit/miss/eviction counters."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,190 @@
+"""core/calllog.py
+
+Recent-call ring buffer and slow-call log for live diagnosis.
+
+Every gateway method call is written to a fixed-size ring buffer with its
+arguments, duration, outcome and the time it spent in each phase of the
+request (rate-limit wait, connect, server, decode, map, retry backoff).
+Calls slower than a threshold are also kept in a second buffer and logged
+as warnings, so a stalled trading loop can be traced to the call holding
+it up:
+
+    >>> for call in gateway.slow_calls():
+    ...     print(call["method"], call["duration_ms"], call["phases_ms"])
+"""
+
+import contextvars
+import itertools
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds spent per phase by the gateway call running in this context
+_phases: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar(
+    "mockx_phases", default=None
+)
+
+# Longest argument summary kept per call
+MAX_ARGS_LENGTH = 120
+
+
+def current_phases() -> Optional[Dict[str, float]]:
+    """Return the phase timings of the call being logged (None if none)."""
+    return _phases.get()
+
+
+def add_phase(name: str, seconds: float) -> None:
+    """Add seconds to a phase of the call being logged, if any."""
+    phases = _phases.get()
+    if phases is not None:
+        phases[name] = phases.get(name, 0.0) + seconds
+
+
+def _summarize(value: Any) -> str:
+    if isinstance(value, dict):
+        return f"{{{len(value)} keys}}"
+    if isinstance(value, (list, tuple, set)):
+        return f"[{len(value)} items]"
+    return repr(value)
+
+
+def summarize_args(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+    """Render call arguments compactly; containers are shown by size only."""
+    parts = [_summarize(arg) for arg in args]
+    parts.extend(f"{key}={_summarize(value)}" for key, value in kwargs.items())
+    text = ", ".join(parts)
+    if len(text) > MAX_ARGS_LENGTH:
+        text = text[: MAX_ARGS_LENGTH - 3] + "..."
+    return text
+
+
+class CallRecord:
+    """One gateway call.
+
+    Arguments are kept as passed and only summarized when the record is
+    read, so logging a call costs no formatting.
+
+    Attributes:
+        method: Gateway method name
+        started: Wall-clock start time (time.time())
+        duration: Seconds the call took
+        error: Exception raised by the call, or None
+        phases: Seconds per request phase
+    """
+
+    __slots__ = ("method", "args", "kwargs", "started", "duration", "error", "phases", "_start")
+
+    def __init__(self, method: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]):
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs
+        self.started = time.time()
+        self.duration = 0.0
+        self.error: Optional[BaseException] = None
+        self.phases: Dict[str, float] = {}
+        self._start = time.perf_counter()
+
+    @property
+    def outcome(self) -> str:
+        """Return "ok" or the exception class name."""
+        return "ok" if self.error is None else type(self.error).__name__
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the record as plain data with durations in milliseconds."""
+        return {
+            "method": self.method,
+            "args": summarize_args(self.args, self.kwargs),
+            "started": self.started,
+            "duration_ms": round(self.duration * 1000, 3),
+            "outcome": self.outcome,
+            "error": str(self.error) if self.error is not None else None,
+            "phases_ms": {name: round(s * 1000, 3) for name, s in self.phases.items()},
+        }
+
+
+class RingBuffer:
+    """Fixed-size buffer of the most recent items.
+
+    Writers never block each other: a slot is claimed from an
+    ``itertools.count`` (atomic under the GIL) and written with a single
+    list store, so appending takes no lock. Readers copy the slots and
+    order them by sequence number.
+    """
+
+    def __init__(self, size: int):
+        if size <= 0:
+            raise ValueError("size must be > 0")
+        self.size = size
+        self._slots: List[Optional[Tuple[int, Any]]] = [None] * size
+        self._sequence = itertools.count()
+
+    def append(self, item: Any) -> None:
+        """Store item, overwriting the oldest one when full."""
+        seq = next(self._sequence)
+        self._slots[seq % self.size] = (seq, item)
+
+    def items(self, limit: Optional[int] = None) -> List[Any]:
+        """Return stored items, newest first."""
+        slots = sorted((slot for slot in list(self._slots) if slot is not None), reverse=True)
+        items = [item for _, item in slots]
+        return items if limit is None else items[:limit]
+
+
+class CallLog:
+    """Recent calls and slow calls of one gateway.
+
+    Attributes:
+        slow_threshold: Calls taking longer than this many seconds are kept
+            in the slow buffer and logged (None disables the slow log); may
+            be changed at runtime
+    """
+
+    def __init__(
+        self, size: int = 256, slow_threshold: Optional[float] = None, slow_size: int = 64
+    ):
+        self.recent = RingBuffer(size)
+        self.slow = RingBuffer(slow_size)
+        self.slow_threshold = slow_threshold
+
+    def begin(
+        self, method: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Tuple[CallRecord, Any]:
+        """Start a call record and collect phase timings for it.
+
+        Nested gateway calls share the phase timings of the outermost call.
+        Returns the record and a token for end().
+        """
+        record = CallRecord(method, args, kwargs)
+        phases = _phases.get()
+        if phases is None:
+            return record, _phases.set(record.phases)
+        record.phases = phases
+        return record, None
+
+    def end(self, record: CallRecord, token: Any) -> None:
+        """Finish a call record and store it."""
+        record.duration = time.perf_counter() - record._start
+        if token is not None:
+            _phases.reset(token)
+        self.recent.append(record)
+        threshold = self.slow_threshold
+        if threshold is not None and record.duration > threshold:
+            self.slow.append(record)
+            logger.warning(
+                "Slow gateway call %s(%s): %.1fms, %s, phases %s",
+                record.method,
+                summarize_args(record.args, record.kwargs),
+                record.duration * 1000,
+                record.outcome,
+                {name: round(s * 1000, 1) for name, s in record.phases.items()},
+            )
+
+    def recent_calls(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the most recent calls, newest first."""
+        return [record.as_dict() for record in self.recent.items(limit)]
+
+    def slow_calls(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the most recent slow calls, newest first."""
+        return [record.as_dict() for record in self.slow.items(limit)]
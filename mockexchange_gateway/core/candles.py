@@ -0,0 +1,439 @@
+"""core/candles.py
+
+Persistent on-disk OHLCV store.
+
+CandleStore keeps closed candles per exchange, symbol and timeframe so that
+restarting a strategy does not fetch the same history again. With a store
+configured, ``fetch_ohlcv(symbol, timeframe, since=...)`` reads what is
+already on disk, fetches only the missing ranges (paging by since/limit)
+and appends them.
+
+Layout:
+    <root>/<exchange>/<symbol>/<timeframe>/index.json
+    <root>/<exchange>/<symbol>/<timeframe>/<n>.bin
+
+Candles are fixed 48-byte little-endian records (int64 timestamp, float64
+open, high, low, close, volume) in append-only segment files, read through
+read-only memory maps; ``read(..., format="structured")`` returns a
+zero-copy NumPy view when the range lies in one segment. The index records
+which time ranges were fetched: a page covers its range up to its last
+candle, so gaps between returned candles (outages) are not fetched again,
+while a page without candles in its range marks nothing and the rest of
+the range is tried again on the next call. The index is replaced
+atomically after the data is written, and rows past the indexed count are
+ignored, so an interrupted write loses at most that write. Fills running
+at the same time may fetch the same page; each stores only what the other
+has not. ``clear`` drops a series whose history has to be fetched again.
+
+One process should write a store directory at a time.
+
+Usage:
+    >>> gateway = ExchangeFactory.create_prod_gateway("binance", candle_store="~/.mockx/candles")
+    >>> candles = gateway.fetch_ohlcv("BTC/USDT", "1m", since=start, format="structured")
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from array import array
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..adapters.columnar import check_ohlcv_format, ohlcv_dtype
+
+# One candle: timestamp (ms), open, high, low, close, volume
+RECORD = struct.Struct("<q5d")
+
+# Rows per segment file (48 MB)
+DEFAULT_SEGMENT_ROWS = 1 << 20
+
+_UNITS = {"s": 1000, "m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+
+Range = Tuple[int, int]
+Fetcher = Callable[[str, str, Optional[int], Optional[int]], List[List[Any]]]
+# Called after each stored page with its [start, end) and the rows added
+PageCallback = Callable[[int, int, int], None]
+
+
+def timeframe_ms(timeframe: str) -> int:
+    """Return the length of a ccxt timeframe ("1m", "4h", "1d", ...) in milliseconds.
+
+    Raises:
+        ValueError: For unknown or variable-length timeframes (months, years)
+    """
+    match = re.fullmatch(r"(\d+)([smhdw])", timeframe)
+    if match is None:
+        raise ValueError(f"Unsupported timeframe for the candle store: '{timeframe}'")
+    return int(match.group(1)) * _UNITS[match.group(2)]
+
+
+def subtract_ranges(wanted: Range, covered: List[Range]) -> List[Range]:
+    """Return the parts of wanted not in covered (sorted, non-overlapping)."""
+    start, end = wanted
+    missing = []
+    for lo, hi in covered:
+        if hi <= start:
+            continue
+        if lo >= end:
+            break
+        if lo > start:
+            missing.append((start, lo))
+        start = max(start, hi)
+    if start < end:
+        missing.append((start, end))
+    return missing
+
+
+class _Segment:
+    """One append-only data file and the time range it covers."""
+
+    __slots__ = ("file", "start", "end", "rows", "_map")
+
+    def __init__(self, file: Optional[str], start: int, end: int, rows: int):
+        self.file = file
+        self.start = start
+        self.end = end
+        self.rows = rows
+        self._map: Optional[Tuple[int, mmap.mmap]] = None
+
+    def close(self) -> None:
+        """Release the memory map."""
+        if self._map is not None:
+            try:
+                self._map[1].close()
+            except BufferError:
+                # Views returned by read() still use it; it closes with them
+                pass
+            self._map = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"file": self.file, "start": self.start, "end": self.end, "rows": self.rows}
+
+    def view(self, directory: str) -> memoryview:
+        """Return the indexed rows as a read-only memoryview over the file."""
+        if self.rows == 0 or self.file is None:
+            return memoryview(b"")
+        if self._map is None or self._map[0] != self.rows:
+            with open(os.path.join(directory, self.file), "rb") as f:
+                # Map only the indexed rows; anything after them is an unfinished write
+                self._map = (
+                    self.rows,
+                    mmap.mmap(f.fileno(), self.rows * RECORD.size, access=mmap.ACCESS_READ),
+                )
+        return memoryview(self._map[1])
+
+    def timestamp(self, view: memoryview, i: int) -> int:
+        return RECORD.unpack_from(view, i * RECORD.size)[0]
+
+    def bisect(self, view: memoryview, ts: int) -> int:
+        """Return the index of the first row with timestamp >= ts."""
+        lo, hi = 0, self.rows
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.timestamp(view, mid) < ts:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+class _Series:
+    """Segments of one exchange/symbol/timeframe."""
+
+    def __init__(self, directory: str, tf_ms: int):
+        self.directory = directory
+        self.tf_ms = tf_ms
+        self.segments: List[_Segment] = []
+        path = os.path.join(directory, "index.json")
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index["timeframe_ms"] != tf_ms:
+                raise ValueError(f"Candle store index {path} has a different timeframe")
+            self.segments = [_Segment(**segment) for segment in index["segments"]]
+
+    def covered(self) -> List[Range]:
+        """Return the fetched time ranges, merged."""
+        merged: List[Range] = []
+        for segment in self.segments:
+            if merged and segment.start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], segment.end))
+            else:
+                merged.append((segment.start, segment.end))
+        return merged
+
+    def _save(self) -> None:
+        path = os.path.join(self.directory, "index.json")
+        index = {"timeframe_ms": self.tf_ms, "segments": [s.as_dict() for s in self.segments]}
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def _new_file(self) -> str:
+        numbers = [int(s.file.split(".")[0]) for s in self.segments if s.file is not None]
+        return f"{max(numbers, default=-1) + 1:06d}.bin"
+
+    def append(self, rows: List[List[Any]], start: int, end: int, segment_rows: int) -> None:
+        """Store the candles fetched for [start, end) and mark the range covered."""
+        os.makedirs(self.directory, exist_ok=True)
+        nan = float("nan")
+        packed = b"".join(
+            RECORD.pack(int(row[0]), *(nan if v is None else v for v in row[1:6])) for row in rows
+        )
+
+        # Extend the segment ending where this range starts, if it has room
+        segment = next((s for s in self.segments if s.end == start), None)
+        if segment is not None and rows:
+            if segment.file is None:
+                # A gap-only segment gets a file once candles arrive
+                segment.file = self._new_file()
+            elif segment.rows + len(rows) > segment_rows:
+                segment = None
+        if segment is None:
+            segment = _Segment(self._new_file() if rows else None, start, start, 0)
+            self.segments.append(segment)
+            self.segments.sort(key=lambda s: s.start)
+
+        if rows:
+            path = os.path.join(self.directory, segment.file)  # type: ignore[arg-type]
+            with open(path, "r+b" if os.path.exists(path) else "wb") as f:
+                # Overwrite anything past the indexed rows (an interrupted write)
+                f.seek(segment.rows * RECORD.size)
+                f.write(packed)
+                f.truncate()
+                f.flush()
+                os.fsync(f.fileno())
+            segment.rows += len(rows)
+        segment.end = end
+        self._save()
+
+    def read(self, since: int, until: int) -> List[memoryview]:
+        """Return memoryviews of the stored rows with since <= timestamp < until."""
+        blocks = []
+        for segment in self.segments:
+            if segment.end <= since or segment.start >= until or segment.rows == 0:
+                continue
+            view = segment.view(self.directory)
+            lo = segment.bisect(view, since)
+            hi = segment.bisect(view, until)
+            if lo < hi:
+                blocks.append(view[lo * RECORD.size : hi * RECORD.size])
+        return blocks
+
+
+class CandleStore:
+    """Append-only, memory-mapped OHLCV store (see module docstring).
+
+    Attributes:
+        root: Directory holding the store
+        page_limit: Candles requested per call when filling a missing range
+        segment_rows: Rows per segment file
+    """
+
+    def __init__(self, root: str, page_limit: int = 1000, segment_rows: int = DEFAULT_SEGMENT_ROWS):
+        if page_limit <= 0 or segment_rows <= 0:
+            raise ValueError("page_limit and segment_rows must be > 0")
+        self.root = os.path.abspath(os.path.expanduser(root))
+        self.page_limit = page_limit
+        self.segment_rows = segment_rows
+        self._series: Dict[Tuple[str, str, str], _Series] = {}
+        self._lock = threading.RLock()
+
+    def _get(self, exchange_id: str, symbol: str, timeframe: str) -> _Series:
+        # Must hold the lock
+        key = (exchange_id, symbol, timeframe)
+        series = self._series.get(key)
+        if series is None:
+            safe = re.sub(r"[^A-Za-z0-9._-]", "-", symbol)
+            directory = os.path.join(self.root, exchange_id, safe, timeframe)
+            series = self._series[key] = _Series(directory, timeframe_ms(timeframe))
+        return series
+
+    def window(self, timeframe: str, since: int, limit: Optional[int] = None) -> Range:
+        """Return the [start, end) of closed candles a fetch_ohlcv call asks for."""
+        tf = timeframe_ms(timeframe)
+        start = -(-since // tf) * tf
+        # Only closed candles are stored; the current one is still changing
+        end = int(time.time() * 1000) // tf * tf
+        if limit is not None:
+            end = min(end, start + limit * tf)
+        return start, max(start, end)
+
+    def covered(self, exchange_id: str, symbol: str, timeframe: str) -> List[Range]:
+        """Return the time ranges already fetched into the store."""
+        with self._lock:
+            return self._get(exchange_id, symbol, timeframe).covered()
+
+    def missing(
+        self, exchange_id: str, symbol: str, timeframe: str, start: int, end: int
+    ) -> List[Range]:
+        """Return the parts of [start, end) not fetched yet."""
+        return subtract_ranges((start, end), self.covered(exchange_id, symbol, timeframe))
+
+    def clear(self, exchange_id: str, symbol: str, timeframe: str) -> None:
+        """Delete the stored candles and index of a series so it is fetched again."""
+        with self._lock:
+            series = self._get(exchange_id, symbol, timeframe)
+            for segment in series.segments:
+                segment.close()
+                if segment.file is not None:
+                    os.remove(os.path.join(series.directory, segment.file))
+            series.segments = []
+            index = os.path.join(series.directory, "index.json")
+            if os.path.exists(index):
+                os.remove(index)
+
+    def append(
+        self,
+        exchange_id: str,
+        symbol: str,
+        timeframe: str,
+        rows: List[List[Any]],
+        start: int,
+        end: int,
+    ) -> None:
+        """Store fetched rows and mark [start, end) as fetched.
+
+        Rows outside the range or at already stored timestamps are dropped;
+        [start, end) must not overlap a range already fetched.
+        """
+        with self._lock:
+            series = self._get(exchange_id, symbol, timeframe)
+            if subtract_ranges((start, end), series.covered()) != [(start, end)]:
+                raise ValueError(f"Range [{start}, {end}) overlaps stored candles")
+            self._append_missing(series, rows, start, end)
+
+    def _append_missing(self, series: _Series, rows: List[List[Any]], start: int, end: int) -> int:
+        # Must hold the lock. Store the rows of the parts of [start, end) not
+        # covered yet (another fill may have stored the rest since this page
+        # was requested) and return the rows added.
+        unique: Dict[int, List[Any]] = {}
+        for row in rows:
+            if start <= row[0] < end:
+                unique[int(row[0])] = row
+        added = 0
+        for lo, hi in subtract_ranges((start, end), series.covered()):
+            part = [unique[ts] for ts in sorted(unique) if lo <= ts < hi]
+            series.append(part, lo, hi, self.segment_rows)
+            added += len(part)
+        return added
+
+    def read(
+        self,
+        exchange_id: str,
+        symbol: str,
+        timeframe: str,
+        since: int,
+        until: int,
+        format: str = "list",
+    ) -> Any:
+        """Read stored candles with since <= timestamp < until.
+
+        ``format`` is one of the fetch_ohlcv formats; "structured" is a
+        zero-copy view of the memory map when the range lies in one segment.
+        """
+        check_ohlcv_format(format)
+        with self._lock:
+            blocks = self._get(exchange_id, symbol, timeframe).read(since, until)
+
+        if format == "list":
+            return [[ts, *values] for block in blocks for ts, *values in RECORD.iter_unpack(block)]
+        if format == "array":
+            return array(
+                "d",
+                (value for block in blocks for row in RECORD.iter_unpack(block) for value in row),
+            )
+
+        import numpy as np
+
+        dtype = ohlcv_dtype()
+        parts = [np.frombuffer(block, dtype=dtype) for block in blocks]
+        records = parts[0] if len(parts) == 1 else np.concatenate(parts or [np.empty(0, dtype)])
+        if format == "structured":
+            return records
+        return np.stack([records[name].astype(np.float64) for name in dtype.names], axis=1)
+
+    def fill(
+        self,
+        fetch: Fetcher,
+        exchange_id: str,
+        symbol: str,
+        timeframe: str,
+        start: int,
+        end: int,
+        on_page: Optional[PageCallback] = None,
+    ) -> int:
+        """Fetch and store every missing part of [start, end); return the rows added.
+
+        fetch is ``fetch_ohlcv(symbol, timeframe, since, limit)``. Each page is
+        stored as soon as it arrives, so an interrupted fill keeps its progress;
+        on_page is then called with the page's [start, end) and rows added.
+        """
+        added = 0
+        for lo, hi in self.missing(exchange_id, symbol, timeframe, start, end):
+            while lo < hi:
+                rows = fetch(symbol, timeframe, lo, self.page_limit)
+                stored = self._store_page(exchange_id, symbol, timeframe, rows, lo, hi, on_page)
+                if stored is None:
+                    # No candles for the rest of the range (yet); leave it missing
+                    break
+                lo, count = stored
+                added += count
+        return added
+
+    async def fill_async(
+        self,
+        fetch: Callable[..., Awaitable[List[List[Any]]]],
+        exchange_id: str,
+        symbol: str,
+        timeframe: str,
+        start: int,
+        end: int,
+        on_page: Optional[PageCallback] = None,
+    ) -> int:
+        """Async variant of fill."""
+        added = 0
+        for lo, hi in self.missing(exchange_id, symbol, timeframe, start, end):
+            while lo < hi:
+                rows = await fetch(symbol, timeframe, lo, self.page_limit)
+                stored = self._store_page(exchange_id, symbol, timeframe, rows, lo, hi, on_page)
+                if stored is None:
+                    # No candles for the rest of the range (yet); leave it missing
+                    break
+                lo, count = stored
+                added += count
+        return added
+
+    def _store_page(
+        self,
+        exchange_id: str,
+        symbol: str,
+        timeframe: str,
+        rows: List[List[Any]],
+        lo: int,
+        hi: int,
+        on_page: Optional[PageCallback],
+    ) -> Optional[Tuple[int, int]]:
+        # Store one page fetched from lo; return where the next page starts and
+        # the rows added, or None if the page had no candles in [lo, hi)
+        last = max((row[0] for row in rows if lo <= row[0] < hi), default=None)
+        if last is None:
+            # An empty page may be transient or an exchange ignoring since, so
+            # it is not evidence that the range has no candles
+            if on_page is not None:
+                on_page(lo, lo, 0)
+            return None
+        # Candles missing before the last one returned are gaps
+        page_end = min(hi, last + timeframe_ms(timeframe))
+        with self._lock:
+            series = self._get(exchange_id, symbol, timeframe)
+            added = self._append_missing(series, rows, lo, page_end)
+        if on_page is not None:
+            on_page(lo, page_end, added)
+        return page_end, added
@@ -0,0 +1,264 @@
+"""core/circuit.py
+
+Circuit breakers for the MockX Gateway.
+
+When a backend degrades, waiting for every request to time out piles up
+threads and latency. A circuit breaker counts consecutive transport
+failures per backend and endpoint class and, once a threshold is reached,
+fails calls immediately with ExchangeNotAvailable until a probe shows the
+backend has recovered.
+"""
+
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+from .endpoints import MARKET_DATA, ORDERS, endpoint_class
+from .errors import LOCAL_ERRORS, ExchangeNotAvailable, NetworkError
+
+T = TypeVar("T")
+
+# Breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with half-open probes.
+
+    - **closed**: calls pass through; each transport failure (NetworkError:
+      timeouts, connection errors, 5xx unavailability, throttling) increments
+      a counter, each success resets it. Reaching ``failure_threshold``
+      opens the circuit.
+    - **open**: calls fail immediately with ExchangeNotAvailable for
+      ``recovery_timeout`` seconds.
+    - **half_open**: up to ``half_open_max_calls`` probe calls are let
+      through; a successful probe closes the circuit, a failed one opens it
+      again. Other calls keep failing fast while the probes run.
+
+    Business errors (BadRequest, InsufficientFunds, ...) mean the backend
+    answered, so they count as successes. Errors raised before a request is
+    sent (a spent deadline, an exhausted client-side rate limit budget) and
+    cancellation count as neither; they only free a half-open probe slot.
+
+    Attributes:
+        name: Label used in error messages and stats
+        failure_threshold: Consecutive failures that open the circuit
+        recovery_timeout: Seconds to stay open before probing
+        half_open_max_calls: Concurrent probes allowed while half-open
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        failure_threshold: int = 5,
+        recovery_timeout: float = 5.0,
+        half_open_max_calls: int = 1,
+    ):
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError("failure_threshold and half_open_max_calls must be >= 1")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self.times_opened = 0
+        self.rejected = 0
+
+    def _current_state(self, now: float) -> str:
+        # Must hold the lock; moves open -> half_open once the timeout elapsed
+        if self._state == OPEN and now - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    @property
+    def state(self) -> str:
+        """Return "closed", "open" or "half_open"."""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Check, without side effects, whether a call would currently pass."""
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            return state == CLOSED or (
+                state == HALF_OPEN and self._probes < self.half_open_max_calls
+            )
+
+    def before_call(self) -> None:
+        """Admit a call or raise ExchangeNotAvailable if the circuit is open."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return
+            self.rejected += 1
+            retry_in = max(0.0, self.recovery_timeout - (now - self._opened_at))
+        raise ExchangeNotAvailable(
+            f"Circuit open for {self.name or 'backend'}; retry in {retry_in:.1f}s"
+        )
+
+    def on_success(self) -> None:
+        """Record a call that reached the backend."""
+        with self._lock:
+            self._failures = 0
+            if self._state == HALF_OPEN:
+                self._state = CLOSED
+
+    def on_failure(self) -> None:
+        """Record a transport failure."""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self.times_opened += 1
+
+    def on_neutral(self) -> None:
+        """Record a call that ended without reaching the backend."""
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def _record(self, error: BaseException, failure_on: Tuple[Type[BaseException], ...]) -> None:
+        if isinstance(error, LOCAL_ERRORS) or not isinstance(error, Exception):
+            self.on_neutral()
+        elif isinstance(error, (NetworkError,) + failure_on):
+            self.on_failure()
+        else:
+            self.on_success()
+
+    def call(self, func: Callable[[], T], failure_on: Tuple[Type[BaseException], ...] = ()) -> T:
+        """Call func through the breaker.
+
+        Args:
+            func: Zero-argument callable to invoke
+            failure_on: Extra exception types that count as transport failures
+        """
+        self.before_call()
+        try:
+            result = func()
+        except BaseException as e:
+            # Includes cancellation, which must not leave a probe slot taken
+            self._record(e, failure_on)
+            raise
+        self.on_success()
+        return result
+
+    async def call_async(
+        self,
+        func: Callable[[], Awaitable[T]],
+        failure_on: Tuple[Type[BaseException], ...] = (),
+    ) -> T:
+        """Async variant of call."""
+        self.before_call()
+        try:
+            result = await func()
+        except BaseException as e:
+            # Includes cancellation, which must not leave a probe slot taken
+            self._record(e, failure_on)
+            raise
+        self.on_success()
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return state and counters."""
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            retry_in = (
+                max(0.0, self.recovery_timeout - (now - self._opened_at)) if state == OPEN else 0.0
+            )
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+                "retry_in": round(retry_in, 3),
+            }
+
+
+class CircuitBreakers:
+    """One CircuitBreaker per endpoint class for a backend.
+
+    Order endpoints and market-data endpoints trip independently, so a
+    failing order path does not block price reads and vice versa.
+    """
+
+    def __init__(self, name: str = "", **options: Any):
+        self.name = name
+        self.breakers: Dict[str, CircuitBreaker] = {
+            cls: CircuitBreaker(f"{name} {cls}".strip(), **options) for cls in (ORDERS, MARKET_DATA)
+        }
+
+    def for_endpoint(self, endpoint: str) -> CircuitBreaker:
+        """Return the breaker guarding an endpoint (unified method name)."""
+        return self.breakers[endpoint_class(endpoint)]
+
+    def allow_request(self, endpoint: str) -> bool:
+        """Check whether a call to endpoint would currently pass."""
+        return self.for_endpoint(endpoint).allow_request()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return stats per endpoint class."""
+        return {cls: breaker.stats() for cls, breaker in self.breakers.items()}
+
+
+class CircuitBreakerRegistry:
+    """Process-wide registry of circuit breakers keyed by backend.
+
+    Every gateway talking to the same backend (MockExchange URL or ccxt
+    exchange) shares its breakers, so one gateway's failures protect the
+    others. The first gateway for a backend sets the options.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreakers] = {}
+
+    def get(self, key: str, **options: Any) -> CircuitBreakers:
+        """Return the breakers for key, creating them with options if needed."""
+        with self._lock:
+            breakers = self._breakers.get(key)
+            if breakers is None:
+                breakers = self._breakers[key] = CircuitBreakers(key, **options)
+            return breakers
+
+    def remove(self, key: str) -> None:
+        """Forget the breakers for key."""
+        with self._lock:
+            self._breakers.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return stats for every backend."""
+        with self._lock:
+            items = list(self._breakers.items())
+        return {key: breakers.stats() for key, breakers in items}
+
+
+# Global circuit breaker registry instance
+_circuit_breaker_registry: Optional[CircuitBreakerRegistry] = None
+_circuit_breaker_registry_lock = threading.Lock()
+
+
+def get_circuit_breaker_registry() -> CircuitBreakerRegistry:
+    """Get the global circuit breaker registry instance."""
+    global _circuit_breaker_registry
+
+    if _circuit_breaker_registry is None:
+        with _circuit_breaker_registry_lock:
+            if _circuit_breaker_registry is None:
+                _circuit_breaker_registry = CircuitBreakerRegistry()
+
+    return _circuit_breaker_registry
@@ -0,0 +1,86 @@
+"""core/deadline.py
+
+Context-scoped deadlines for gateway calls.
+
+A deadline is an absolute point in time stored in a context variable. The
+HTTP layer shrinks socket timeouts to the time left, the retry engine and
+rate limiter never wait past it, and calls whose budget is already spent
+fail immediately with RequestTimeout (DeadlineExceeded) instead of being sent.
+
+Usage:
+    >>> with gateway.deadline(0.2):
+    ...     ticker = gateway.fetch_ticker("BTC/USDT")
+    ...     orders = gateway.fetch_open_orders("BTC/USDT")
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from .errors import DeadlineExceeded
+
+T = TypeVar("T")
+
+# Absolute time.monotonic() value by which the current work must finish
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "mockx_deadline", default=None
+)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """Run the enclosed calls with at most seconds of budget.
+
+    Nested deadlines can only shorten the budget, never extend it.
+    Yields the absolute monotonic deadline.
+    """
+    at = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        at = min(at, outer)
+    token = _deadline.set(at)
+    try:
+        yield at
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Return the seconds left in the current deadline (None if there is none)."""
+    at = _deadline.get()
+    if at is None:
+        return None
+    return at - time.monotonic()
+
+
+def check_deadline(operation: str = "call") -> Optional[float]:
+    """Return the seconds left, raising DeadlineExceeded if the budget is spent."""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded(f"Deadline exceeded before {operation}")
+    return left
+
+
+def bound_timeout(timeout: Optional[float]) -> Optional[float]:
+    """Shrink a timeout in seconds to the time left in the current deadline."""
+    left = remaining()
+    if left is None:
+        return timeout
+    left = max(left, 0.001)
+    return left if timeout is None else min(timeout, left)
+
+
+def bind_context(func: Callable[..., T]) -> Callable[..., T]:
+    """Wrap func so it runs in a copy of the caller's context.
+
+    Thread pools do not inherit context variables; wrap work items with
+    this before submitting them so deadlines follow the work.
+    """
+    context = contextvars.copy_context()
+
+    def run(*args: Any, **kwargs: Any) -> T:
+        # A context can only be entered by one thread at a time, so copy it per call
+        return context.copy().run(func, *args, **kwargs)
+
+    return run
@@ -0,0 +1,68 @@
+"""core/endpoints.py
+
+Endpoint naming and classification.
+
+Rate limiting and other per-endpoint policies need a stable name for each
+backend call. Production calls are already named by their ccxt method; this
+module maps MockExchange HTTP routes to the same unified method names so
+both modes share one vocabulary, and sorts every endpoint into an
+endpoint class (order placement vs. everything else).
+"""
+
+import re
+from typing import List, Tuple
+
+# Endpoint classes
+ORDERS = "orders"
+MARKET_DATA = "market_data"
+
+# Methods that place, amend or cancel orders and count against the order budget
+ORDER_METHODS = frozenset(
+    {
+        "create_order",
+        "create_orders",
+        "edit_order",
+        "cancel_order",
+        "cancel_orders",
+        "cancel_all_orders",
+    }
+)
+
+# (HTTP method, path pattern, unified method name), first match wins
+_PAPER_ROUTES: List[Tuple[str, "re.Pattern[str]", str]] = [
+    ("GET", re.compile(r"^/tickers$"), "load_markets"),
+    ("GET", re.compile(r"^/tickers/[^,]+$"), "fetch_ticker"),
+    ("GET", re.compile(r"^/tickers/.+$"), "fetch_tickers"),
+    ("GET", re.compile(r"^/balance$"), "fetch_balance"),
+    ("GET", re.compile(r"^/balance/list$"), "fetch_balance_list"),
+    ("POST", re.compile(r"^/balance/[^/]+/deposit$"), "deposit"),
+    ("POST", re.compile(r"^/balance/[^/]+/withdrawal$"), "withdraw"),
+    ("POST", re.compile(r"^/orders/can_execute$"), "can_execute_order"),
+    ("POST", re.compile(r"^/orders$"), "create_order"),
+    ("POST", re.compile(r"^/orders/[^/]+/cancel$"), "cancel_order"),
+    ("GET", re.compile(r"^/orders$"), "fetch_orders"),
+    ("GET", re.compile(r"^/orders/list$"), "fetch_order_ids"),
+    ("GET", re.compile(r"^/orders/[^/]+$"), "fetch_order"),
+]
+
+
+def paper_endpoint(method: str, path: str) -> str:
+    """Return the unified method name for a MockExchange request.
+
+    Unknown routes are named ``"<METHOD> <path>"``.
+    """
+    method = method.upper()
+    path = path.split("?", 1)[0]
+    for route_method, pattern, name in _PAPER_ROUTES:
+        if route_method == method and pattern.match(path):
+            return name
+    return f"{method} {path}"
+
+
+def endpoint_class(endpoint: str) -> str:
+    """Return ORDERS for order placement/cancellation, MARKET_DATA otherwise.
+
+    MARKET_DATA is the general request budget: it covers market data as well
+    as account reads such as balances and order queries.
+    """
+    return ORDERS if endpoint in ORDER_METHODS else MARKET_DATA
@@ -191,6 +191,24 @@ class RequestTimeout(NetworkError):
     pass
 
 
+class DeadlineExceeded(RequestTimeout):
+    """Deadline spent before a request was sent (raised locally)."""
+
+    pass
+
+
+class RateLimitBudgetExceeded(RateLimitExceeded):
+    """Client-side rate limiter would wait longer than allowed (raised locally)."""
+
+    pass
+
+
+# Raised locally before anything is sent: they say nothing about the backend
+# and repeating the call cannot succeed, so they are neither retried nor
+# counted by circuit breakers
+LOCAL_ERRORS = (DeadlineExceeded, RateLimitBudgetExceeded)
+
+
 class ErrorMapper:
     """Map MockExchange errors to CCXT-style errors."""
 
@@ -6,11 +6,24 @@ This module provides the main interface that mirrors CCXT's API,
 delegating calls to the appropriate adapter based on the current mode.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, ContextManager, Dict, List, Optional, Sequence
 
+from ..adapters.columnar import Columns, check_ohlcv_format, ohlcv_to_array
+from ..adapters.mapping import PartialDict
 from ..adapters.paper import PaperAdapter
+from ..config.symbols import normalize_symbol
+from ..core.backfill import BackfillProgress, ProgressCallback, backfill
+from ..core.batch import BatchResult
+from ..core.cache import TickerCache
+from ..core.calllog import CallLog
+from ..core.candles import CandleStore, timeframe_ms
 from ..core.capabilities import get_has_dict, require_support
-from ..core.errors import NotSupported
+from ..core.deadline import deadline as call_deadline
+from ..core.errors import NotSupported, OrderNotFound
+from ..core.instrument import instrumented
+from ..core.orders import ClientOrderTable, with_client_order_id
+from ..core.singleflight import SingleFlight
+from ..core.tracing import SpanFactory
 
 
 class MockXGateway:
@@ -32,9 +45,39 @@ class MockXGateway:
     code changes required when switching between modes.
     """
 
-    def __init__(self, adapter):
-        """Initialize the gateway with an adapter."""
+    def __init__(
+        self,
+        adapter,
+        ticker_cache: Optional[TickerCache] = None,
+        client_orders: Optional[ClientOrderTable] = None,
+        call_log: Optional[CallLog] = None,
+        candle_store: Optional[CandleStore] = None,
+    ):
+        """Initialize the gateway with an adapter.
+
+        Args:
+            adapter: Backend adapter (PaperAdapter or ProdAdapter)
+            ticker_cache: Optional TickerCache placed in front of
+                fetch_ticker/fetch_tickers (disabled by default)
+            client_orders: Optional ClientOrderTable; when set, every order
+                gets a client order id and duplicate submissions are answered
+                from the table (disabled by default)
+            call_log: Optional CallLog recording recent and slow calls
+                (disabled by default)
+            candle_store: Optional CandleStore that fetch_ohlcv reads closed
+                candles from and fills (disabled by default)
+        """
         self._adapter = adapter
+        self._ticker_cache = ticker_cache
+        self._client_orders = client_orders
+        # Concurrent submissions with the same client order id share one request
+        self._submissions = SingleFlight()
+        # Span factory set by set_tracer (None disables tracing)
+        self._tracer: Optional[SpanFactory] = None
+        # Recent and slow calls (None disables the call log)
+        self._call_log = call_log
+        # Closed candles kept on disk for fetch_ohlcv (None disables the store)
+        self._candle_store = candle_store
 
         # Determine mode based on adapter type
 
@@ -47,6 +90,16 @@ class MockXGateway:
         self._has = get_has_dict(mode)
         self._markets = {}
 
+    @property
+    def mode(self) -> str:
+        """Get the backend mode: "paper" or "prod"."""
+        return self._mode
+
+    @property
+    def exchange_id(self) -> str:
+        """Get the backend exchange id ("mockexchange" in paper mode)."""
+        return getattr(self._adapter, "exchange_id", "mockexchange")
+
     @property
     def has(self) -> Dict[str, bool]:
         """Get capabilities dict (CCXT-style).
@@ -78,6 +131,7 @@ class MockXGateway:
         return self._markets.get(symbol, {})
 
     # Market data methods
+    @instrumented
     def load_markets(self, reload: bool = False) -> Dict[str, Any]:
         """Load and cache markets.
 
@@ -103,30 +157,277 @@ class MockXGateway:
         """Fetch all markets."""
         return self.load_markets()
 
-    def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
-        """Fetch ticker for a symbol."""
-        return self._adapter.fetch_ticker(symbol)
+    @instrumented
+    def fetch_ticker(self, symbol: str, max_age_ms: Optional[int] = None) -> Dict[str, Any]:
+        """Fetch ticker for a symbol.
+
+        When a ticker cache is configured, a cached ticker younger than
+        max_age_ms (or the cache's ttl_ms) is returned without a backend call.
+
+        Args:
+            symbol: Trading pair symbol (e.g., "BTC/USDT")
+            max_age_ms: Maximum acceptable age of a cached ticker; 0 forces a fetch
+        """
+        cache = self._ticker_cache
+        if cache is None:
+            return self._adapter.fetch_ticker(symbol)
+
+        key = normalize_symbol(symbol, self._mode)
+        ticker = cache.get(key, max_age_ms)
+        if ticker is None:
+            ticker = self._adapter.fetch_ticker(symbol)
+            cache.put(key, ticker)
+        return ticker
+
+    @instrumented
+    def fetch_tickers(
+        self, symbols: Optional[List[str]] = None, max_age_ms: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Fetch tickers for multiple symbols.
+
+        When a ticker cache is configured, only symbols without a fresh
+        cached ticker are fetched, and every ticker in the response refreshes
+        the cache. Calls without symbols always hit the backend.
+
+        Args:
+            symbols: Symbols to fetch (all available symbols if None)
+            max_age_ms: Maximum acceptable age of a cached ticker
+        """
+        cache = self._ticker_cache
+        if cache is None:
+            return self._adapter.fetch_tickers(symbols)
+
+        result = PartialDict()
+        missing = symbols
+        if symbols:
+            missing = []
+            for symbol in symbols:
+                key = normalize_symbol(symbol, self._mode)
+                ticker = cache.get(key, max_age_ms)
+                if ticker is None:
+                    missing.append(symbol)
+                else:
+                    result[key] = ticker
+            if not missing:
+                return result
+
+        fetched = self._adapter.fetch_tickers(missing)
+        cache.put_many(fetched.items())
+        result.update(fetched)
+        result.skipped.update(getattr(fetched, "skipped", {}))
+        return result
+
+    @instrumented
+    def fetch_tickers_columnar(
+        self, symbols: Optional[List[str]] = None, backend: str = "auto"
+    ) -> Columns:
+        """Fetch tickers as columns instead of one dict per ticker.
+
+        Returns a Columns dict of symbol, bid, ask, last, bidVolume, askVolume
+        and timestamp arrays; symbols whose request failed are in ``skipped``.
+        Always hits the backend (the ticker cache holds per-symbol dicts).
+
+        Args:
+            symbols: Symbols to fetch (all available symbols if None)
+            backend: "numpy", "array" (stdlib array.array) or "auto" (NumPy if installed)
+        """
+        return self._adapter.fetch_tickers_columnar(symbols, backend)
+
+    @property
+    def ticker_cache(self) -> Optional[TickerCache]:
+        """The configured ticker cache, or None if caching is disabled."""
+        return self._ticker_cache
+
+    def ticker_cache_stats(self) -> Dict[str, Any]:
+        """Return ticker cache hit/miss counters (empty dict if disabled)."""
+        if self._ticker_cache is None:
+            return {}
+        return self._ticker_cache.stats()
+
+    def client_order_stats(self) -> Dict[str, Any]:
+        """Return client order table counters (empty dict if disabled)."""
+        if self._client_orders is None:
+            return {}
+        return self._client_orders.stats()
+
+    def rate_limit_stats(self) -> Dict[str, Any]:
+        """Return rate limiter budgets and wait counters (empty dict if disabled)."""
+        limiter = getattr(self._adapter, "rate_limiter", None)
+        if limiter is None:
+            return {}
+        return limiter.stats()
+
+    def circuit_stats(self) -> Dict[str, Any]:
+        """Return circuit breaker state per endpoint class (empty dict if disabled)."""
+        breakers = getattr(self._adapter, "circuit_breakers", None)
+        if breakers is None:
+            return {}
+        return breakers.stats()
+
+    def is_available(self, method: str) -> bool:
+        """Check whether calls to a gateway method would currently reach the backend.
+
+        Returns False while the circuit for the method's endpoint class is
+        open, so callers can shed load instead of waiting for an error.
+        """
+        breakers = getattr(self._adapter, "circuit_breakers", None)
+        return breakers is None or breakers.allow_request(method)
+
+    def hedge_stats(self) -> Dict[str, Any]:
+        """Return hedged read counters and delays (empty dict if disabled)."""
+        policy = getattr(self._adapter, "hedge_policy", None)
+        if policy is None:
+            return {}
+        return policy.stats()
+
+    def retry_stats(self) -> Dict[str, Any]:
+        """Return retry counters (empty dict if retries are disabled)."""
+        policy = getattr(self._adapter, "retry_policy", None)
+        if policy is None:
+            return {}
+        return policy.stats()
+
+    def stats(
+        self, reset: bool = False, buckets: Optional[Sequence[float]] = None
+    ) -> Dict[str, Any]:
+        """Return per-endpoint call counts, errors, bytes and latency histograms.
+
+        ``reset=True`` returns the current window and atomically starts a new
+        one, so periodic scrapes see disjoint intervals. ``buckets`` (seconds)
+        adds cumulative histogram counts for fixed-bucket exporters. Returns
+        an empty dict if stats are disabled.
+        """
+        collector = getattr(self._adapter, "stats", None)
+        if collector is None:
+            return {}
+        return collector.snapshot(reset, buckets)
 
-    def fetch_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Any]:
-        """Fetch tickers for multiple symbols."""
-        return self._adapter.fetch_tickers(symbols)
+    def recent_calls(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the most recent gateway calls, newest first (empty if disabled).
 
+        Each call has its method, argument summary, start time, duration,
+        outcome and time per phase (rate_limit, connect, server, decode, map,
+        backoff).
+        """
+        if self._call_log is None:
+            return []
+        return self._call_log.recent_calls(limit)
+
+    def slow_calls(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the most recent calls slower than the slow-call threshold."""
+        if self._call_log is None:
+            return []
+        return self._call_log.slow_calls(limit)
+
+    def set_tracer(self, tracer: Optional[SpanFactory]) -> None:
+        """Trace gateway methods, backend requests and mappings (None disables).
+
+        See core.tracing for the tracer protocol and the spans produced.
+        """
+        self._tracer = tracer
+        if hasattr(self._adapter, "tracer"):
+            self._adapter.tracer = tracer
+
+    def deadline(self, seconds: float) -> ContextManager[float]:
+        """Bound every call made inside the with-block to seconds in total.
+
+        Socket timeouts shrink to the time left, retries and rate-limit waits
+        stop at the deadline, and calls started after it fail immediately
+        with RequestTimeout. Nested deadlines can only shorten the budget.
+        """
+        return call_deadline(seconds)
+
+    @instrumented
     def fetch_ohlcv(
         self,
         symbol: str,
         timeframe: str = "1m",
         since: Optional[int] = None,
         limit: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
-        """Fetch OHLCV data."""
+        format: str = "list",
+    ) -> Any:
+        """Fetch OHLCV data.
+
+        Args:
+            format: "list" (ccxt's list of [timestamp, open, high, low, close,
+                volume] rows), "numpy" (one (n, 6) float64 array), "structured"
+                (NumPy record array with an int64 timestamp) or "array" (flat
+                stdlib array.array); see adapters.columnar.ohlcv_to_array
+
+        With a candle store and since set, closed candles are read from the
+        store and only the ranges it lacks are fetched (all of them up to the
+        last closed candle when limit is None); see core.candles.
+        """
         require_support("fetch_ohlcv", self._mode)
-        return self._adapter.fetch_ohlcv(symbol, timeframe, since, limit)
+        check_ohlcv_format(format)
+        store = self._candle_store
+        if store is None or since is None:
+            rows = self._adapter.fetch_ohlcv(symbol, timeframe, since, limit)
+            return ohlcv_to_array(rows, format)
+
+        symbol = normalize_symbol(symbol, self._mode)
+        start, end = store.window(timeframe, since, limit)
+        store.fill(self._adapter.fetch_ohlcv, self.exchange_id, symbol, timeframe, start, end)
+        return store.read(self.exchange_id, symbol, timeframe, start, end, format)
+
+    @instrumented
+    def backfill_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str = "1m",
+        since: int = 0,
+        until: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        window: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> BackfillProgress:
+        """Load closed candles from since to until into the candle store.
+
+        The missing part of the range is split into windows fetched
+        concurrently (see core.backfill); read the result with
+        ``fetch_ohlcv(..., since=...)``. Calling it again after an
+        interruption only fetches what is still missing.
+
+        Args:
+            since: Start of the range (ms; default: the exchange's first candle)
+            until: End of the range (ms, exclusive; default: the last closed candle)
+            max_concurrency: Windows fetched at once (default 8)
+            window: Candles per window (default: about one window per worker)
+            on_progress: Called with the BackfillProgress after every page
 
+        Raises:
+            NotSupported: If the gateway has no candle store
+        """
+        require_support("fetch_ohlcv", self._mode)
+        store = self._candle_store
+        if store is None:
+            raise NotSupported("backfill_ohlcv needs a candle store (candle_store=...)")
+
+        symbol = normalize_symbol(symbol, self._mode)
+        start, end = store.window(timeframe, since)
+        if until is not None:
+            tf = timeframe_ms(timeframe)
+            end = max(start, min(end, -(-until // tf) * tf))
+        return backfill(
+            store,
+            self._adapter.fetch_ohlcv,
+            self.exchange_id,
+            symbol,
+            timeframe,
+            start,
+            end,
+            max_concurrency,
+            window,
+            on_progress,
+        )
+
+    @instrumented
     def fetch_order_book(self, symbol: str, limit: Optional[int] = None) -> Dict[str, Any]:
         """Fetch order book."""
         require_support("fetch_order_book", self._mode)
         return self._adapter.fetch_order_book(symbol, limit)
 
+    @instrumented
     def fetch_trades(
         self, symbol: str, since: Optional[int] = None, limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
@@ -135,6 +436,7 @@ class MockXGateway:
         return self._adapter.fetch_trades(symbol, since, limit)
 
     # Balance methods
+    @instrumented
     def fetch_balance(self, asset: Optional[str] = None) -> Dict[str, Any]:
         """Fetch account balance.
 
@@ -143,6 +445,7 @@ class MockXGateway:
         """
         return self._adapter.fetch_balance(asset)
 
+    @instrumented
     def fetch_balance_list(self) -> Dict[str, Any]:
         """Fetch list of assets with balances."""
         if self._mode != "paper":
@@ -150,6 +453,7 @@ class MockXGateway:
         return self._adapter.fetch_balance_list()
 
     # MockExchange-specific methods (not part of CCXT standard)
+    @instrumented
     def deposit(
         self, asset: str, amount: float, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -158,6 +462,7 @@ class MockXGateway:
             raise NotSupported("deposit is only available in paper mode (MockExchange).")
         return self._adapter.deposit(asset, amount, params)
 
+    @instrumented
     def withdraw(
         self, asset: str, amount: float, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -166,6 +471,7 @@ class MockXGateway:
             raise NotSupported("withdraw is only available in paper mode (MockExchange).")
         return self._adapter.withdraw(asset, amount, params)
 
+    @instrumented
     def can_execute_order(
         self,
         symbol: str,
@@ -180,12 +486,14 @@ class MockXGateway:
             raise NotSupported("can_execute_order is only available in paper mode (MockExchange).")
         return self._adapter.can_execute_order(symbol, type, side, amount, price, params)
 
+    @instrumented
     def fetch_positions(self, symbols: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Fetch open positions."""
         require_support("fetch_positions", self._mode)
         return self._adapter.fetch_positions(symbols)
 
     # Order methods
+    @instrumented
     def create_order(
         self,
         symbol: str,
@@ -220,12 +528,103 @@ class MockXGateway:
             InvalidOrder: If order parameters are invalid
             NotSupported: If order type is not supported
         """
-        return self._adapter.create_order(symbol, type, side, amount, price, params)
+        if self._client_orders is None:
+            return self._adapter.create_order(symbol, type, side, amount, price, params)
+
+        client_id, params = with_client_order_id(params)
+        return self._submissions.do(
+            client_id,
+            lambda: self._submit_order(client_id, symbol, type, side, amount, price, params),
+        )
+
+    def _submit_order(
+        self,
+        client_id: str,
+        symbol: str,
+        type: str,
+        side: str,
+        amount: float,
+        price: Optional[float],
+        params: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Place an order once per client order id."""
+        known = self._client_orders.get(client_id)
+        if known is not None:
+            self._client_orders.count_duplicate()
+            return known
+
+        order = self._adapter.create_order(symbol, type, side, amount, price, params)
+        self._client_orders.record(client_id, order)
+        return order
+
+    @instrumented
+    def create_orders(
+        self, orders: List[Dict[str, Any]], max_concurrency: Optional[int] = None
+    ) -> List[BatchResult]:
+        """Create several orders at once.
+
+        Orders are sent concurrently with at most max_concurrency requests in
+        flight. In production mode the exchange's native batch endpoint is
+        used when it has one. A failing order does not stop the others.
+
+        Args:
+            orders: Order specs, each a dict with ``symbol``, ``type``, ``side``,
+                ``amount`` and optional ``price`` and ``params``
+            max_concurrency: Maximum requests in flight (default 8)
+
+        Returns:
+            List[BatchResult]: One result per order spec, in input order. Each
+            carries either the created order (``result``) or the exception
+            raised for that order (``error``).
+        """
+        if self._client_orders is None:
+            return self._adapter.create_orders(orders, max_concurrency)
+
+        results: List[BatchResult] = [BatchResult(i) for i in range(len(orders))]
+        pending, positions, client_ids = [], [], []
+        for i, spec in enumerate(orders):
+            client_id, params = with_client_order_id(spec.get("params"))
+            known = self._client_orders.get(client_id)
+            if known is not None:
+                self._client_orders.count_duplicate()
+                results[i].result = known
+                continue
+            pending.append({**spec, "params": params})
+            positions.append(i)
+            client_ids.append(client_id)
+
+        for position, client_id, outcome in zip(
+            positions, client_ids, self._adapter.create_orders(pending, max_concurrency)
+        ):
+            if outcome.ok:
+                self._client_orders.record(client_id, outcome.result)
+            results[position].result = outcome.result
+            results[position].error = outcome.error
+        return results
+
+    @instrumented
+    def fetch_order_by_client_id(
+        self, client_order_id: str, symbol: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Fetch an order placed by this gateway by its client order id.
+
+        The exchange order id is looked up in the client order table, so no
+        order history scan is needed.
+
+        Raises:
+            OrderNotFound: If this gateway has no record of the client order id
+        """
+        order_id = self._client_orders.exchange_id(client_order_id) if self._client_orders else None
+        if order_id is None:
+            raise OrderNotFound(f"Unknown client order id: {client_order_id}")
+        return self._adapter.fetch_order(order_id, symbol)
 
+    @instrumented
     def fetch_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Fetch a specific order."""
         return self._adapter.fetch_order(order_id, symbol)
 
+    @instrumented
     def fetch_orders(
         self,
         symbol: Optional[str] = None,
@@ -236,6 +635,27 @@ class MockXGateway:
         """Fetch orders."""
         return self._adapter.fetch_orders(symbol, since, limit, params)
 
+    @instrumented
+    def fetch_orders_columnar(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+        backend: str = "auto",
+    ) -> Columns:
+        """Fetch orders as columns instead of one dict per order.
+
+        Returns a Columns dict of id, symbol, side, type, status (strings) and
+        price, amount, filled, remaining, cost (float64) and timestamp (int64)
+        arrays; see adapters.columnar.
+
+        Args:
+            backend: "numpy", "array" (stdlib array.array) or "auto" (NumPy if installed)
+        """
+        return self._adapter.fetch_orders_columnar(symbol, since, limit, params, backend)
+
+    @instrumented
     def fetch_open_orders(
         self,
         symbol: Optional[str] = None,
@@ -246,10 +666,27 @@ class MockXGateway:
         """Fetch open orders."""
         return self._adapter.fetch_open_orders(symbol, since, limit, params)
 
+    @instrumented
     def cancel_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Cancel an order."""
         return self._adapter.cancel_order(order_id, symbol)
 
+    @instrumented
+    def cancel_orders(
+        self,
+        order_ids: List[str],
+        symbol: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[BatchResult]:
+        """Cancel several orders at once.
+
+        Works like create_orders: cancellations run concurrently (or through
+        the exchange's native batch endpoint when a symbol is given) and the
+        returned list holds one BatchResult per order id, in input order.
+        """
+        return self._adapter.cancel_orders(order_ids, symbol, max_concurrency)
+
+    @instrumented
     def fetch_my_trades(
         self,
         symbol: Optional[str] = None,
@@ -261,21 +698,25 @@ class MockXGateway:
         return self._adapter.fetch_my_trades(symbol, since, limit, params)
 
     # Advanced features (production mode only)
+    @instrumented
     def fetch_leverage(self, symbol: str) -> Dict[str, Any]:
         """Fetch current leverage."""
         require_support("fetch_leverage", self._mode)
         return self._adapter.fetch_leverage(symbol)
 
+    @instrumented
     def set_leverage(self, leverage: int, symbol: Optional[str] = None) -> Dict[str, Any]:
         """Set leverage."""
         require_support("set_leverage", self._mode)
         return self._adapter.set_leverage(leverage, symbol)
 
+    @instrumented
     def fetch_funding_rate(self, symbol: str) -> Dict[str, Any]:
         """Fetch funding rate."""
         require_support("fetch_funding_rate", self._mode)
         return self._adapter.fetch_funding_rate(symbol)
 
+    @instrumented
     def fetch_funding_history(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
         """Fetch funding history."""
         require_support("fetch_funding_history", self._mode)
@@ -303,6 +744,12 @@ class MockXGateway:
         """Create a limit order."""
         return self.create_order(symbol, "limit", side, amount, price, params)
 
+    def pool_stats(self) -> Dict[str, Any]:
+        """Return HTTP connection pool statistics (paper mode only)."""
+        if self._mode != "paper":
+            raise NotSupported("pool_stats is only available in paper mode (MockExchange).")
+        return self._adapter.pool_stats()
+
     # Utility methods
     def close(self) -> None:
         """Close the gateway and clean up resources."""
@@ -0,0 +1,604 @@
+"""core/facade_async.py
+
+Asyncio CCXT-compatible facade for the MockX Gateway.
+
+This module provides the coroutine counterpart of MockXGateway, delegating
+calls to an async adapter based on the current mode.
+"""
+
+from typing import Any, ContextManager, Dict, List, Optional, Sequence
+
+from ..adapters.columnar import Columns, check_ohlcv_format, ohlcv_to_array
+from ..adapters.paper_async import AsyncPaperAdapter
+from ..config.symbols import normalize_symbol
+from ..core.backfill import BackfillProgress, ProgressCallback, backfill_async
+from ..core.batch import BatchResult
+from ..core.calllog import CallLog
+from ..core.candles import CandleStore, timeframe_ms
+from ..core.capabilities import get_has_dict, require_support
+from ..core.deadline import deadline as call_deadline
+from ..core.errors import NotSupported, OrderNotFound
+from ..core.instrument import instrumented_async
+from ..core.orders import ClientOrderTable, with_client_order_id
+from ..core.singleflight import AsyncSingleFlight
+from ..core.tracing import SpanFactory
+
+
+class AsyncMockXGateway:
+    """Asyncio CCXT-compatible gateway facade.
+
+    This class mirrors the MockXGateway surface with coroutines. Every method
+    that talks to a backend is awaitable, while capability checks, mode
+    detection and error types are identical to the sync gateway.
+
+    A single AsyncMockXGateway can serve hundreds of concurrent calls from
+    one event loop; they all share the adapter's connection pool:
+
+        >>> async with ExchangeFactory.create_async_paper_gateway() as gateway:
+        ...     tickers = await asyncio.gather(
+        ...         *(gateway.fetch_ticker(s) for s in symbols)
+        ...     )
+    """
+
+    def __init__(
+        self,
+        adapter,
+        client_orders: Optional[ClientOrderTable] = None,
+        call_log: Optional[CallLog] = None,
+        candle_store: Optional[CandleStore] = None,
+    ):
+        """Initialize the gateway with an async adapter.
+
+        Args:
+            adapter: Async backend adapter
+            client_orders: Optional ClientOrderTable (see MockXGateway)
+            call_log: Optional CallLog (see MockXGateway)
+            candle_store: Optional CandleStore (see MockXGateway)
+        """
+        self._adapter = adapter
+        self._client_orders = client_orders
+        # Concurrent submissions of one client order id share a single request
+        self._submissions = AsyncSingleFlight()
+        # Span factory set by set_tracer (None disables tracing)
+        self._tracer: Optional[SpanFactory] = None
+        # Recent and slow calls (None disables the call log)
+        self._call_log = call_log
+        # Closed candles kept on disk for fetch_ohlcv (None disables the store)
+        self._candle_store = candle_store
+
+        # Determine mode based on adapter type
+        if isinstance(adapter, AsyncPaperAdapter):
+            mode = "paper"
+        else:
+            mode = "prod"
+
+        self._mode = mode
+        self._has = get_has_dict(mode)
+        self._markets: Dict[str, Any] = {}
+
+    @property
+    def mode(self) -> str:
+        """Get the backend mode: "paper" or "prod"."""
+        return self._mode
+
+    @property
+    def exchange_id(self) -> str:
+        """Get the backend exchange id ("mockexchange" in paper mode)."""
+        return getattr(self._adapter, "exchange_id", "mockexchange")
+
+    @property
+    def has(self) -> Dict[str, bool]:
+        """Get capabilities dict (CCXT-style)."""
+        return self._has
+
+    @property
+    def markets(self) -> Dict[str, Any]:
+        """Get markets dict loaded by the last load_markets() call."""
+        return self._markets
+
+    def market(self, symbol: str) -> Dict[str, Any]:
+        """Get market info for a symbol from the loaded markets."""
+        return self._markets.get(symbol, {})
+
+    # Market data methods
+    @instrumented_async
+    async def load_markets(self, reload: bool = False) -> Dict[str, Any]:
+        """Load and cache markets."""
+        self._markets = await self._adapter.load_markets(reload)
+        return self._markets
+
+    async def fetch_markets(self) -> Dict[str, Any]:
+        """Fetch all markets."""
+        return await self.load_markets()
+
+    @instrumented_async
+    async def fetch_ticker(self, symbol: str) -> Dict[str, Any]:
+        """Fetch ticker for a symbol."""
+        return await self._adapter.fetch_ticker(symbol)
+
+    @instrumented_async
+    async def fetch_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Fetch tickers for multiple symbols."""
+        return await self._adapter.fetch_tickers(symbols)
+
+    @instrumented_async
+    async def fetch_tickers_columnar(
+        self, symbols: Optional[List[str]] = None, backend: str = "auto"
+    ) -> Columns:
+        """Fetch tickers as columns instead of one dict per ticker.
+
+        Returns a Columns dict of symbol, bid, ask, last, bidVolume, askVolume
+        and timestamp arrays; symbols whose request failed are in ``skipped``.
+
+        Args:
+            symbols: Symbols to fetch (all available symbols if None)
+            backend: "numpy", "array" (stdlib array.array) or "auto" (NumPy if installed)
+        """
+        return await self._adapter.fetch_tickers_columnar(symbols, backend)
+
+    @instrumented_async
+    async def fetch_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str = "1m",
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        format: str = "list",
+    ) -> Any:
+        """Fetch OHLCV data.
+
+        Args:
+            format: "list" (ccxt's list of [timestamp, open, high, low, close,
+                volume] rows), "numpy" (one (n, 6) float64 array), "structured"
+                (NumPy record array with an int64 timestamp) or "array" (flat
+                stdlib array.array); see adapters.columnar.ohlcv_to_array
+
+        With a candle store and since set, closed candles are read from the
+        store and only the ranges it lacks are fetched (all of them up to the
+        last closed candle when limit is None); see core.candles.
+        """
+        require_support("fetch_ohlcv", self._mode)
+        check_ohlcv_format(format)
+        store = self._candle_store
+        if store is None or since is None:
+            rows = await self._adapter.fetch_ohlcv(symbol, timeframe, since, limit)
+            return ohlcv_to_array(rows, format)
+
+        symbol = normalize_symbol(symbol, self._mode)
+        start, end = store.window(timeframe, since, limit)
+        await store.fill_async(
+            self._adapter.fetch_ohlcv, self.exchange_id, symbol, timeframe, start, end
+        )
+        return store.read(self.exchange_id, symbol, timeframe, start, end, format)
+
+    @instrumented_async
+    async def backfill_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str = "1m",
+        since: int = 0,
+        until: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        window: Optional[int] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> BackfillProgress:
+        """Load closed candles from since to until into the candle store.
+
+        The missing part of the range is split into windows fetched
+        concurrently (see core.backfill); read the result with
+        ``fetch_ohlcv(..., since=...)``. Calling it again after an
+        interruption only fetches what is still missing.
+
+        Args:
+            since: Start of the range (ms; default: the exchange's first candle)
+            until: End of the range (ms, exclusive; default: the last closed candle)
+            max_concurrency: Windows fetched at once (default 8)
+            window: Candles per window (default: about one window per worker)
+            on_progress: Called with the BackfillProgress after every page
+
+        Raises:
+            NotSupported: If the gateway has no candle store
+        """
+        require_support("fetch_ohlcv", self._mode)
+        store = self._candle_store
+        if store is None:
+            raise NotSupported("backfill_ohlcv needs a candle store (candle_store=...)")
+
+        symbol = normalize_symbol(symbol, self._mode)
+        start, end = store.window(timeframe, since)
+        if until is not None:
+            tf = timeframe_ms(timeframe)
+            end = max(start, min(end, -(-until // tf) * tf))
+        return await backfill_async(
+            store,
+            self._adapter.fetch_ohlcv,
+            self.exchange_id,
+            symbol,
+            timeframe,
+            start,
+            end,
+            max_concurrency,
+            window,
+            on_progress,
+        )
+
+    @instrumented_async
+    async def fetch_order_book(self, symbol: str, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Fetch order book."""
+        require_support("fetch_order_book", self._mode)
+        return await self._adapter.fetch_order_book(symbol, limit)
+
+    @instrumented_async
+    async def fetch_trades(
+        self, symbol: str, since: Optional[int] = None, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch public trades."""
+        require_support("fetch_trades", self._mode)
+        return await self._adapter.fetch_trades(symbol, since, limit)
+
+    # Balance methods
+    @instrumented_async
+    async def fetch_balance(self, asset: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch account balance."""
+        return await self._adapter.fetch_balance(asset)
+
+    @instrumented_async
+    async def fetch_balance_list(self) -> Dict[str, Any]:
+        """Fetch list of assets with balances."""
+        if self._mode != "paper":
+            raise NotSupported("fetch_balance_list is only available in paper mode (MockExchange).")
+        return await self._adapter.fetch_balance_list()
+
+    # MockExchange-specific methods (not part of CCXT standard)
+    @instrumented_async
+    async def deposit(
+        self, asset: str, amount: float, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Deposit asset to account (MockExchange-specific)."""
+        if self._mode != "paper":
+            raise NotSupported("deposit is only available in paper mode (MockExchange).")
+        return await self._adapter.deposit(asset, amount, params)
+
+    @instrumented_async
+    async def withdraw(
+        self, asset: str, amount: float, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Withdraw asset from account (MockExchange-specific)."""
+        if self._mode != "paper":
+            raise NotSupported("withdraw is only available in paper mode (MockExchange).")
+        return await self._adapter.withdraw(asset, amount, params)
+
+    @instrumented_async
+    async def can_execute_order(
+        self,
+        symbol: str,
+        type: str,
+        side: str,
+        amount: float,
+        price: Optional[float] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Check if an order can be executed (MockExchange-specific)."""
+        if self._mode != "paper":
+            raise NotSupported("can_execute_order is only available in paper mode (MockExchange).")
+        return await self._adapter.can_execute_order(symbol, type, side, amount, price, params)
+
+    @instrumented_async
+    async def fetch_positions(self, symbols: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Fetch open positions."""
+        require_support("fetch_positions", self._mode)
+        return await self._adapter.fetch_positions(symbols)
+
+    # Order methods
+    @instrumented_async
+    async def create_order(
+        self,
+        symbol: str,
+        type: str,
+        side: str,
+        amount: float,
+        price: Optional[float] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Create an order."""
+        if self._client_orders is None:
+            return await self._adapter.create_order(symbol, type, side, amount, price, params)
+
+        client_id, params = with_client_order_id(params)
+        return await self._submissions.do(
+            client_id,
+            lambda: self._submit_order(client_id, symbol, type, side, amount, price, params),
+        )
+
+    async def _submit_order(
+        self,
+        client_id: str,
+        symbol: str,
+        type: str,
+        side: str,
+        amount: float,
+        price: Optional[float],
+        params: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Place an order once per client order id."""
+        known = self._client_orders.get(client_id)
+        if known is not None:
+            self._client_orders.count_duplicate()
+            return known
+
+        order = await self._adapter.create_order(symbol, type, side, amount, price, params)
+        self._client_orders.record(client_id, order)
+        return order
+
+    @instrumented_async
+    async def create_orders(
+        self, orders: List[Dict[str, Any]], max_concurrency: Optional[int] = None
+    ) -> List[BatchResult]:
+        """Create several orders at once (see MockXGateway.create_orders)."""
+        if self._client_orders is None:
+            return await self._adapter.create_orders(orders, max_concurrency)
+
+        results: List[BatchResult] = [BatchResult(i) for i in range(len(orders))]
+        pending, positions, client_ids = [], [], []
+        for i, spec in enumerate(orders):
+            client_id, params = with_client_order_id(spec.get("params"))
+            known = self._client_orders.get(client_id)
+            if known is not None:
+                self._client_orders.count_duplicate()
+                results[i].result = known
+                continue
+            pending.append({**spec, "params": params})
+            positions.append(i)
+            client_ids.append(client_id)
+
+        outcomes = await self._adapter.create_orders(pending, max_concurrency)
+        for position, client_id, outcome in zip(positions, client_ids, outcomes):
+            if outcome.ok:
+                self._client_orders.record(client_id, outcome.result)
+            results[position].result = outcome.result
+            results[position].error = outcome.error
+        return results
+
+    @instrumented_async
+    async def fetch_order_by_client_id(
+        self, client_order_id: str, symbol: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Fetch an order by client order id (see MockXGateway.fetch_order_by_client_id)."""
+        order_id = self._client_orders.exchange_id(client_order_id) if self._client_orders else None
+        if order_id is None:
+            raise OrderNotFound(f"Unknown client order id: {client_order_id}")
+        return await self._adapter.fetch_order(order_id, symbol)
+
+    @instrumented_async
+    async def fetch_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch a specific order."""
+        return await self._adapter.fetch_order(order_id, symbol)
+
+    @instrumented_async
+    async def fetch_orders(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch orders."""
+        return await self._adapter.fetch_orders(symbol, since, limit, params)
+
+    @instrumented_async
+    async def fetch_orders_columnar(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+        backend: str = "auto",
+    ) -> Columns:
+        """Fetch orders as columns instead of one dict per order.
+
+        Returns a Columns dict of id, symbol, side, type, status (strings) and
+        price, amount, filled, remaining, cost (float64) and timestamp (int64)
+        arrays; see adapters.columnar.
+
+        Args:
+            backend: "numpy", "array" (stdlib array.array) or "auto" (NumPy if installed)
+        """
+        return await self._adapter.fetch_orders_columnar(symbol, since, limit, params, backend)
+
+    @instrumented_async
+    async def fetch_open_orders(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch open orders."""
+        return await self._adapter.fetch_open_orders(symbol, since, limit, params)
+
+    @instrumented_async
+    async def cancel_order(self, order_id: str, symbol: Optional[str] = None) -> Dict[str, Any]:
+        """Cancel an order."""
+        return await self._adapter.cancel_order(order_id, symbol)
+
+    @instrumented_async
+    async def cancel_orders(
+        self,
+        order_ids: List[str],
+        symbol: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[BatchResult]:
+        """Cancel several orders at once (see MockXGateway.cancel_orders)."""
+        return await self._adapter.cancel_orders(order_ids, symbol, max_concurrency)
+
+    @instrumented_async
+    async def fetch_my_trades(
+        self,
+        symbol: Optional[str] = None,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch user's trade history."""
+        return await self._adapter.fetch_my_trades(symbol, since, limit, params)
+
+    # Advanced features (production mode only)
+    @instrumented_async
+    async def fetch_leverage(self, symbol: str) -> Dict[str, Any]:
+        """Fetch current leverage."""
+        require_support("fetch_leverage", self._mode)
+        return await self._adapter.fetch_leverage(symbol)
+
+    @instrumented_async
+    async def set_leverage(self, leverage: int, symbol: Optional[str] = None) -> Dict[str, Any]:
+        """Set leverage."""
+        require_support("set_leverage", self._mode)
+        return await self._adapter.set_leverage(leverage, symbol)
+
+    @instrumented_async
+    async def fetch_funding_rate(self, symbol: str) -> Dict[str, Any]:
+        """Fetch funding rate."""
+        require_support("fetch_funding_rate", self._mode)
+        return await self._adapter.fetch_funding_rate(symbol)
+
+    @instrumented_async
+    async def fetch_funding_history(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Fetch funding history."""
+        require_support("fetch_funding_history", self._mode)
+        return await self._adapter.fetch_funding_history(symbol)
+
+    # Convenience methods
+    async def create_market_order(
+        self,
+        symbol: str,
+        side: str,
+        amount: float,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Create a market order."""
+        return await self.create_order(symbol, "market", side, amount, params=params)
+
+    async def create_limit_order(
+        self,
+        symbol: str,
+        side: str,
+        amount: float,
+        price: float,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Create a limit order."""
+        return await self.create_order(symbol, "limit", side, amount, price, params)
+
+    def client_order_stats(self) -> Dict[str, Any]:
+        """Return client order table counters (empty dict if disabled)."""
+        if self._client_orders is None:
+            return {}
+        return self._client_orders.stats()
+
+    def rate_limit_stats(self) -> Dict[str, Any]:
+        """Return rate limiter budgets and wait counters (empty dict if disabled)."""
+        limiter = getattr(self._adapter, "rate_limiter", None)
+        if limiter is None:
+            return {}
+        return limiter.stats()
+
+    def circuit_stats(self) -> Dict[str, Any]:
+        """Return circuit breaker state per endpoint class (empty dict if disabled)."""
+        breakers = getattr(self._adapter, "circuit_breakers", None)
+        if breakers is None:
+            return {}
+        return breakers.stats()
+
+    def is_available(self, method: str) -> bool:
+        """Check whether calls to a gateway method would currently reach the backend.
+
+        Returns False while the circuit for the method's endpoint class is
+        open, so callers can shed load instead of waiting for an error.
+        """
+        breakers = getattr(self._adapter, "circuit_breakers", None)
+        return breakers is None or breakers.allow_request(method)
+
+    def hedge_stats(self) -> Dict[str, Any]:
+        """Return hedged read counters and delays (empty dict if disabled)."""
+        policy = getattr(self._adapter, "hedge_policy", None)
+        if policy is None:
+            return {}
+        return policy.stats()
+
+    def retry_stats(self) -> Dict[str, Any]:
+        """Return retry counters (empty dict if retries are disabled)."""
+        policy = getattr(self._adapter, "retry_policy", None)
+        if policy is None:
+            return {}
+        return policy.stats()
+
+    def stats(
+        self, reset: bool = False, buckets: Optional[Sequence[float]] = None
+    ) -> Dict[str, Any]:
+        """Return per-endpoint call counts, errors, bytes and latency histograms.
+
+        ``reset=True`` returns the current window and atomically starts a new
+        one, so periodic scrapes see disjoint intervals. ``buckets`` (seconds)
+        adds cumulative histogram counts for fixed-bucket exporters. Returns
+        an empty dict if stats are disabled.
+        """
+        collector = getattr(self._adapter, "stats", None)
+        if collector is None:
+            return {}
+        return collector.snapshot(reset, buckets)
+
+    def recent_calls(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the most recent gateway calls, newest first (empty if disabled).
+
+        Each call has its method, argument summary, start time, duration,
+        outcome and time per phase (rate_limit, connect, server, decode, map,
+        backoff).
+        """
+        if self._call_log is None:
+            return []
+        return self._call_log.recent_calls(limit)
+
+    def slow_calls(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the most recent calls slower than the slow-call threshold."""
+        if self._call_log is None:
+            return []
+        return self._call_log.slow_calls(limit)
+
+    def set_tracer(self, tracer: Optional[SpanFactory]) -> None:
+        """Trace gateway methods, backend requests and mappings (None disables).
+
+        See core.tracing for the tracer protocol and the spans produced.
+        """
+        self._tracer = tracer
+        if hasattr(self._adapter, "tracer"):
+            self._adapter.tracer = tracer
+
+    def deadline(self, seconds: float) -> ContextManager[float]:
+        """Bound every call made inside the with-block to seconds in total.
+
+        Socket timeouts shrink to the time left, retries and rate-limit waits
+        stop at the deadline, and calls started after it fail immediately
+        with RequestTimeout. Nested deadlines can only shorten the budget.
+        """
+        return call_deadline(seconds)
+
+    # Utility methods
+    async def close(self) -> None:
+        """Close the gateway and clean up resources."""
+        if self._adapter:
+            await self._adapter.close()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    # String representation
+    def __str__(self) -> str:
+        return f"AsyncMockXGateway(mode={self._mode})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
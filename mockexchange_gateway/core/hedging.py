@@ -0,0 +1,230 @@
+"""core/hedging.py
+
+Hedged reads for tail-latency reduction.
+
+A hedged read sends a duplicate request when the first one has not
+answered within a high percentile of the endpoint's recent latency, and
+returns whichever answer arrives first. Only idempotent reads are hedged.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Optional, TypeVar
+
+from .deadline import bind_context
+
+T = TypeVar("T")
+
+
+class LatencyEstimator:
+    """Sliding-window latency percentiles per endpoint.
+
+    Keeps the last ``window`` latencies of every endpoint and answers
+    percentile queries over them.
+    """
+
+    def __init__(self, window: int = 256):
+        if window <= 0:
+            raise ValueError("window must be > 0")
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """Add one latency sample for endpoint."""
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def count(self, endpoint: str) -> int:
+        """Return the number of samples held for endpoint."""
+        with self._lock:
+            return len(self._samples.get(endpoint, ()))
+
+    def percentile(self, endpoint: str, percentile: float) -> Optional[float]:
+        """Return the given percentile (0-100) of endpoint latency, or None without samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(endpoint, ()))
+        if not samples:
+            return None
+        rank = min(len(samples) - 1, int(round(percentile / 100.0 * (len(samples) - 1))))
+        return samples[rank]
+
+    def endpoints(self) -> Iterable[str]:
+        """Return the endpoints that have samples."""
+        with self._lock:
+            return list(self._samples)
+
+
+class HedgePolicy:
+    """Send a backup request when a read is slower than usual.
+
+    For every hedged endpoint the policy tracks recent latencies. Once it
+    has ``min_samples`` of them, a read that has not answered after the
+    ``percentile``-th latency (clamped to ``[min_delay, max_delay]``) gets a
+    duplicate request, and the first successful answer wins. If both fail,
+    the first error is raised.
+
+    Requests run on a small thread pool so the caller can return as soon as
+    either one answers. An HTTP request that is already on the wire cannot
+    be aborted: the losing request is cancelled if it has not started and
+    otherwise finishes in the background with its answer discarded.
+    Async adapters cancel the losing task outright.
+
+    Hedging adds load (roughly ``100 - percentile`` percent more reads), so
+    it is opt-in and should be limited to latency-critical endpoints.
+
+    Attributes:
+        percentile: Latency percentile after which a hedge is sent
+        min_delay: Lower bound for the hedge delay in seconds
+        max_delay: Upper bound for the hedge delay in seconds
+        min_samples: Samples needed before an endpoint is hedged
+        endpoints: Endpoint names to hedge (None hedges every read)
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_delay: float = 0.005,
+        max_delay: float = 1.0,
+        min_samples: int = 20,
+        window: int = 256,
+        endpoints: Optional[Iterable[str]] = None,
+        max_workers: int = 16,
+    ):
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be in (0, 100]")
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.endpoints = frozenset(endpoints) if endpoints is not None else None
+        self.estimator = LatencyEstimator(window)
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._counters = {"calls": 0, "hedged": 0, "hedge_wins": 0}
+
+    def applies_to(self, endpoint: str) -> bool:
+        """Check whether endpoint is hedged by this policy."""
+        return self.endpoints is None or endpoint in self.endpoints
+
+    def hedge_delay(self, endpoint: str) -> Optional[float]:
+        """Return how long to wait before hedging endpoint, or None if not warmed up."""
+        if self.estimator.count(endpoint) < self.min_samples:
+            return None
+        delay = self.estimator.percentile(endpoint, self.percentile)
+        if delay is None:
+            return None
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def _timed(self, endpoint: str, func: Callable[[], T]) -> T:
+        start = time.perf_counter()
+        result = func()
+        self.estimator.record(endpoint, time.perf_counter() - start)
+        return result
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="mockx-hedge"
+                )
+            return self._executor
+
+    def call(self, endpoint: str, func: Callable[[], T]) -> T:
+        """Call func, sending a duplicate if it is slower than the hedge delay."""
+        self._count("calls")
+        delay = self.hedge_delay(endpoint)
+        if delay is None:
+            return self._timed(endpoint, func)
+
+        pool = self._pool()
+        # Pool threads do not inherit context variables such as the deadline
+        timed = bind_context(self._timed)
+        primary: "Future[T]" = pool.submit(timed, endpoint, func)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        self._count("hedged")
+        backup: "Future[T]" = pool.submit(timed, endpoint, func)
+        pending = {primary, backup}
+        first_error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    if future is backup:
+                        self._count("hedge_wins")
+                    return future.result()
+                first_error = first_error or future.exception()
+        assert first_error is not None
+        raise first_error
+
+    async def call_async(self, endpoint: str, func: Callable[[], Awaitable[T]]) -> T:
+        """Async variant of call; func returns a new awaitable per request."""
+        self._count("calls")
+
+        async def timed() -> T:
+            start = time.perf_counter()
+            result = await func()
+            self.estimator.record(endpoint, time.perf_counter() - start)
+            return result
+
+        delay = self.hedge_delay(endpoint)
+        if delay is None:
+            return await timed()
+
+        primary = asyncio.ensure_future(timed())
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        self._count("hedged")
+        backup = asyncio.ensure_future(timed())
+        pending = {primary, backup}
+        first_error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup:
+                            self._count("hedge_wins")
+                        return task.result()
+                    first_error = first_error or task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+        assert first_error is not None
+        raise first_error
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hedge counters and the current hedge delay per endpoint."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+        stats["hedge_delay_ms"] = {
+            endpoint: round(delay * 1000, 3)
+            for endpoint in self.estimator.endpoints()
+            if (delay := self.hedge_delay(endpoint)) is not None
+        }
+        return stats
+
+    def close(self) -> None:
+        """Shut down the hedge thread pool."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,104 @@
+"""core/instrument.py
+
+Decorators that instrument gateway methods.
+
+``instrumented`` (and ``instrumented_async``) wrap each backend-facing
+MockXGateway method so that, when enabled on the gateway, the call runs
+inside a ``gateway.<method>`` span (core.tracing) and is written to the
+call log (core.calllog). With neither enabled the wrapper costs two
+attribute checks.
+"""
+
+import functools
+import inspect
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, Tuple, TypeVar
+
+from .tracing import set_attribute, span
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Gateway method parameters copied onto their spans
+SPAN_PARAMS = ("symbol", "order_id", "client_order_id", "asset", "type", "side")
+
+Params = Tuple[Tuple[int, str], ...]
+
+
+def _span_params(func: Callable[..., Any]) -> Params:
+    # Positions (after self) of the parameters copied onto spans
+    names = list(inspect.signature(func).parameters)[1:]
+    return tuple((i, name) for i, name in enumerate(names) if name in SPAN_PARAMS)
+
+
+def _attributes(
+    gateway: Any, method: str, params: Params, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    attributes: Dict[str, Any] = {"method": method, "mode": gateway.mode}
+    for i, name in params:
+        value = args[i] if i < len(args) else kwargs.get(name)
+        if value is not None:
+            attributes[name] = value
+    return attributes
+
+
+def record_result(current: Any, result: Any) -> None:
+    """Copy the order id of an order-shaped result onto the span."""
+    if isinstance(result, dict) and "id" in result and "symbol" in result:
+        set_attribute(current, "order_id", result["id"])
+
+
+@contextmanager
+def _instrument(
+    gateway: Any, method: str, params: Params, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Iterator[Any]:
+    call_log = gateway._call_log
+    tracer = gateway._tracer
+    record, token = call_log.begin(method, args, kwargs) if call_log is not None else (None, None)
+    try:
+        if tracer is None:
+            yield None
+        else:
+            attributes = _attributes(gateway, method, params, args, kwargs)
+            with span(tracer, f"gateway.{method}", attributes) as current:
+                yield current
+    except Exception as e:
+        if record is not None:
+            record.error = e
+        raise
+    finally:
+        if record is not None:
+            call_log.end(record, token)
+
+
+def instrumented(func: F) -> F:
+    """Trace and log a sync gateway method when the gateway enables it."""
+    name = func.__name__
+    params = _span_params(func)
+
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if self._tracer is None and self._call_log is None:
+            return func(self, *args, **kwargs)
+        with _instrument(self, name, params, args, kwargs) as current:
+            result = func(self, *args, **kwargs)
+            record_result(current, result)
+            return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+def instrumented_async(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Async variant of instrumented."""
+    name = func.__name__
+    params = _span_params(func)
+
+    @functools.wraps(func)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if self._tracer is None and self._call_log is None:
+            return await func(self, *args, **kwargs)
+        with _instrument(self, name, params, args, kwargs) as current:
+            result = await func(self, *args, **kwargs)
+            record_result(current, result)
+            return result
+
+    return wrapper
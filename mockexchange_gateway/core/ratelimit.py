@@ -0,0 +1,215 @@
+"""core/ratelimit.py
+
+Client-side rate limiting for the MockX Gateway.
+
+This module provides a thread-safe token bucket, a RateLimiter with
+separate budgets for order endpoints and market-data endpoints, and a
+process-wide registry so that every gateway for the same exchange account
+draws from the same budget.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .calllog import add_phase
+from .deadline import remaining
+from .endpoints import MARKET_DATA, ORDERS, endpoint_class
+from .errors import RateLimitBudgetExceeded
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    The bucket refills at ``rate`` tokens per second up to ``capacity``.
+    Callers reserve tokens up front: a reservation always succeeds
+    immediately and returns how long the caller must wait before sending,
+    which lets the balance go negative. Waiting callers are therefore served
+    in reservation order, and the same bucket can pace both threads
+    (``acquire``) and coroutines (``await asyncio.sleep(bucket.reserve())``).
+
+    Attributes:
+        rate: Tokens added per second
+        capacity: Maximum number of tokens (the burst size)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        if self.capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.waited = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, weight: float = 1.0, max_wait: Optional[float] = None) -> float:
+        """Take weight tokens and return the seconds to wait before using them.
+
+        Raises:
+            RateLimitBudgetExceeded: If the wait would exceed max_wait (no tokens are taken)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            wait = max(0.0, (weight - self._tokens) / self.rate)
+            if max_wait is not None and wait > max_wait:
+                self.rejected += 1
+                raise RateLimitBudgetExceeded(
+                    f"Rate limit budget exhausted: would wait {wait:.3f}s (max {max_wait:.3f}s)"
+                )
+            self._tokens -= weight
+            self.acquired += 1
+            if wait > 0:
+                self.waited += 1
+                self.wait_seconds += wait
+            return wait
+
+    def acquire(self, weight: float = 1.0, max_wait: Optional[float] = None) -> float:
+        """Block until weight tokens are available; return the seconds waited."""
+        wait = self.reserve(weight, max_wait)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def stats(self) -> Dict[str, Any]:
+        """Return bucket settings and wait counters."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "rate": self.rate,
+                "capacity": self.capacity,
+                "tokens": round(self._tokens, 3),
+                "acquired": self.acquired,
+                "waited": self.waited,
+                "rejected": self.rejected,
+                "wait_ms_total": round(self.wait_seconds * 1000, 3),
+            }
+
+
+class RateLimiter:
+    """Rate limiter with separate order and market-data budgets.
+
+    Every backend call is named by its unified method (``fetch_ticker``,
+    ``create_order``, ...; see core.endpoints) and charged against one of
+    two token buckets: order placement and cancellation use the ``orders``
+    bucket, every other request uses the ``market_data`` bucket. Heavy
+    endpoints can cost more than one token through ``weights``, mirroring
+    the request weights most exchanges publish.
+
+    Use one limiter per exchange account, shared by every gateway for that
+    account (see RateLimiterRegistry), so the combined request rate stays
+    under the exchange's limits without waiting for 429 responses.
+
+    Attributes:
+        weights: Token cost per endpoint name (default 1)
+        max_wait: Raise RateLimitBudgetExceeded instead of waiting longer than this
+            many seconds (None waits as long as needed); an active
+            deadline (core.deadline) lowers it to the time left
+    """
+
+    def __init__(
+        self,
+        orders_per_second: float = 10.0,
+        market_data_per_second: float = 20.0,
+        orders_burst: Optional[float] = None,
+        market_data_burst: Optional[float] = None,
+        weights: Optional[Dict[str, float]] = None,
+        max_wait: Optional[float] = None,
+    ):
+        self.buckets: Dict[str, TokenBucket] = {
+            ORDERS: TokenBucket(orders_per_second, orders_burst),
+            MARKET_DATA: TokenBucket(market_data_per_second, market_data_burst),
+        }
+        self.weights: Dict[str, float] = dict(weights or {})
+        self.max_wait = max_wait
+
+    def reserve(self, endpoint: str) -> float:
+        """Charge endpoint against its budget and return the seconds to wait."""
+        bucket = self.buckets[endpoint_class(endpoint)]
+        max_wait = self.max_wait
+        left = remaining()
+        if left is not None:
+            # Never wait for a token past the caller's deadline
+            max_wait = max(0.0, left) if max_wait is None else min(max_wait, max(0.0, left))
+        return bucket.reserve(self.weights.get(endpoint, 1.0), max_wait)
+
+    def acquire(self, endpoint: str) -> float:
+        """Block until endpoint may be called; return the seconds waited."""
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            add_phase("rate_limit", wait)
+            time.sleep(wait)
+        return wait
+
+    def stats(self) -> Dict[str, Any]:
+        """Return per-budget counters and the configured weights."""
+        stats: Dict[str, Any] = {name: bucket.stats() for name, bucket in self.buckets.items()}
+        stats["weights"] = dict(self.weights)
+        return stats
+
+
+def account_key(venue: str, api_key: Optional[str] = None) -> str:
+    """Build a registry key for an exchange account without exposing the API key."""
+    if not api_key:
+        return venue
+    digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+    return f"{venue}:{digest}"
+
+
+class RateLimiterRegistry:
+    """Process-wide registry of rate limiters keyed by exchange account.
+
+    The first gateway for an account creates the limiter with its settings;
+    later gateways for the same account share it (and its budget) and their
+    settings are ignored.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._limiters: Dict[str, RateLimiter] = {}
+
+    def get(self, key: str, **options: Any) -> RateLimiter:
+        """Return the limiter for key, creating it with options if needed."""
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = self._limiters[key] = RateLimiter(**options)
+            return limiter
+
+    def remove(self, key: str) -> None:
+        """Forget the limiter for key."""
+        with self._lock:
+            self._limiters.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return stats for every registered limiter."""
+        with self._lock:
+            items: Tuple[Tuple[str, RateLimiter], ...] = tuple(self._limiters.items())
+        return {key: limiter.stats() for key, limiter in items}
+
+
+# Global rate limiter registry instance
+_rate_limiter_registry: Optional[RateLimiterRegistry] = None
+_rate_limiter_registry_lock = threading.Lock()
+
+
+def get_rate_limiter_registry() -> RateLimiterRegistry:
+    """Get the global rate limiter registry instance."""
+    global _rate_limiter_registry
+
+    if _rate_limiter_registry is None:
+        with _rate_limiter_registry_lock:
+            if _rate_limiter_registry is None:
+                _rate_limiter_registry = RateLimiterRegistry()
+
+    return _rate_limiter_registry
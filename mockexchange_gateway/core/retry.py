@@ -0,0 +1,192 @@
+"""core/retry.py
+
+Retry policy for transient backend failures.
+
+This module classifies errors as retryable or not, and retries calls with
+exponential backoff, full jitter and an overall deadline. Writes are only
+retried when they carry an idempotency key and the backend is known to
+reject duplicates, so a retried order can never be placed twice.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+from .calllog import add_phase
+from .deadline import remaining as deadline_remaining
+from .errors import LOCAL_ERRORS, NetworkError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Order parameters that make a write idempotent (the exchange rejects duplicates)
+IDEMPOTENCY_KEYS = ("clientOrderId", "client_order_id", "newClientOrderId")
+
+# NetworkError covers RequestTimeout, ExchangeNotAvailable, RateLimitExceeded,
+# DDoSProtection and InvalidNonce; ExchangeError subclasses are never retried,
+# nor are the local deadline and rate-limit budget refusals (LOCAL_ERRORS)
+RETRYABLE_ERRORS: Tuple[Type[BaseException], ...] = (NetworkError,)
+
+
+def idempotency_key(params: Any) -> Optional[str]:
+    """Return the client order id in an order params/payload dict, if any."""
+    if not isinstance(params, dict):
+        return None
+    for key in IDEMPOTENCY_KEYS:
+        if params.get(key):
+            return str(params[key])
+    return None
+
+
+class RetryPolicy:
+    """Retry transient failures with exponential backoff and jitter.
+
+    A failed call is retried when its error is retryable (a NetworkError by
+    default: timeouts, connection errors, 429s and 5xx unavailability) and
+    the call is idempotent. Reads are always idempotent; callers mark writes
+    idempotent only when they carry an idempotency key that the backend
+    dedups (ccxt exchanges; never MockExchange).
+
+    Attempt ``n`` (starting at 1) sleeps a random time between 0 and
+    ``min(max_delay, base_delay * multiplier ** (n - 1))`` before the next
+    try ("full jitter", which keeps many clients from retrying in lockstep).
+    No retry is started once ``deadline`` seconds have passed since the
+    first attempt, and a backoff never sleeps past the deadline. A
+    context-scoped deadline (core.deadline) is honoured the same way.
+
+    Attributes:
+        max_attempts: Total attempts including the first one
+        base_delay: Backoff before the first retry, in seconds
+        max_delay: Upper bound for a single backoff, in seconds
+        multiplier: Backoff growth factor per attempt
+        deadline: Overall time budget per call in seconds (None for no limit)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 2.0,
+        multiplier: float = 2.0,
+        deadline: Optional[float] = None,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        if base_delay < 0 or max_delay < 0:
+            raise ValueError("delays must be >= 0")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.deadline = deadline
+        self._lock = threading.Lock()
+        self._counters = {"calls": 0, "retries": 0, "recovered": 0, "exhausted": 0}
+
+    def is_retryable(
+        self, error: BaseException, retry_on: Tuple[Type[BaseException], ...] = ()
+    ) -> bool:
+        """Check whether error is transient."""
+        if isinstance(error, LOCAL_ERRORS):
+            return False
+        return isinstance(error, RETRYABLE_ERRORS + retry_on)
+
+    def backoff(self, attempt: int) -> float:
+        """Return the jittered delay after the given failed attempt."""
+        cap = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        return random.uniform(0, cap)
+
+    def _next_delay(
+        self,
+        error: BaseException,
+        attempt: int,
+        started: float,
+        idempotent: bool,
+        retry_on: Tuple[Type[BaseException], ...],
+    ) -> Optional[float]:
+        """Return the sleep before the next attempt, or None to give up."""
+        if not idempotent or not self.is_retryable(error, retry_on):
+            return None
+        if attempt >= self.max_attempts:
+            self._count("exhausted")
+            return None
+        delay = self.backoff(attempt)
+        remaining = deadline_remaining()
+        if self.deadline is not None:
+            own = self.deadline - (time.monotonic() - started)
+            remaining = own if remaining is None else min(remaining, own)
+        if remaining is not None:
+            if remaining <= 0:
+                self._count("exhausted")
+                return None
+            delay = min(delay, remaining)
+        self._count("retries")
+        add_phase("backoff", delay)
+        logger.debug("Retrying after %s (attempt %d, sleeping %.3fs)", error, attempt, delay)
+        return delay
+
+    def call(
+        self,
+        func: Callable[[], T],
+        idempotent: bool = True,
+        retry_on: Tuple[Type[BaseException], ...] = (),
+    ) -> T:
+        """Call func, retrying transient failures.
+
+        Args:
+            func: Zero-argument callable to invoke
+            idempotent: Whether repeating the call is safe
+            retry_on: Extra exception types to treat as retryable
+        """
+        self._count("calls")
+        started = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                result = func()
+            except Exception as e:
+                delay = self._next_delay(e, attempt, started, idempotent, retry_on)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+            if attempt > 1:
+                self._count("recovered")
+            return result
+
+    async def call_async(
+        self,
+        func: Callable[[], Awaitable[T]],
+        idempotent: bool = True,
+        retry_on: Tuple[Type[BaseException], ...] = (),
+    ) -> T:
+        """Async variant of call; func returns a new awaitable per attempt."""
+        self._count("calls")
+        started = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                result = await func()
+            except Exception as e:
+                delay = self._next_delay(e, attempt, started, idempotent, retry_on)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            if attempt > 1:
+                self._count("recovered")
+            return result
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return retry counters (calls, retries, recovered, exhausted)."""
+        with self._lock:
+            return dict(self._counters)
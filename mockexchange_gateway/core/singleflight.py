@@ -0,0 +1,140 @@
+"""core/singleflight.py
+
+Single-flight request coalescing for the MockX Gateway.
+
+When several threads issue the same read at the same moment, only the
+first one (the leader) performs the backend call; the others wait for it
+and receive the same decoded result or the same exception.
+AsyncSingleFlight does the same for tasks on one event loop.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from .deadline import remaining
+from .errors import DeadlineExceeded
+
+
+def make_key(*parts: Any) -> Hashable:
+    """Build a hashable coalescing key from request parts.
+
+    Dicts and lists (query params, symbol lists) are frozen recursively so
+    that equal requests produce equal keys regardless of dict ordering.
+    """
+    return tuple(_freeze(part) for part in parts)
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class _Call:
+    """An in-flight call that followers can wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls into one.
+
+    Only use this for idempotent reads: the result object is shared by every
+    caller that joined the flight, and a write must never be deduplicated.
+    Calls are only coalesced while they are in flight; nothing is cached
+    after the leader returns.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Run func once for all concurrent callers using the same key."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+                leader = True
+
+        if not leader:
+            # A follower gives up at its own deadline; the leader keeps going
+            if not call.done.wait(remaining()):
+                raise DeadlineExceeded("Deadline exceeded waiting for an in-flight request")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many calls ran and how many joined an in-flight call."""
+        return {"leaders": self.leaders, "shared": self.shared, "in_flight": len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """Coalesce concurrent identical coroutine calls into one (see SingleFlight).
+
+    Must be used from a single event loop.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Await func once for all concurrent callers using the same key."""
+        call = self._calls.get(key)
+        if call is not None:
+            self.shared += 1
+            # A follower gives up at its own deadline; the leader keeps going
+            try:
+                return await asyncio.wait_for(asyncio.shield(call), remaining())
+            except asyncio.TimeoutError:
+                raise DeadlineExceeded("Deadline exceeded waiting for an in-flight request")
+
+        call = self._calls[key] = asyncio.get_running_loop().create_future()
+        self.leaders += 1
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+        except BaseException as e:
+            call.set_exception(e)
+            # Mark the error retrieved so a flight without followers is not logged
+            call.exception()
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many calls ran and how many joined an in-flight call."""
+        return {"leaders": self.leaders, "shared": self.shared, "in_flight": len(self._calls)}
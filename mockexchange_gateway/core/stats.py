@@ -0,0 +1,309 @@
+"""core/stats.py
+
+Per-endpoint request statistics for the MockX Gateway.
+
+Adapters time every backend call by unified endpoint name (see
+core.endpoints) and record call and error counts, bytes on the wire and
+latency histograms split into network time (the request, including
+retries, rate-limit waits and hedges) and mapping time (turning the
+response into CCXT structures). ``gateway.stats()`` returns a snapshot.
+
+Usage:
+    >>> stats = gateway.stats(reset=True)   # snapshot and start a new window
+    >>> stats["endpoints"]["fetch_ticker"]["network_ms"]["p99"]
+    12.352
+"""
+
+import contextvars
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Bytes sent and received by the calls in the current context, as [out, in]
+_io: contextvars.ContextVar[Optional[List[int]]] = contextvars.ContextVar("mockx_io", default=None)
+
+# Percentiles reported in snapshots
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+def add_io(bytes_out: int, bytes_in: int) -> None:
+    """Charge bytes on the wire to the call being measured, if any."""
+    io = _io.get()
+    if io is not None:
+        io[0] += bytes_out
+        io[1] += bytes_in
+
+
+def io_hook(response: Any, *args: Any, **kwargs: Any) -> Any:
+    """requests response hook that charges request and response sizes via add_io.
+
+    Mounted on sessions we do not send through ourselves (ccxt's).
+    """
+    if _io.get() is not None:
+        body = response.request.body if response.request is not None else None
+        add_io(len(body) if body else 0, len(response.content or b""))
+    return response
+
+
+class LatencyHistogram:
+    """HDR-style log-linear latency histogram.
+
+    Values are stored in microseconds. Below ``2**sub_bucket_bits`` every
+    microsecond has its own bucket; above it each power of two is split into
+    ``2**(sub_bucket_bits - 1)`` linear sub-buckets, so every recorded
+    value is kept with a relative error of at most ``2**(1 - sub_bucket_bits)``
+    (about 1.6% with the default of 7) at constant cost per sample, however
+    long the tail.
+
+    Not thread-safe; GatewayStats guards its histograms with its own lock.
+    """
+
+    __slots__ = ("sub_bucket_bits", "_half", "_counts", "count", "total", "min", "max")
+
+    def __init__(self, sub_bucket_bits: int = 7):
+        if sub_bucket_bits < 2:
+            raise ValueError("sub_bucket_bits must be >= 2")
+        self.sub_bucket_bits = sub_bucket_bits
+        self._half = 1 << (sub_bucket_bits - 1)
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def copy(self) -> "LatencyHistogram":
+        """Return an independent copy of the counts."""
+        clone = LatencyHistogram.__new__(LatencyHistogram)
+        clone.sub_bucket_bits = self.sub_bucket_bits
+        clone._half = self._half
+        clone._counts = dict(self._counts)
+        clone.count = self.count
+        clone.total = self.total
+        clone.min = self.min
+        clone.max = self.max
+        return clone
+
+    def _index(self, value: int) -> int:
+        shift = value.bit_length() - self.sub_bucket_bits
+        if shift <= 0:
+            return value
+        return shift * self._half + (value >> shift)
+
+    def _highest_equivalent(self, index: int) -> int:
+        if index < 2 * self._half:
+            return index
+        shift = index // self._half - 1
+        mantissa = index - shift * self._half
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """Add one latency sample."""
+        value = max(0, int(seconds * 1_000_000))
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, percentile: float) -> float:
+        """Return the given percentile (0-100) in seconds (0.0 without samples)."""
+        if self.count == 0:
+            return 0.0
+        target = max(1, int(round(percentile / 100.0 * self.count)))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(self._highest_equivalent(index), self.max) / 1_000_000
+        return self.max / 1_000_000
+
+    def cumulative(self, bounds: Sequence[float]) -> List[int]:
+        """Return how many samples are <= each bound (seconds, ascending).
+
+        Samples are compared by the upper edge of their bucket, so counts are
+        exact at bucket precision and never overstate a bound.
+        """
+        limits = [int(bound * 1_000_000) for bound in bounds]
+        counts = [0] * len(limits)
+        for index, count in self._counts.items():
+            value = min(self._highest_equivalent(index), self.max)
+            for i, limit in enumerate(limits):
+                if value <= limit:
+                    counts[i] += count
+        return counts
+
+    def summary(self, bounds: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+        """Return count, sum, mean, min, max and percentiles in milliseconds.
+
+        With bounds (seconds) the summary also holds their cumulative
+        counts under ``buckets``, for exporters that need fixed buckets.
+        """
+        summary: Dict[str, Any] = {
+            "count": self.count,
+            "sum": round(self.total / 1000, 3),
+            "mean": round(self.total / self.count / 1000, 3) if self.count else 0.0,
+            "min": round(self.min / 1000, 3),
+            "max": round(self.max / 1000, 3),
+        }
+        for percentile in PERCENTILES:
+            summary[f"p{percentile:g}".replace(".", "")] = round(
+                self.percentile(percentile) * 1000, 3
+            )
+        if bounds is not None:
+            summary["buckets"] = self.cumulative(bounds)
+        return summary
+
+
+class EndpointStats:
+    """Counters and histograms for one endpoint.
+
+    Attributes:
+        count: Calls made
+        errors: Failed calls by exception class name
+        bytes_out: Request body bytes sent
+        bytes_in: Response body bytes received
+        network: Latency of the backend call
+        mapping: Latency of response mapping
+    """
+
+    __slots__ = ("count", "errors", "bytes_out", "bytes_in", "network", "mapping")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors: Dict[str, int] = {}
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.network = LatencyHistogram()
+        self.mapping = LatencyHistogram()
+
+    def copy(self) -> "EndpointStats":
+        """Return an independent copy of the counters and histograms."""
+        clone = EndpointStats.__new__(EndpointStats)
+        clone.count = self.count
+        clone.errors = dict(self.errors)
+        clone.bytes_out = self.bytes_out
+        clone.bytes_in = self.bytes_in
+        clone.network = self.network.copy()
+        clone.mapping = self.mapping.copy()
+        return clone
+
+    def snapshot(self, bounds: Optional[Sequence[float]] = None) -> Dict[str, Any]:
+        """Return the counters and histogram summaries as plain data."""
+        return {
+            "count": self.count,
+            "errors": dict(self.errors),
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "network_ms": self.network.summary(bounds),
+            "mapping_ms": self.mapping.summary(bounds),
+        }
+
+
+class GatewayStats:
+    """Thread-safe per-endpoint statistics for one adapter.
+
+    ``measure`` wraps a backend call and ``record_mapping`` takes the time
+    of a mapping step; both cost a few microseconds per call. ``snapshot`` returns the
+    numbers collected since creation or the last reset, and
+    ``snapshot(reset=True)`` atomically starts a new window so periodic
+    scrapes see disjoint intervals.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointStats] = {}
+        self._since = time.time()
+
+    def _endpoint(self, endpoint: str) -> EndpointStats:
+        # Must hold the lock
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = EndpointStats()
+        return stats
+
+    def record(
+        self,
+        endpoint: str,
+        seconds: float,
+        error: Optional[BaseException] = None,
+        bytes_out: int = 0,
+        bytes_in: int = 0,
+    ) -> None:
+        """Record one backend call."""
+        with self._lock:
+            stats = self._endpoint(endpoint)
+            stats.count += 1
+            stats.network.record(seconds)
+            stats.bytes_out += bytes_out
+            stats.bytes_in += bytes_in
+            if error is not None:
+                name = type(error).__name__
+                stats.errors[name] = stats.errors.get(name, 0) + 1
+
+    def record_mapping(self, endpoint: str, seconds: float) -> None:
+        """Record one response mapping step."""
+        with self._lock:
+            self._endpoint(endpoint).mapping.record(seconds)
+
+    def measure(self, endpoint: str, func: Callable[[], T]) -> T:
+        """Call func and record its latency, outcome and bytes under endpoint."""
+        io = [0, 0]
+        token = _io.set(io)
+        error: Optional[BaseException] = None
+        start = time.perf_counter()
+        try:
+            return func()
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            _io.reset(token)
+            self.record(endpoint, elapsed, error, io[0], io[1])
+
+    async def measure_async(self, endpoint: str, func: Callable[[], Awaitable[T]]) -> T:
+        """Async variant of measure."""
+        io = [0, 0]
+        token = _io.set(io)
+        error: Optional[BaseException] = None
+        start = time.perf_counter()
+        try:
+            return await func()
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            _io.reset(token)
+            self.record(endpoint, elapsed, error, io[0], io[1])
+
+    def snapshot(
+        self, reset: bool = False, bounds: Optional[Sequence[float]] = None
+    ) -> Dict[str, Any]:
+        """Return per-endpoint stats, optionally starting a new window.
+
+        bounds adds cumulative histogram bucket counts (see LatencyHistogram.summary).
+        """
+        now = time.time()
+        # Only copy counters under the lock; percentiles and buckets are
+        # computed outside it so a scrape does not stall live calls
+        with self._lock:
+            endpoints = self._endpoints
+            since = self._since
+            if reset:
+                # Nothing records into the old window once it is swapped out
+                self._endpoints = {}
+                self._since = now
+            else:
+                endpoints = {name: stats.copy() for name, stats in endpoints.items()}
+        result = {name: stats.snapshot(bounds) for name, stats in sorted(endpoints.items())}
+        return {"since": since, "seconds": round(now - since, 3), "endpoints": result}
+
+    def reset(self) -> None:
+        """Drop everything recorded so far."""
+        self.snapshot(reset=True)
@@ -0,0 +1,70 @@
+"""core/tracing.py
+
+Span hooks for tracing gateway calls.
+
+A tracer is any callable ``tracer(name, attributes)`` returning a context
+manager; whatever the context manager yields is the span, and if it has a
+``set_attribute(key, value)`` method the gateway adds attributes to it as
+they become known. OpenTelemetry fits as-is:
+
+    >>> tracer = trace.get_tracer("strategy")
+    >>> gateway.set_tracer(
+    ...     lambda name, attributes: tracer.start_as_current_span(name, attributes=attributes)
+    ... )
+
+Once set, every gateway method (``gateway.<method>``), every backend
+request (``mockexchange.<endpoint>`` or ``ccxt.<method>``) and every
+response mapping step (``map.<endpoint>``) runs inside a span. Spans carry
+the symbol, order id, endpoint and HTTP status code where they apply, and
+``error.type`` when the call fails. Without a tracer each instrumented
+call costs one attribute check.
+"""
+
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Callable, ContextManager, Dict, Iterator
+
+# A tracer: (span name, initial attributes) -> context manager yielding the span
+SpanFactory = Callable[[str, Dict[str, Any]], ContextManager[Any]]
+
+# Span of the innermost traced call in this context
+_current_span: contextvars.ContextVar[Any] = contextvars.ContextVar("mockx_span", default=None)
+
+
+def set_attribute(span: Any, key: str, value: Any) -> None:
+    """Set an attribute on span if it supports attributes and value is not None."""
+    if span is None or value is None:
+        return
+    setter = getattr(span, "set_attribute", None)
+    if setter is not None:
+        setter(key, value)
+
+
+@contextmanager
+def span(tracer: SpanFactory, name: str, attributes: Dict[str, Any]) -> Iterator[Any]:
+    """Run the enclosed block inside a span from tracer."""
+    with tracer(name, attributes) as current:
+        token = _current_span.set(current)
+        try:
+            yield current
+        except Exception as e:
+            set_attribute(current, "error.type", type(e).__name__)
+            raise
+        finally:
+            _current_span.reset(token)
+
+
+def record_status(status_code: int) -> None:
+    """Add an HTTP status code to the current span, if any."""
+    current = _current_span.get()
+    if current is not None:
+        set_attribute(current, "http.status_code", status_code)
+
+
+def status_hook(response: Any, *args: Any, **kwargs: Any) -> Any:
+    """requests response hook that records the status code on the current span.
+
+    Mounted on sessions we do not send through ourselves (ccxt's).
+    """
+    record_status(response.status_code)
+    return response
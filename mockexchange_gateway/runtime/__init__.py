@@ -1,7 +1,10 @@
 """Runtime package for MockX Gateway."""
 
 from .factory import ExchangeFactory
+from .prometheus import MetricsExporter, render_metrics
 
 __all__ = [
     "ExchangeFactory",
+    "MetricsExporter",
+    "render_metrics",
 ]
@@ -7,12 +7,26 @@ with the appropriate adapter based on the current configuration.
 """
 
 import logging
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 
 from ..adapters.paper import PaperAdapter
+from ..adapters.paper_async import AsyncPaperAdapter
 from ..adapters.prod import ProdAdapter
+from ..adapters.prod_async import AsyncProdAdapter
+from ..adapters.session import PoolConfig
+from ..core.cache import TickerCache
+from ..core.calllog import CallLog
+from ..core.candles import CandleStore
+from ..core.circuit import CircuitBreakers, get_circuit_breaker_registry
 from ..core.errors import ExchangeError
 from ..core.facade import MockXGateway
+from ..core.facade_async import AsyncMockXGateway
+from ..core.hedging import HedgePolicy
+from ..core.orders import ClientOrderTable
+from ..core.ratelimit import RateLimiter, account_key, get_rate_limiter_registry
+from ..core.retry import RetryPolicy
+from ..core.stats import GatewayStats
+from ..core.tracing import SpanFactory
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +55,28 @@ class ExchangeFactory:
         base_url: str = "http://localhost:8000",
         api_key: str = "dev-key",
         timeout: float = 10.0,
+        ticker_cache_ttl_ms: Optional[int] = None,
+        ticker_cache_size: int = 1024,
+        coalesce_reads: bool = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        share_session: bool = False,
+        json_codec: str = "json",
+        rate_limit: Optional[Dict[str, Any]] = None,
+        rate_limit_key: Optional[str] = None,
+        retry: Optional[Dict[str, Any]] = None,
+        circuit_breaker: Optional[Dict[str, Any]] = None,
+        hedge: Optional[Dict[str, Any]] = None,
+        stats: bool = False,
+        lazy_results: bool = False,
+        client_order_ids: bool = False,
+        tracer: Optional[SpanFactory] = None,
+        call_log_size: int = 0,
+        slow_call_ms: Optional[float] = None,
     ) -> MockXGateway:
         """Create a paper mode gateway with explicit configuration.
 
@@ -52,6 +88,47 @@ class ExchangeFactory:
             base_url: MockExchange API base URL
             api_key: API key for authentication with MockExchange
             timeout: Request timeout in seconds
+            ticker_cache_ttl_ms: Enable the ticker cache with this default max age
+            ticker_cache_size: Maximum number of symbols kept in the ticker cache
+            coalesce_reads: Share one backend call between identical concurrent reads
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum connections kept open per host; size this to
+                the number of threads sharing the gateway
+            pool_block: Wait for a free connection instead of opening a throwaway one
+            keep_alive: Reuse connections between requests
+            connect_timeout: Connect timeout in seconds (defaults to timeout)
+            read_timeout: Read timeout in seconds (defaults to timeout)
+            share_session: Borrow the connection pool from the process-wide
+                registry shared by all gateways for the same base_url
+            json_codec: JSON library for request and response bodies: "json"
+                (stdlib, default), "orjson", "msgspec" or "auto" (fastest
+                installed); the faster libraries differ on NaN and big ints
+            rate_limit: Enable client-side rate limiting with these RateLimiter
+                options (e.g. ``{"orders_per_second": 5, "weights": {...}}``)
+            rate_limit_key: Account key of the shared limiter (defaults to
+                one limiter per base_url and API key)
+            retry: Retry transient failures with these RetryPolicy options
+                (e.g. ``{"max_attempts": 4, "deadline": 5.0}``); only reads
+                are retried, since a resent order could be placed twice
+            circuit_breaker: Fail fast while the backend is failing, with these
+                CircuitBreaker options (e.g. ``{"failure_threshold": 5,
+                "recovery_timeout": 5.0}``); shared by all gateways for the backend
+            hedge: Hedge slow reads with a backup request, with these HedgePolicy
+                options (e.g. ``{"percentile": 95, "endpoints": ["fetch_ticker"]}``)
+            stats: Collect per-endpoint call counts, errors, bytes and latency
+                histograms (``gateway.stats()``); off by default
+            lazy_results: Return fetched orders and tickers as read-only
+                LazyOrder/LazyTicker views that map fields on first access
+            client_order_ids: Tag orders with generated client order ids and
+                answer duplicate submissions from a local table (off by
+                default; MockExchange is not known to reject duplicate ids,
+                so they do not make order retries safe)
+            tracer: Span factory for tracing gateway methods, backend requests
+                and mappings (see core.tracing)
+            call_log_size: Number of recent calls kept for ``gateway.recent_calls()``
+                (0, the default, disables the call log unless slow_call_ms is set)
+            slow_call_ms: Log calls slower than this, with their phase timings,
+                and keep them for ``gateway.slow_calls()``
 
         Returns:
             MockXGateway: Paper mode gateway instance
@@ -67,8 +144,35 @@ class ExchangeFactory:
             extra={"base_url": base_url, "timeout": timeout},
         )
 
-        adapter = PaperAdapter(base_url, api_key, timeout)
-        gateway = MockXGateway(adapter)
+        adapter = PaperAdapter(
+            base_url,
+            api_key,
+            timeout,
+            coalesce_reads=coalesce_reads,
+            pool_config=PoolConfig(pool_connections, pool_maxsize, pool_block, keep_alive),
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            share_session=share_session,
+            codec=json_codec,
+            rate_limiter=ExchangeFactory._build_rate_limiter(
+                rate_limit, rate_limit_key or account_key(base_url, api_key)
+            ),
+            retry_policy=ExchangeFactory._build_retry_policy(retry),
+            circuit_breakers=ExchangeFactory._build_circuit_breakers(
+                circuit_breaker, base_url.rstrip("/")
+            ),
+            hedge_policy=ExchangeFactory._build_hedge_policy(hedge),
+            stats=ExchangeFactory._build_stats(stats),
+            lazy_results=lazy_results,
+        )
+        gateway = MockXGateway(
+            adapter,
+            ExchangeFactory._build_ticker_cache(ticker_cache_ttl_ms, ticker_cache_size),
+            ExchangeFactory._build_client_orders(client_order_ids),
+            call_log=ExchangeFactory._build_call_log(call_log_size, slow_call_ms),
+        )
+        if tracer is not None:
+            gateway.set_tracer(tracer)
 
         logger.info(
             "Paper mode gateway created successfully",
@@ -77,12 +181,132 @@ class ExchangeFactory:
 
         return gateway
 
+    @staticmethod
+    def create_async_paper_gateway(
+        base_url: str = "http://localhost:8000",
+        api_key: str = "dev-key",
+        timeout: float = 10.0,
+        max_connections: int = 100,
+        json_codec: str = "json",
+        rate_limit: Optional[Dict[str, Any]] = None,
+        rate_limit_key: Optional[str] = None,
+        retry: Optional[Dict[str, Any]] = None,
+        circuit_breaker: Optional[Dict[str, Any]] = None,
+        hedge: Optional[Dict[str, Any]] = None,
+        stats: bool = False,
+        lazy_results: bool = False,
+        client_order_ids: bool = False,
+        tracer: Optional[SpanFactory] = None,
+        call_log_size: int = 0,
+        slow_call_ms: Optional[float] = None,
+    ) -> AsyncMockXGateway:
+        """Create an asyncio paper mode gateway with explicit configuration.
+
+        Same as create_paper_gateway, but every backend call is a coroutine
+        and all calls share one aiohttp connection pool.
+
+        Args:
+            base_url: MockExchange API base URL
+            api_key: API key for authentication with MockExchange
+            timeout: Request timeout in seconds
+            max_connections: Maximum number of simultaneous connections
+            json_codec: JSON library for request and response bodies: "json"
+                (stdlib, default), "orjson", "msgspec" or "auto" (fastest
+                installed); the faster libraries differ on NaN and big ints
+            rate_limit: Enable client-side rate limiting with these RateLimiter
+                options (e.g. ``{"orders_per_second": 5, "weights": {...}}``)
+            rate_limit_key: Account key of the shared limiter (defaults to
+                one limiter per base_url and API key)
+            retry: Retry transient failures with these RetryPolicy options
+                (e.g. ``{"max_attempts": 4, "deadline": 5.0}``); only reads
+                are retried, since a resent order could be placed twice
+            circuit_breaker: Fail fast while the backend is failing, with these
+                CircuitBreaker options (e.g. ``{"failure_threshold": 5,
+                "recovery_timeout": 5.0}``); shared by all gateways for the backend
+            hedge: Hedge slow reads with a backup request, with these HedgePolicy
+                options (e.g. ``{"percentile": 95, "endpoints": ["fetch_ticker"]}``)
+            stats: Collect per-endpoint call counts, errors, bytes and latency
+                histograms (``gateway.stats()``); off by default
+            lazy_results: Return fetched orders and tickers as read-only
+                LazyOrder/LazyTicker views that map fields on first access
+            client_order_ids: Tag orders with generated client order ids and
+                answer duplicate submissions from a local table (off by
+                default; MockExchange is not known to reject duplicate ids,
+                so they do not make order retries safe)
+            tracer: Span factory for tracing gateway methods, backend requests
+                and mappings (see core.tracing)
+            call_log_size: Number of recent calls kept for ``gateway.recent_calls()``
+                (0, the default, disables the call log unless slow_call_ms is set)
+            slow_call_ms: Log calls slower than this, with their phase timings,
+                and keep them for ``gateway.slow_calls()``
+
+        Returns:
+            AsyncMockXGateway: Async paper mode gateway instance
+
+        Example:
+            >>> async with ExchangeFactory.create_async_paper_gateway(
+            ...     base_url="http://localhost:8000",
+            ...     api_key="your-api-key"
+            ... ) as gateway:
+            ...     ticker = await gateway.fetch_ticker("BTC/USDT")
+        """
+        logger.info(
+            "Creating async paper mode gateway",
+            extra={"base_url": base_url, "timeout": timeout},
+        )
+
+        adapter = AsyncPaperAdapter(
+            base_url,
+            api_key,
+            timeout,
+            max_connections,
+            codec=json_codec,
+            rate_limiter=ExchangeFactory._build_rate_limiter(
+                rate_limit, rate_limit_key or account_key(base_url, api_key)
+            ),
+            retry_policy=ExchangeFactory._build_retry_policy(retry),
+            circuit_breakers=ExchangeFactory._build_circuit_breakers(
+                circuit_breaker, base_url.rstrip("/")
+            ),
+            hedge_policy=ExchangeFactory._build_hedge_policy(hedge),
+            stats=ExchangeFactory._build_stats(stats),
+            lazy_results=lazy_results,
+        )
+        gateway = AsyncMockXGateway(
+            adapter,
+            ExchangeFactory._build_client_orders(client_order_ids),
+            call_log=ExchangeFactory._build_call_log(call_log_size, slow_call_ms),
+        )
+        if tracer is not None:
+            gateway.set_tracer(tracer)
+
+        logger.info(
+            "Async paper mode gateway created successfully",
+            extra={"capabilities": len(gateway.has), "mode": "paper"},
+        )
+
+        return gateway
+
     @staticmethod
     def create_prod_gateway(
         exchange_id: str,
         api_key: Optional[str] = None,
         secret: Optional[str] = None,
         sandbox: bool = False,
+        ticker_cache_ttl_ms: Optional[int] = None,
+        ticker_cache_size: int = 1024,
+        coalesce_reads: bool = False,
+        rate_limit: Optional[Dict[str, Any]] = None,
+        rate_limit_key: Optional[str] = None,
+        retry: Optional[Dict[str, Any]] = None,
+        circuit_breaker: Optional[Dict[str, Any]] = None,
+        hedge: Optional[Dict[str, Any]] = None,
+        stats: bool = False,
+        client_order_ids: bool = False,
+        tracer: Optional[SpanFactory] = None,
+        call_log_size: int = 0,
+        slow_call_ms: Optional[float] = None,
+        candle_store: Optional[Union[str, CandleStore]] = None,
         **kwargs,
     ) -> MockXGateway:
         """Create a production mode gateway with explicit configuration.
@@ -95,6 +319,36 @@ class ExchangeFactory:
             api_key: API key for the exchange
             secret: Secret key for the exchange
             sandbox: Use sandbox/testnet if available (recommended for testing)
+            ticker_cache_ttl_ms: Enable the ticker cache with this default max age
+            ticker_cache_size: Maximum number of symbols kept in the ticker cache
+            coalesce_reads: Share one backend call between identical concurrent reads
+            rate_limit: Enable client-side rate limiting with these RateLimiter
+                options (e.g. ``{"orders_per_second": 5, "weights": {...}}``)
+            rate_limit_key: Account key of the shared limiter (defaults to
+                one limiter per exchange and API key); ccxt's own per-instance
+                throttle is disabled unless ``enableRateLimit`` is passed explicitly
+            retry: Retry transient failures with these RetryPolicy options
+                (e.g. ``{"max_attempts": 4, "deadline": 5.0}``); writes are
+                only retried when they carry a client order id
+            circuit_breaker: Fail fast while the backend is failing, with these
+                CircuitBreaker options (e.g. ``{"failure_threshold": 5,
+                "recovery_timeout": 5.0}``); shared by all gateways for the backend
+            hedge: Hedge slow reads with a backup request, with these HedgePolicy
+                options (e.g. ``{"percentile": 95, "endpoints": ["fetch_ticker"]}``)
+            stats: Collect per-endpoint call counts, errors, bytes and latency
+                histograms (``gateway.stats()``); off by default
+            client_order_ids: Tag orders with generated client order ids and
+                answer duplicate submissions from a local table (off by default
+                because client id formats differ between exchanges)
+            tracer: Span factory for tracing gateway methods, backend requests
+                and mappings (see core.tracing)
+            call_log_size: Number of recent calls kept for ``gateway.recent_calls()``
+                (0, the default, disables the call log unless slow_call_ms is set)
+            slow_call_ms: Log calls slower than this, with their phase timings,
+                and keep them for ``gateway.slow_calls()``
+            candle_store: Directory (or CandleStore) in which closed candles
+                from ``fetch_ohlcv(..., since=...)`` are kept, so only missing
+                ranges are downloaded again
             **kwargs: Additional CCXT configuration options
 
         Returns:
@@ -116,16 +370,37 @@ class ExchangeFactory:
             extra={"exchange_id": exchange_id, "sandbox": sandbox},
         )
 
-        config = {"sandbox": sandbox, **kwargs}
-
-        if api_key:
-            config["apiKey"] = api_key
-        if secret:
-            config["secret"] = secret
+        config = ExchangeFactory._build_prod_config(api_key, secret, sandbox, kwargs)
+        rate_limiter = ExchangeFactory._build_rate_limiter(
+            rate_limit,
+            rate_limit_key or account_key(f"{exchange_id}{':sandbox' if sandbox else ''}", api_key),
+        )
+        if rate_limiter is not None:
+            # The shared limiter replaces ccxt's per-instance throttle
+            config.setdefault("enableRateLimit", False)
 
         try:
-            adapter = ProdAdapter(exchange_id, config)
-            gateway = MockXGateway(adapter)
+            adapter = ProdAdapter(
+                exchange_id,
+                config,
+                coalesce_reads=coalesce_reads,
+                rate_limiter=rate_limiter,
+                retry_policy=ExchangeFactory._build_retry_policy(retry),
+                circuit_breakers=ExchangeFactory._build_circuit_breakers(
+                    circuit_breaker, f"{exchange_id}{':sandbox' if sandbox else ''}"
+                ),
+                hedge_policy=ExchangeFactory._build_hedge_policy(hedge),
+                stats=ExchangeFactory._build_stats(stats),
+            )
+            gateway = MockXGateway(
+                adapter,
+                ExchangeFactory._build_ticker_cache(ticker_cache_ttl_ms, ticker_cache_size),
+                ExchangeFactory._build_client_orders(client_order_ids),
+                call_log=ExchangeFactory._build_call_log(call_log_size, slow_call_ms),
+                candle_store=ExchangeFactory._build_candle_store(candle_store),
+            )
+            if tracer is not None:
+                gateway.set_tracer(tracer)
 
             logger.info(
                 "Production mode gateway created successfully",
@@ -140,3 +415,196 @@ class ExchangeFactory:
         except Exception as e:
             logger.error(f"Failed to create production gateway: {str(e)}")
             raise ExchangeError(f"Failed to create {exchange_id} gateway: {str(e)}")
+
+    @staticmethod
+    def create_async_prod_gateway(
+        exchange_id: str,
+        api_key: Optional[str] = None,
+        secret: Optional[str] = None,
+        sandbox: bool = False,
+        rate_limit: Optional[Dict[str, Any]] = None,
+        rate_limit_key: Optional[str] = None,
+        retry: Optional[Dict[str, Any]] = None,
+        circuit_breaker: Optional[Dict[str, Any]] = None,
+        hedge: Optional[Dict[str, Any]] = None,
+        stats: bool = False,
+        client_order_ids: bool = False,
+        tracer: Optional[SpanFactory] = None,
+        call_log_size: int = 0,
+        slow_call_ms: Optional[float] = None,
+        candle_store: Optional[Union[str, CandleStore]] = None,
+        **kwargs,
+    ) -> AsyncMockXGateway:
+        """Create an asyncio production mode gateway with explicit configuration.
+
+        Same as create_prod_gateway, but backed by ``ccxt.async_support`` so
+        every backend call is a coroutine. Remember to ``await gateway.close()``
+        (or use ``async with``) to release the exchange's HTTP session.
+
+        Args:
+            exchange_id: CCXT exchange identifier (e.g., 'binance', 'coinbase', 'kraken')
+            api_key: API key for the exchange
+            secret: Secret key for the exchange
+            sandbox: Use sandbox/testnet if available (recommended for testing)
+            rate_limit: Enable client-side rate limiting with these RateLimiter
+                options; the limiter is shared with sync production gateways
+                for the same account (see create_prod_gateway)
+            rate_limit_key: Account key of the shared limiter (defaults to
+                one limiter per exchange and API key)
+            retry: Retry transient failures with these RetryPolicy options;
+                writes are only retried when they carry a client order id
+            circuit_breaker: Fail fast while the backend is failing, with these
+                CircuitBreaker options; shared with sync production gateways
+                for the same backend
+            hedge: Hedge slow reads with a backup request, with these HedgePolicy
+                options
+            stats: Collect per-endpoint call counts, errors and latency
+                histograms (``gateway.stats()``); off by default
+            client_order_ids: Tag orders with generated client order ids and
+                answer duplicate submissions from a local table (off by default
+                because client id formats differ between exchanges)
+            tracer: Span factory for tracing gateway methods, backend requests
+                and mappings (see core.tracing)
+            call_log_size: Number of recent calls kept for ``gateway.recent_calls()``
+                (0, the default, disables the call log unless slow_call_ms is set)
+            slow_call_ms: Log calls slower than this, with their phase timings,
+                and keep them for ``gateway.slow_calls()``
+            candle_store: Directory (or CandleStore) in which closed candles
+                from ``fetch_ohlcv(..., since=...)`` are kept, so only missing
+                ranges are downloaded again
+            **kwargs: Additional CCXT configuration options
+
+        Returns:
+            AsyncMockXGateway: Async production mode gateway instance
+
+        Raises:
+            ExchangeError: If exchange configuration is invalid
+        """
+        logger.info(
+            "Creating async production mode gateway",
+            extra={"exchange_id": exchange_id, "sandbox": sandbox},
+        )
+
+        config = ExchangeFactory._build_prod_config(api_key, secret, sandbox, kwargs)
+        rate_limiter = ExchangeFactory._build_rate_limiter(
+            rate_limit,
+            rate_limit_key or account_key(f"{exchange_id}{':sandbox' if sandbox else ''}", api_key),
+        )
+        if rate_limiter is not None:
+            # The shared limiter replaces ccxt's per-instance throttle
+            config.setdefault("enableRateLimit", False)
+
+        try:
+            adapter = AsyncProdAdapter(
+                exchange_id,
+                config,
+                rate_limiter=rate_limiter,
+                retry_policy=ExchangeFactory._build_retry_policy(retry),
+                circuit_breakers=ExchangeFactory._build_circuit_breakers(
+                    circuit_breaker, f"{exchange_id}{':sandbox' if sandbox else ''}"
+                ),
+                hedge_policy=ExchangeFactory._build_hedge_policy(hedge),
+                stats=ExchangeFactory._build_stats(stats),
+            )
+            gateway = AsyncMockXGateway(
+                adapter,
+                ExchangeFactory._build_client_orders(client_order_ids),
+                call_log=ExchangeFactory._build_call_log(call_log_size, slow_call_ms),
+                candle_store=ExchangeFactory._build_candle_store(candle_store),
+            )
+            if tracer is not None:
+                gateway.set_tracer(tracer)
+
+            logger.info(
+                "Async production mode gateway created successfully",
+                extra={
+                    "exchange_id": exchange_id,
+                    "capabilities": len(gateway.has),
+                    "mode": "production",
+                },
+            )
+
+            return gateway
+        except Exception as e:
+            logger.error(f"Failed to create async production gateway: {str(e)}")
+            raise ExchangeError(f"Failed to create {exchange_id} gateway: {str(e)}")
+
+    @staticmethod
+    def _build_prod_config(
+        api_key: Optional[str], secret: Optional[str], sandbox: bool, extra: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the CCXT config dict shared by the sync and async prod gateways."""
+        config = {"sandbox": sandbox, **extra}
+
+        if api_key:
+            config["apiKey"] = api_key
+        if secret:
+            config["secret"] = secret
+
+        return config
+
+    @staticmethod
+    def _build_rate_limiter(options: Optional[Dict[str, Any]], key: str) -> Optional[RateLimiter]:
+        """Get the shared RateLimiter for an account if rate limiting was requested."""
+        if options is None:
+            return None
+        return get_rate_limiter_registry().get(key, **options)
+
+    @staticmethod
+    def _build_retry_policy(options: Optional[Dict[str, Any]]) -> Optional[RetryPolicy]:
+        """Create a RetryPolicy if retries were requested."""
+        if options is None:
+            return None
+        return RetryPolicy(**options)
+
+    @staticmethod
+    def _build_circuit_breakers(
+        options: Optional[Dict[str, Any]], key: str
+    ) -> Optional[CircuitBreakers]:
+        """Get the shared CircuitBreakers for a backend if circuit breaking was requested."""
+        if options is None:
+            return None
+        return get_circuit_breaker_registry().get(key, **options)
+
+    @staticmethod
+    def _build_hedge_policy(options: Optional[Dict[str, Any]]) -> Optional[HedgePolicy]:
+        """Create a HedgePolicy if hedged reads were requested."""
+        if options is None:
+            return None
+        return HedgePolicy(**options)
+
+    @staticmethod
+    def _build_stats(enabled: bool) -> Optional[GatewayStats]:
+        """Create a GatewayStats collector if stats are enabled."""
+        return GatewayStats() if enabled else None
+
+    @staticmethod
+    def _build_call_log(size: int, slow_ms: Optional[float]) -> Optional[CallLog]:
+        """Create a CallLog if recent or slow calls were requested."""
+        if size <= 0 and slow_ms is None:
+            return None
+        slow_threshold = slow_ms / 1000 if slow_ms is not None else None
+        if size <= 0:
+            return CallLog(slow_threshold=slow_threshold)
+        return CallLog(size, slow_threshold)
+
+    @staticmethod
+    def _build_candle_store(
+        store: Optional[Union[str, CandleStore]],
+    ) -> Optional[CandleStore]:
+        """Open a CandleStore when given a directory."""
+        if store is None or isinstance(store, CandleStore):
+            return store
+        return CandleStore(store)
+
+    @staticmethod
+    def _build_client_orders(enabled: bool) -> Optional[ClientOrderTable]:
+        """Create a ClientOrderTable if client order ids are enabled."""
+        return ClientOrderTable() if enabled else None
+
+    @staticmethod
+    def _build_ticker_cache(ttl_ms: Optional[int], max_size: int) -> Optional[TickerCache]:
+        """Create a TickerCache if a TTL was requested."""
+        if ttl_ms is None:
+            return None
+        return TickerCache(ttl_ms=ttl_ms, max_size=max_size)
@@ -0,0 +1,275 @@
+"""runtime/prometheus.py
+
+Prometheus text exposition of gateway metrics.
+
+MetricsExporter renders the request counters, latency histograms, ticker
+cache counters, rate limiter waits and circuit breaker states of the
+registered gateways in the Prometheus text format (version 0.0.4, which
+OpenMetrics scrapers accept too). Every series is labelled with ``mode``,
+``exchange_id`` and, where it applies, ``endpoint``.
+
+The exporter only reads the stats the gateways already keep, at scrape
+time; it adds nothing to the request path. Request metrics need gateways
+created with ``stats=True``. No client library is needed.
+
+Usage:
+    >>> gateway = ExchangeFactory.create_paper_gateway(stats=True)
+    >>> exporter = MetricsExporter()
+    >>> exporter.register(gateway)
+    >>> server = exporter.serve(9464)        # GET /metrics
+    >>> payload = exporter.render()          # or render it yourself
+"""
+
+import threading
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+# Histogram bucket upper bounds in seconds (Prometheus client defaults)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Numeric encoding of circuit breaker states for the circuit_state gauge
+CIRCUIT_STATES = {"closed": 0, "half_open": 1, "open": 2}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Family:
+    """Samples of one metric family, merged across gateways.
+
+    Series with the same labels from different gateways are summed
+    (``merge="sum"``, for per-gateway counters) or take the maximum
+    (``merge="max"``, for rate limiters and breakers that gateways share).
+    """
+
+    def __init__(self, name: str, kind: str, help: str, merge: str = "sum"):
+        self.name = name
+        self.kind = kind
+        self.help = help
+        self.merge = merge
+        self.samples: Dict[Tuple[str, Labels], float] = {}
+
+    def add(self, value: float, labels: Labels, suffix: str = "") -> None:
+        key = (suffix, labels)
+        current = self.samples.get(key)
+        if current is None:
+            self.samples[key] = value
+        elif self.merge == "max":
+            self.samples[key] = max(current, value)
+        else:
+            self.samples[key] = current + value
+
+    def render(self, lines: List[str]) -> None:
+        if not self.samples:
+            return
+        lines.append(f"# HELP {self.name} {self.help}")
+        lines.append(f"# TYPE {self.name} {self.kind}")
+        for (suffix, labels), value in self.samples.items():
+            lines.append(f"{self.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+
+
+class MetricsExporter:
+    """Render gateway metrics in the Prometheus text format.
+
+    Gateways are held weakly, so a gateway that is garbage collected drops
+    out of the output without an explicit unregister. Counters are
+    cumulative since the gateway was created; calling ``gateway.stats(reset=True)``
+    elsewhere shows up as a counter reset, which Prometheus ``rate()``
+    tolerates.
+
+    Attributes:
+        prefix: Metric name prefix
+        buckets: Latency histogram bucket upper bounds in seconds
+    """
+
+    def __init__(self, prefix: str = "mockx_gateway", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self._gateways: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def register(self, gateway: Any) -> Any:
+        """Add a sync or async gateway to the output; returns the gateway."""
+        with self._lock:
+            self._gateways.add(gateway)
+        return gateway
+
+    def unregister(self, gateway: Any) -> None:
+        """Remove a gateway from the output."""
+        with self._lock:
+            self._gateways.discard(gateway)
+
+    def _families(self) -> Dict[str, _Family]:
+        p = self.prefix
+        families = [
+            _Family(f"{p}_requests_total", "counter", "Backend calls by endpoint."),
+            _Family(f"{p}_request_errors_total", "counter", "Failed backend calls by error class."),
+            _Family(f"{p}_request_bytes_sent_total", "counter", "Request body bytes sent."),
+            _Family(
+                f"{p}_request_bytes_received_total", "counter", "Response body bytes received."
+            ),
+            _Family(
+                f"{p}_request_duration_seconds",
+                "histogram",
+                "Backend call latency (phase=network) and response mapping time (phase=mapping).",
+            ),
+            _Family(f"{p}_ticker_cache_hits_total", "counter", "Ticker cache hits."),
+            _Family(f"{p}_ticker_cache_misses_total", "counter", "Ticker cache misses."),
+            _Family(f"{p}_ticker_cache_size", "gauge", "Tickers held in the cache."),
+            _Family(f"{p}_rate_limit_acquired_total", "counter", "Rate limit tokens taken.", "max"),
+            _Family(
+                f"{p}_rate_limit_waits_total", "counter", "Calls that waited for tokens.", "max"
+            ),
+            _Family(
+                f"{p}_rate_limit_wait_seconds_total",
+                "counter",
+                "Time spent waiting for tokens.",
+                "max",
+            ),
+            _Family(
+                f"{p}_rate_limit_rejected_total",
+                "counter",
+                "Calls rejected because the wait exceeded max_wait.",
+                "max",
+            ),
+            _Family(
+                f"{p}_circuit_state",
+                "gauge",
+                "Circuit breaker state (0 closed, 1 half open, 2 open).",
+                "max",
+            ),
+            _Family(f"{p}_circuit_opened_total", "counter", "Times the circuit opened.", "max"),
+            _Family(
+                f"{p}_circuit_rejected_total",
+                "counter",
+                "Calls failed fast while the circuit was open.",
+                "max",
+            ),
+        ]
+        return {family.name[len(p) + 1 :]: family for family in families}
+
+    def _collect(self, gateway: Any, families: Dict[str, _Family]) -> None:
+        base: Labels = (("mode", gateway.mode), ("exchange_id", gateway.exchange_id))
+
+        stats = gateway.stats(buckets=self.buckets)
+        for endpoint, data in stats.get("endpoints", {}).items():
+            labels = base + (("endpoint", endpoint),)
+            families["requests_total"].add(data["count"], labels)
+            for error, count in data["errors"].items():
+                families["request_errors_total"].add(count, labels + (("error", error),))
+            families["request_bytes_sent_total"].add(data["bytes_out"], labels)
+            families["request_bytes_received_total"].add(data["bytes_in"], labels)
+            for phase in ("network", "mapping"):
+                self._add_histogram(
+                    families["request_duration_seconds"],
+                    data[f"{phase}_ms"],
+                    labels + (("phase", phase),),
+                )
+
+        cache_stats = getattr(gateway, "ticker_cache_stats", None)
+        cache = cache_stats() if cache_stats is not None else {}
+        if cache:
+            families["ticker_cache_hits_total"].add(cache["hits"], base)
+            families["ticker_cache_misses_total"].add(cache["misses"], base)
+            families["ticker_cache_size"].add(cache["size"], base)
+
+        for bucket, data in gateway.rate_limit_stats().items():
+            if bucket == "weights":
+                continue
+            labels = base + (("bucket", bucket),)
+            families["rate_limit_acquired_total"].add(data["acquired"], labels)
+            families["rate_limit_waits_total"].add(data["waited"], labels)
+            families["rate_limit_wait_seconds_total"].add(data["wait_ms_total"] / 1000, labels)
+            families["rate_limit_rejected_total"].add(data["rejected"], labels)
+
+        for endpoint_class, data in gateway.circuit_stats().items():
+            labels = base + (("endpoint_class", endpoint_class),)
+            families["circuit_state"].add(CIRCUIT_STATES.get(data["state"], 0), labels)
+            families["circuit_opened_total"].add(data["times_opened"], labels)
+            families["circuit_rejected_total"].add(data["rejected"], labels)
+
+    def _add_histogram(self, family: _Family, summary: Dict[str, Any], labels: Labels) -> None:
+        for bound, count in zip(self.buckets, summary["buckets"]):
+            family.add(count, labels + (("le", _format_value(bound)),), "_bucket")
+        family.add(summary["count"], labels + (("le", "+Inf"),), "_bucket")
+        family.add(summary["sum"] / 1000, labels, "_sum")
+        family.add(summary["count"], labels, "_count")
+
+    def render(self) -> str:
+        """Return the exposition payload for every registered gateway."""
+        with self._lock:
+            gateways: Iterable[Any] = list(self._gateways)
+        families = self._families()
+        for gateway in gateways:
+            self._collect(gateway, families)
+        lines: List[str] = []
+        for family in families.values():
+            family.render(lines)
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def serve(self, port: int = 9464, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve ``GET /metrics`` from a daemon thread; call ``shutdown()`` to stop."""
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, name="mockx-metrics", daemon=True)
+        thread.start()
+        return server
+
+
+def render_metrics(gateways: Iterable[Any], prefix: str = "mockx_gateway") -> str:
+    """Render metrics for gateways once, without keeping an exporter around."""
+    exporter = MetricsExporter(prefix)
+    for gateway in gateways:
+        exporter.register(gateway)
+    return exporter.render()
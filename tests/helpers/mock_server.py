@@ -0,0 +1,81 @@
+"""In-process HTTP server that imitates a small part of the MockExchange API.
+
+Unit tests use it to exercise the real requests code path of PaperAdapter
+(connection pooling, encoding, error mapping) without a MockExchange
+instance.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# A route handler receives (method, path, body) and returns (status, payload)
+Handler = Callable[[str, str, Optional[Dict[str, Any]]], Tuple[int, Any]]
+
+
+def default_handler(method: str, path: str, body: Optional[Dict[str, Any]]) -> Tuple[int, Any]:
+    """Serve a few MockExchange endpoints with static data."""
+    if path == "/tickers":
+        return 200, ["BTC/USDT", "ETH/USDT"]
+    if path.startswith("/tickers/"):
+        symbols = path[len("/tickers/") :].split(",")
+        return 200, {s: {"symbol": s, "timestamp": 1700000000000, "last": 1.0} for s in symbols}
+    if path == "/balance":
+        return 200, {"assets": [{"asset": "USDT", "free": 100.0, "used": 0.0, "total": 100.0}]}
+    if method == "POST" and path == "/orders":
+        return 200, {"id": "order-1", "status": "new", **(body or {})}
+    return 404, {"message": f"not found: {path}"}
+
+
+class MockExchangeServer:
+    """Threaded HTTP/1.1 server with keep-alive, recording every request.
+
+    Usage:
+        >>> with MockExchangeServer() as server:
+        ...     adapter = PaperAdapter(server.url, "test-key")
+    """
+
+    def __init__(self, handler: Handler = default_handler):
+        self.handler = handler
+        self.requests: List[Tuple[str, str, Dict[str, str]]] = []
+        outer = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                body = json.loads(raw) if raw else None
+                outer.requests.append((self.command, self.path, dict(self.headers)))
+                status, payload = outer.handler(self.command, self.path.split("?")[0], body)
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = _serve
+            do_POST = _serve
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "MockExchangeServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
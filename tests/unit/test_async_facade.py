@@ -0,0 +1,222 @@
+"""Unit tests for the asyncio gateway facade and paper adapter.
+
+These tests run the async paper adapter against an in-process aiohttp
+server instead of a real MockExchange instance.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from unittest.mock import AsyncMock
+
+import ccxt.async_support as ccxt_async
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from mockexchange_gateway import AsyncMockXGateway, ExchangeFactory, InsufficientFunds, NotSupported
+from mockexchange_gateway.adapters.paper_async import AsyncPaperAdapter
+from mockexchange_gateway.adapters.prod_async import AsyncProdAdapter
+from mockexchange_gateway.core.circuit import CircuitBreakers
+from mockexchange_gateway.core.errors import ExchangeNotAvailable
+from mockexchange_gateway.core.retry import RetryPolicy
+from mockexchange_gateway.core.stats import GatewayStats
+
+
+def _make_app() -> web.Application:
+    async def tickers(request):
+        return web.json_response(["BTC/USDT", "ETH/USDT"])
+
+    async def ticker(request):
+        symbols = request.match_info["symbols"].split(",")
+        return web.json_response(
+            {s: {"symbol": s, "timestamp": 1700000000000, "last": 100.0} for s in symbols}
+        )
+
+    async def create_order(request):
+        body = await request.json()
+        if body["amount"] > 10:
+            return web.json_response({"message": "insufficient balance"}, status=422)
+        return web.json_response({"id": "o1", "status": "new", **body})
+
+    app = web.Application()
+    app.router.add_get("/tickers", tickers)
+    app.router.add_get("/tickers/{symbols:.+}", ticker)
+    app.router.add_post("/orders", create_order)
+    return app
+
+
+async def _with_gateway(test):
+    server = TestServer(_make_app())
+    await server.start_server()
+    try:
+        gateway = ExchangeFactory.create_async_paper_gateway(
+            base_url=str(server.make_url("")), api_key="test-key"
+        )
+        async with gateway:
+            return await test(gateway)
+    finally:
+        await server.close()
+
+
+class TestAsyncMockXGateway:
+    """Test the asyncio MockX Gateway facade."""
+
+    def test_gateway_initialization_paper_mode(self):
+        """Test gateway initialization with the async paper adapter."""
+        gateway = AsyncMockXGateway(AsyncPaperAdapter("http://localhost:8000", "test-key"))
+
+        assert gateway._mode == "paper"
+        assert gateway.has.get("fetchTicker") is True
+        assert "paper" in str(gateway)
+
+    def test_gateway_delegates_to_adapter(self):
+        """Test that the async gateway awaits the adapter."""
+        mock_adapter = AsyncMock()
+        mock_adapter.fetch_ticker.return_value = {"symbol": "BTC/USDT"}
+
+        gateway = AsyncMockXGateway(mock_adapter)
+        result = asyncio.run(gateway.fetch_ticker("BTC/USDT"))
+
+        mock_adapter.fetch_ticker.assert_awaited_once_with("BTC/USDT")
+        assert result == {"symbol": "BTC/USDT"}
+
+    def test_unsupported_methods_raise(self):
+        """Test that paper-mode limitations match the sync gateway."""
+        gateway = AsyncMockXGateway(AsyncPaperAdapter("http://localhost:8000", "test-key"))
+
+        with pytest.raises(NotSupported):
+            asyncio.run(gateway.fetch_ohlcv("BTC/USDT"))
+
+    def test_concurrent_fetch_ticker(self):
+        """Test that concurrent calls share the session and map tickers."""
+
+        async def test(gateway):
+            return await asyncio.gather(*(gateway.fetch_ticker("BTC/USDT") for _ in range(20)))
+
+        tickers = asyncio.run(_with_gateway(test))
+
+        assert len(tickers) == 20
+        assert all(t["symbol"] == "BTC/USDT" and t["last"] == 100.0 for t in tickers)
+        assert tickers[0]["datetime"] == "2023-11-14T22:13:20Z"
+
+    def test_error_mapping(self):
+        """Test that HTTP errors map to the same exceptions as the sync adapter."""
+
+        async def test(gateway):
+            order = await gateway.create_order("BTC/USDT", "market", "buy", 1.0)
+            with pytest.raises(InsufficientFunds):
+                await gateway.create_order("BTC/USDT", "market", "buy", 100.0)
+            return order
+
+        order = asyncio.run(_with_gateway(test))
+
+        assert order["id"] == "o1"
+        assert order["status"] == "open"
+
+    def test_create_async_prod_gateway(self):
+        """Test creating an async production gateway backed by ccxt.async_support."""
+        gateway = ExchangeFactory.create_async_prod_gateway(
+            exchange_id="binance", api_key="test-key", secret="test-secret", sandbox=True
+        )
+
+        assert gateway._mode == "prod"
+        assert isinstance(gateway._adapter, AsyncProdAdapter)
+        assert isinstance(gateway._adapter.exchange, ccxt_async.Exchange)
+        assert gateway._adapter.config["apiKey"] == "test-key"
+        assert gateway.has.get("fetchOHLCV") is True
+
+        asyncio.run(gateway.close())
+
+    def test_async_prod_adapter_normalizes_symbols(self):
+        """Test that the async prod adapter normalizes symbols like ProdAdapter."""
+        adapter = AsyncProdAdapter("binance", {"sandbox": True})
+        adapter._exchange = AsyncMock()
+        adapter._exchange.fetch_ticker.return_value = {"symbol": "BTC/USDT"}
+
+        asyncio.run(adapter.fetch_ticker("btcusdt"))
+
+        adapter._exchange.fetch_ticker.assert_awaited_once_with("BTC/USDT")
+
+
+class TestAsyncProdAdapter:
+    """Test the resilience layer of the async production adapter."""
+
+    def test_retries_reads_but_not_plain_writes(self):
+        """Test that ccxt network errors are retried for reads only."""
+        adapter = AsyncProdAdapter(
+            "binance", {"sandbox": True}, retry_policy=RetryPolicy(max_attempts=2, base_delay=0)
+        )
+        adapter._exchange = AsyncMock()
+        adapter._exchange.fetch_ticker.side_effect = [
+            ccxt_async.RequestTimeout("slow"),
+            {"last": 1},
+        ]
+        adapter._exchange.create_order.side_effect = ccxt_async.RequestTimeout("slow")
+
+        assert asyncio.run(adapter.fetch_ticker("BTC/USDT")) == {"last": 1}
+        with pytest.raises(ccxt_async.RequestTimeout):
+            asyncio.run(adapter.create_order("BTC/USDT", "market", "buy", 1.0))
+        assert adapter._exchange.create_order.await_count == 1
+        assert adapter.retry_policy.stats()["recovered"] == 1
+
+    def test_breaker_stats_and_spans(self):
+        """Test that failures open the breaker and calls are timed and traced."""
+        spans = []
+
+        @contextmanager
+        def tracer(name, attributes):
+            spans.append(name)
+            yield None
+
+        adapter = AsyncProdAdapter(
+            "binance",
+            {"sandbox": True},
+            circuit_breakers=CircuitBreakers("test", failure_threshold=2, recovery_timeout=60),
+            stats=GatewayStats(),
+        )
+        adapter._exchange = AsyncMock()
+        adapter._exchange.fetch_balance.side_effect = ccxt_async.NetworkError("reset")
+        adapter._exchange.fetch_ticker.return_value = {"last": 1}
+        gateway = AsyncMockXGateway(adapter)
+        gateway.set_tracer(tracer)
+
+        async def run():
+            await gateway.fetch_ticker("BTC/USDT")
+            for _ in range(2):
+                with pytest.raises(ccxt_async.NetworkError):
+                    await gateway.fetch_balance()
+            with pytest.raises(ExchangeNotAvailable, match="Circuit open"):
+                await gateway.fetch_balance()
+
+        asyncio.run(run())
+
+        assert adapter._exchange.fetch_balance.await_count == 2
+        assert not gateway.is_available("fetch_balance")
+        assert gateway.is_available("create_order")
+        endpoints = gateway.stats()["endpoints"]
+        assert endpoints["fetch_ticker"]["count"] == 1
+        assert endpoints["fetch_balance"]["errors"] == {
+            "NetworkError": 2,
+            "ExchangeNotAvailable": 1,
+        }
+        assert spans[:2] == ["gateway.fetch_ticker", "ccxt.fetch_ticker"]
+
+    def test_factory_options(self):
+        """Test that the async production factory wires the same options as the sync one."""
+        gateway = ExchangeFactory.create_async_prod_gateway(
+            "binance",
+            sandbox=True,
+            retry={"max_attempts": 4},
+            circuit_breaker={"failure_threshold": 3},
+            hedge={"percentile": 90},
+            stats=True,
+        )
+        adapter = gateway._adapter
+
+        assert adapter.retry_policy.max_attempts == 4
+        # Shared with sync gateways for the same backend
+        assert adapter.circuit_breakers.name == "binance:sandbox"
+        assert adapter.hedge_policy.percentile == 90
+        assert adapter.stats is not None
+
+        asyncio.run(gateway.close())
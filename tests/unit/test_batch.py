@@ -0,0 +1,228 @@
+"""Unit tests for batch order creation and cancellation.
+
+These tests verify ordering, concurrency limits and per-item error
+reporting without making real API calls.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+
+from mockexchange_gateway import (
+    AsyncMockXGateway,
+    BadRequest,
+    ExchangeError,
+    InsufficientFunds,
+    MockXGateway,
+    NetworkError,
+    OrderNotFound,
+    RequestTimeout,
+)
+from mockexchange_gateway.adapters.paper import PaperAdapter, chunk_symbols
+from mockexchange_gateway.adapters.prod import ProdAdapter
+from mockexchange_gateway.adapters.prod_async import AsyncProdAdapter
+from mockexchange_gateway.core.batch import run_batch
+
+
+class TestRunBatch:
+    """Test the batch execution helper."""
+
+    def test_results_keep_input_order(self):
+        """Test that results come back in input order despite concurrency."""
+
+        def work(i):
+            time.sleep(0.01 * (5 - i))
+            return i * 10
+
+        results = run_batch(work, range(5), max_concurrency=5)
+
+        assert [r.index for r in results] == [0, 1, 2, 3, 4]
+        assert [r.result for r in results] == [0, 10, 20, 30, 40]
+        assert all(r.ok for r in results)
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrency calls run at once."""
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def work(_):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.01)
+            with lock:
+                state["running"] -= 1
+
+        run_batch(work, range(20), max_concurrency=3)
+
+        assert state["peak"] <= 3
+
+    def test_errors_are_reported_per_item(self):
+        """Test that one failure does not affect the other items."""
+
+        def work(i):
+            if i == 1:
+                raise InsufficientFunds("no funds")
+            return i
+
+        results = run_batch(work, range(3))
+
+        assert results[0].ok and results[2].ok
+        assert isinstance(results[1].error, InsufficientFunds)
+        assert results[1].result is None
+
+
+class TestBatchOrders:
+    """Test create_orders / cancel_orders on the gateway."""
+
+    def test_paper_create_orders(self):
+        """Test that paper mode creates each order and reports bad specs."""
+        adapter = PaperAdapter("http://localhost:8000", "test-key")
+        adapter.create_order = Mock(side_effect=lambda s, t, sd, a, p, pr: {"symbol": s})
+        gateway = MockXGateway(adapter)
+
+        results = gateway.create_orders(
+            [
+                {"symbol": "BTC/USDT", "type": "market", "side": "buy", "amount": 1},
+                {"symbol": "ETH/USDT", "type": "market", "side": "buy"},
+                {"symbol": "SOL/USDT", "type": "limit", "side": "sell", "amount": 2, "price": 5},
+            ]
+        )
+
+        assert results[0].result == {"symbol": "BTC/USDT"}
+        assert isinstance(results[1].error, BadRequest)
+        assert results[2].result == {"symbol": "SOL/USDT"}
+        adapter.create_order.assert_any_call("SOL/USDT", "limit", "sell", 2, 5, None)
+
+    def test_paper_cancel_orders(self):
+        """Test that paper mode cancels every id."""
+        adapter = PaperAdapter("http://localhost:8000", "test-key")
+        adapter.cancel_order = Mock(side_effect=lambda order_id, symbol: {"id": order_id})
+        gateway = MockXGateway(adapter)
+
+        results = gateway.cancel_orders(["a", "b", "c"], max_concurrency=2)
+
+        assert [r.result["id"] for r in results] == ["a", "b", "c"]
+
+    def test_prod_uses_native_batch_endpoint(self):
+        """Test that prod mode uses ccxt createOrders when the exchange has it."""
+        adapter = ProdAdapter("binance", {"sandbox": True})
+        exchange = Mock()
+        exchange.has = {"createOrders": True, "cancelOrders": True}
+        exchange.create_orders.return_value = [{"id": "1"}, {"id": "2"}]
+        exchange.cancel_orders.return_value = [{"id": "1"}, {"id": "2"}]
+        adapter._exchange = exchange
+
+        created = adapter.create_orders(
+            [
+                {"symbol": "btcusdt", "type": "market", "side": "buy", "amount": 1},
+                {"symbol": "ETH/USDT", "type": "limit", "side": "buy", "amount": 1, "price": 2},
+            ]
+        )
+        canceled = adapter.cancel_orders(["1", "2"], symbol="BTC/USDT")
+
+        sent = exchange.create_orders.call_args[0][0]
+        assert sent[0]["symbol"] == "BTC/USDT"
+        assert [r.result["id"] for r in created] == ["1", "2"]
+        exchange.cancel_orders.assert_called_once_with(["1", "2"], "BTC/USDT")
+        assert all(r.ok for r in canceled)
+        exchange.create_order.assert_not_called()
+
+    def test_acknowledgement_is_not_reported_as_success(self):
+        """Test that a batch response without per-order results marks every item unknown."""
+        adapter = ProdAdapter("binance", {"sandbox": True})
+        exchange = Mock()
+        exchange.has = {"createOrders": True, "cancelOrders": True}
+        exchange.create_orders.return_value = {"code": 0, "msg": "accepted"}
+        exchange.cancel_orders.return_value = [{"id": "1"}]
+        adapter._exchange = exchange
+
+        created = adapter.create_orders(
+            [{"symbol": "BTC/USDT", "type": "market", "side": "buy", "amount": 1}] * 2
+        )
+        canceled = adapter.cancel_orders(["1", "2"], symbol="BTC/USDT")
+
+        for result in created + canceled:
+            assert isinstance(result.error, ExchangeError)
+            assert "unknown" in str(result.error)
+
+    def test_async_prod_uses_native_batch_endpoint(self):
+        """Test that the async gateway sends batches like the sync one."""
+        adapter = AsyncProdAdapter("binance", {"sandbox": True})
+        exchange = AsyncMock()
+        exchange.has = {"createOrders": True, "cancelOrders": True}
+        exchange.create_orders.return_value = [{"id": "1"}, {"id": "2"}]
+        exchange.cancel_orders.return_value = [{"id": "1"}]
+        adapter._exchange = exchange
+        gateway = AsyncMockXGateway(adapter)
+        spec = {"symbol": "BTC/USDT", "type": "market", "side": "buy", "amount": 1}
+
+        created = asyncio.run(gateway.create_orders([spec, {"symbol": "BTC/USDT"}, spec]))
+        canceled = asyncio.run(gateway.cancel_orders(["1", "2"], symbol="BTC/USDT"))
+
+        assert [r.result["id"] for r in (created[0], created[2])] == ["1", "2"]
+        assert isinstance(created[1].error, BadRequest)
+        exchange.create_order.assert_not_called()
+        assert all(not r.ok for r in canceled)
+
+
+class TestOpenOrdersFallback:
+    """Test the /orders/list fallback in PaperAdapter.fetch_open_orders."""
+
+    def test_fallback_fetches_concurrently_and_reports_skipped(self):
+        """Test that failed detail lookups are reported, not dropped."""
+        adapter = PaperAdapter("http://localhost:8000", "test-key")
+        statuses = {"1": "new", "2": "filled", "3": "partially_filled"}
+
+        def make_request(method, endpoint, **kwargs):
+            if endpoint == "/orders":
+                raise NetworkError("orders endpoint unavailable")
+            if endpoint == "/orders/list":
+                return {"orders": ["1", "2", "3", "4"]}
+            order_id = endpoint.rsplit("/", 1)[-1]
+            if order_id == "4":
+                raise OrderNotFound("gone")
+            return {"id": order_id, "status": statuses[order_id]}
+
+        adapter._make_request = Mock(side_effect=make_request)
+
+        orders = adapter.fetch_open_orders()
+
+        assert sorted(o["id"] for o in orders) == ["1", "3"]
+        assert list(orders.skipped) == ["4"]
+        assert isinstance(orders.skipped["4"], OrderNotFound)
+        assert not orders.complete
+
+
+class TestChunkedTickers:
+    """Test chunked fetch_tickers in the paper adapter."""
+
+    def test_chunk_symbols_respects_path_length(self):
+        """Test that every chunk's path fits within the limit."""
+        symbols = [f"SYM{i}/USDT" for i in range(1000)]
+
+        chunks = chunk_symbols(symbols, 200)
+
+        assert [s for chunk in chunks for s in chunk] == symbols
+        assert all(len("/tickers/" + ",".join(chunk)) <= 200 for chunk in chunks)
+
+    def test_failed_chunk_is_reported(self):
+        """Test that one failing chunk does not empty the snapshot."""
+        adapter = PaperAdapter("http://localhost:8000", "test-key", max_url_length=100)
+        symbols = [f"SYM{i}/USDT" for i in range(40)]
+
+        def make_request(method, endpoint, **kwargs):
+            chunk = endpoint[len("/tickers/") :].split(",")
+            if "SYM0/USDT" in chunk:
+                raise RequestTimeout("slow chunk")
+            return {s: {"symbol": s, "last": 1.0} for s in chunk}
+
+        adapter._make_request = Mock(side_effect=make_request)
+
+        tickers = adapter.fetch_tickers(symbols)
+
+        assert adapter._make_request.call_count > 1
+        assert "SYM0/USDT" in tickers.skipped
+        assert len(tickers) + len(tickers.skipped) == 40
+        assert tickers["SYM39/USDT"]["last"] == 1.0
@@ -0,0 +1,91 @@
+"""Unit tests for the ticker cache.
+
+These tests verify TTL, LRU eviction and gateway integration without
+making real API calls.
+"""
+
+import time
+from unittest.mock import Mock
+
+from mockexchange_gateway import ExchangeFactory, MockXGateway, TickerCache
+
+
+class TestTickerCache:
+    """Test the TickerCache class."""
+
+    def test_hit_and_miss_counters(self):
+        """Test that lookups are counted."""
+        cache = TickerCache(ttl_ms=1000)
+
+        assert cache.get("BTC/USDT") is None
+        cache.put("BTC/USDT", {"symbol": "BTC/USDT"})
+        assert cache.get("BTC/USDT") == {"symbol": "BTC/USDT"}
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+
+    def test_staleness_bound(self):
+        """Test that per-call max_age_ms overrides the default TTL."""
+        cache = TickerCache(ttl_ms=10_000)
+        cache.put("BTC/USDT", {"symbol": "BTC/USDT"})
+        time.sleep(0.02)
+
+        assert cache.get("BTC/USDT") is not None
+        assert cache.get("BTC/USDT", max_age_ms=5) is None
+        assert cache.get("BTC/USDT", max_age_ms=0) is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used symbol is evicted."""
+        cache = TickerCache(ttl_ms=1000, max_size=2)
+        cache.put("A/USDT", {})
+        cache.put("B/USDT", {})
+        cache.get("A/USDT")
+        cache.put("C/USDT", {})
+
+        assert cache.get("B/USDT") is None
+        assert cache.get("A/USDT") is not None
+        assert cache.stats()["evictions"] == 1
+
+
+class TestGatewayTickerCache:
+    """Test the gateway's use of the ticker cache."""
+
+    def test_fetch_ticker_uses_cache(self):
+        """Test that repeated fetch_ticker calls hit the backend once."""
+        adapter = Mock()
+        adapter.fetch_ticker.return_value = {"symbol": "BTC/USDT", "last": 1.0}
+        gateway = MockXGateway(adapter, TickerCache(ttl_ms=1000))
+
+        for _ in range(5):
+            gateway.fetch_ticker("BTC/USDT")
+        gateway.fetch_ticker("btc/usdt", max_age_ms=0)
+
+        assert adapter.fetch_ticker.call_count == 2
+        assert gateway.ticker_cache_stats()["hits"] == 4
+
+    def test_fetch_tickers_refreshes_and_fetches_only_missing(self):
+        """Test that fetch_tickers fills the cache and skips fresh symbols."""
+        adapter = Mock()
+        adapter.fetch_tickers.side_effect = lambda symbols: {
+            s: {"symbol": s} for s in (symbols or ["BTC/USDT", "ETH/USDT"])
+        }
+        gateway = MockXGateway(adapter, TickerCache(ttl_ms=1000))
+
+        gateway.fetch_tickers()
+        result = gateway.fetch_tickers(["BTC/USDT", "ETH/USDT", "SOL/USDT"])
+        gateway.fetch_ticker("ETH/USDT")
+
+        assert set(result) == {"BTC/USDT", "ETH/USDT", "SOL/USDT"}
+        adapter.fetch_tickers.assert_called_with(["SOL/USDT"])
+        adapter.fetch_ticker.assert_not_called()
+
+    def test_cache_disabled_by_default(self):
+        """Test that gateways created without a TTL have no cache."""
+        gateway = ExchangeFactory.create_paper_gateway(api_key="test-key")
+        cached = ExchangeFactory.create_paper_gateway(api_key="test-key", ticker_cache_ttl_ms=250)
+
+        assert gateway.ticker_cache is None
+        assert gateway.ticker_cache_stats() == {}
+        assert cached.ticker_cache.ttl_ms == 250
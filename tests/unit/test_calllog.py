@@ -0,0 +1,109 @@
+"""Unit tests for the recent-call ring buffer and slow-call log."""
+
+import logging
+import time
+
+import pytest
+
+from mockexchange_gateway import ExchangeFactory
+from mockexchange_gateway.core.calllog import CallLog, RingBuffer, add_phase, summarize_args
+from mockexchange_gateway.core.errors import ExchangeNotAvailable
+from tests.helpers.mock_server import MockExchangeServer, default_handler
+
+
+def handler(method, path, body):
+    """Fail /balance with 503, serve everything else normally."""
+    if path == "/balance":
+        return 503, {"message": "down"}
+    return default_handler(method, path, body)
+
+
+class TestRingBuffer:
+    """Test the fixed-size buffer."""
+
+    def test_keeps_newest_items_first(self):
+        """Test that the oldest items are overwritten and reads are newest first."""
+        ring = RingBuffer(3)
+        for i in range(5):
+            ring.append(i)
+
+        assert ring.items() == [4, 3, 2]
+        assert ring.items(limit=2) == [4, 3]
+
+    def test_rejects_empty_size(self):
+        """Test that a zero size is refused."""
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+
+
+class TestCallLog:
+    """Test call records and the slow threshold."""
+
+    def test_summarizes_arguments(self):
+        """Test that containers are shown by size and long summaries truncated."""
+        assert summarize_args(("BTC/USDT", [1, 2]), {"params": {"a": 1}}) == (
+            "'BTC/USDT', [2 items], params={1 keys}"
+        )
+        assert len(summarize_args(("x" * 500,), {})) == 120
+
+    def test_slow_call_is_logged_with_phases(self, caplog):
+        """Test that a call over the threshold is kept and logged with its phases."""
+        log = CallLog(size=4, slow_threshold=0.01)
+        record, token = log.begin("fetch_ticker", ("BTC/USDT",), {})
+        add_phase("server", 0.02)
+        time.sleep(0.02)
+        with caplog.at_level(logging.WARNING, logger="mockexchange_gateway.core.calllog"):
+            log.end(record, token)
+
+        fast, token = log.begin("fetch_balance", (), {})
+        log.end(fast, token)
+
+        assert [call["method"] for call in log.recent_calls()] == ["fetch_balance", "fetch_ticker"]
+        (slow,) = log.slow_calls()
+        assert slow["method"] == "fetch_ticker"
+        assert slow["outcome"] == "ok"
+        assert slow["phases_ms"]["server"] == 20.0
+        assert "Slow gateway call fetch_ticker('BTC/USDT')" in caplog.text
+
+    def test_phases_outside_a_call_are_ignored(self):
+        """Test that add_phase without a call in progress is a no-op."""
+        log = CallLog(size=4)
+        add_phase("server", 1.0)
+        record, token = log.begin("fetch_balance", (), {})
+        log.end(record, token)
+
+        assert log.recent_calls()[0]["phases_ms"] == {}
+
+
+class TestGatewayCallLog:
+    """Test the call log on a paper gateway."""
+
+    def test_recent_calls_show_phases_and_outcome(self):
+        """Test that paper calls are logged with server, decode and map phases."""
+        with MockExchangeServer(handler) as server:
+            gateway = ExchangeFactory.create_paper_gateway(
+                base_url=server.url, api_key="k", slow_call_ms=0
+            )
+            gateway.create_order("BTC/USDT", "limit", "buy", 1.0, 100.0)
+            with pytest.raises(ExchangeNotAvailable):
+                gateway.fetch_balance()
+            gateway.close()
+
+        failed, order = gateway.recent_calls()
+        assert order["method"] == "create_order"
+        assert order["args"].startswith("'BTC/USDT', 'limit', 'buy'")
+        assert order["outcome"] == "ok"
+        assert {"connect", "server", "decode", "map"} <= set(order["phases_ms"])
+        assert failed["outcome"] == "ExchangeNotAvailable"
+        assert gateway.recent_calls(limit=1) == [failed]
+        assert len(gateway.slow_calls()) == 2
+
+    def test_disabled_call_log_returns_nothing(self):
+        """Test that the call log is off by default."""
+        with MockExchangeServer() as server:
+            gateway = ExchangeFactory.create_paper_gateway(base_url=server.url, api_key="k")
+            gateway.fetch_balance()
+            gateway.close()
+
+        assert gateway.recent_calls() == []
+        assert gateway.slow_calls() == []
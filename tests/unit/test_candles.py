@@ -0,0 +1,290 @@
+"""Unit tests for the on-disk OHLCV candle store."""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from mockexchange_gateway.adapters.prod import ProdAdapter
+from mockexchange_gateway.core.backfill import backfill, plan_windows
+from mockexchange_gateway.core.candles import CandleStore, subtract_ranges, timeframe_ms
+from mockexchange_gateway.core.errors import NetworkError, NotSupported
+from mockexchange_gateway.core.facade import MockXGateway
+
+MINUTE = 60_000
+T0 = 1_700_000_040_000  # a whole minute
+
+
+def candle(ts):
+    return [ts, 1.0, 2.0, 0.5, float(ts // MINUTE % 1000), 10.0]
+
+
+class FakeExchange:
+    """fetch_ohlcv over one candle a minute, with an optional gap."""
+
+    def __init__(self, gap=None):
+        self.gap = gap or (0, 0)
+        self.calls = []
+
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        self.calls.append((since, limit))
+        rows = []
+        ts = T0 if since is None else since
+        while len(rows) < limit and ts < T0 + 1000 * MINUTE:
+            if not self.gap[0] <= ts < self.gap[1]:
+                rows.append(candle(ts))
+            ts += MINUTE
+        return rows
+
+
+class TestCandleStore:
+    """Test filling, reading and reopening a store."""
+
+    def test_ranges(self):
+        """Test range subtraction and timeframe parsing."""
+        assert subtract_ranges((0, 10), [(2, 4), (6, 8)]) == [(0, 2), (4, 6), (8, 10)]
+        assert subtract_ranges((3, 5), [(0, 10)]) == []
+        assert timeframe_ms("4h") == 4 * 3_600_000
+        with pytest.raises(ValueError):
+            timeframe_ms("1M")
+
+    def test_fill_fetches_only_missing_ranges(self, tmp_path):
+        """Test that a second, wider fill only fetches what the first did not."""
+        store = CandleStore(str(tmp_path), page_limit=50)
+        exchange = FakeExchange()
+
+        added = store.fill(exchange.fetch_ohlcv, "x", "BTC/USDT", "1m", T0, T0 + 120 * MINUTE)
+        assert added == 120
+        assert exchange.calls[:3] == [(T0, 50), (T0 + 50 * MINUTE, 50), (T0 + 100 * MINUTE, 50)]
+
+        exchange.calls.clear()
+        store.fill(exchange.fetch_ohlcv, "x", "BTC/USDT", "1m", T0 - 10 * MINUTE, T0 + 130 * MINUTE)
+        assert exchange.calls == [(T0 - 10 * MINUTE, 50), (T0 + 120 * MINUTE, 50)]
+
+        rows = store.read("x", "BTC/USDT", "1m", T0 - 10 * MINUTE, T0 + 130 * MINUTE)
+        assert [row[0] for row in rows] == [T0 + i * MINUTE for i in range(-10, 130)]
+        assert rows[0] == candle(T0 - 10 * MINUTE)
+
+    def test_gaps_are_not_fetched_again(self, tmp_path):
+        """Test that a range without candles is remembered as fetched."""
+        exchange = FakeExchange(gap=(T0 + 10 * MINUTE, T0 + 20 * MINUTE))
+        store = CandleStore(str(tmp_path), page_limit=5)
+        store.fill(exchange.fetch_ohlcv, "x", "BTC/USDT", "1m", T0, T0 + 30 * MINUTE)
+
+        exchange.calls.clear()
+        store.fill(exchange.fetch_ohlcv, "x", "BTC/USDT", "1m", T0, T0 + 30 * MINUTE)
+        assert exchange.calls == []
+        assert len(store.read("x", "BTC/USDT", "1m", T0, T0 + 30 * MINUTE)) == 20
+
+    def test_empty_pages_are_not_recorded(self, tmp_path):
+        """Test that a page without candles in range leaves the range to fetch again."""
+        exchange = FakeExchange()
+        responses = [[], [candle(T0 + 500 * MINUTE)]]
+
+        def fetch(symbol, timeframe, since, limit):
+            if responses:
+                return responses.pop(0)
+            return exchange.fetch_ohlcv(symbol, timeframe, since, limit)
+
+        store = CandleStore(str(tmp_path), page_limit=50)
+        args = ("x", "BTC/USDT", "1m", T0, T0 + 20 * MINUTE)
+        # A transient empty response, then one that ignores since
+        assert store.fill(fetch, *args) == 0
+        assert store.fill(fetch, *args) == 0
+        assert store.missing(*args) == [(T0, T0 + 20 * MINUTE)]
+
+        assert store.fill(fetch, *args) == 20
+        assert store.missing(*args) == []
+
+    def test_concurrent_fills(self, tmp_path):
+        """Test that two fills of the same range both succeed and store it once."""
+        exchange = FakeExchange()
+        barrier = threading.Barrier(2)
+
+        def fetch(symbol, timeframe, since, limit):
+            if since == T0:
+                # Both fills fetch the first page before either stores it
+                barrier.wait(timeout=5)
+            return exchange.fetch_ohlcv(symbol, timeframe, since, limit)
+
+        store = CandleStore(str(tmp_path), page_limit=10)
+        args = ("x", "BTC/USDT", "1m", T0, T0 + 30 * MINUTE)
+        with ThreadPoolExecutor(2) as pool:
+            added = list(pool.map(lambda _: store.fill(fetch, *args), range(2)))
+
+        assert sum(added) == 30
+        assert [row[0] for row in store.read(*args)] == [T0 + i * MINUTE for i in range(30)]
+        assert store.missing(*args) == []
+
+    def test_clear(self, tmp_path):
+        """Test that a cleared series is fetched again."""
+        exchange = FakeExchange()
+        store = CandleStore(str(tmp_path))
+        args = ("x", "BTC/USDT", "1m", T0, T0 + 5 * MINUTE)
+        store.fill(exchange.fetch_ohlcv, *args)
+        assert len(store.read(*args)) == 5
+
+        store.clear("x", "BTC/USDT", "1m")
+
+        assert store.read(*args) == [] and store.missing(*args) == [args[3:]]
+        assert CandleStore(str(tmp_path)).covered("x", "BTC/USDT", "1m") == []
+        assert store.fill(exchange.fetch_ohlcv, *args) == 5
+
+    def test_reopen_and_interrupted_write(self, tmp_path):
+        """Test that a new store reads the same data and ignores unindexed rows."""
+        store = CandleStore(str(tmp_path), page_limit=10, segment_rows=20)
+        store.fill(FakeExchange().fetch_ohlcv, "x", "ETH/USDT", "1m", T0, T0 + 40 * MINUTE)
+        directory = os.path.join(str(tmp_path), "x", "ETH-USDT", "1m")
+        assert sorted(os.listdir(directory)) == ["000000.bin", "000001.bin", "index.json"]
+        with open(os.path.join(directory, "000001.bin"), "ab") as f:
+            f.write(b"\x01" * 30)
+
+        reopened = CandleStore(str(tmp_path))
+        assert reopened.covered("x", "ETH/USDT", "1m") == [(T0, T0 + 40 * MINUTE)]
+        rows = reopened.read("x", "ETH/USDT", "1m", T0, T0 + 40 * MINUTE)
+        assert rows == store.read("x", "ETH/USDT", "1m", T0, T0 + 40 * MINUTE)
+        assert len(rows) == 40
+
+        block = reopened.read("x", "ETH/USDT", "1m", T0, T0 + 2 * MINUTE, format="array")
+        assert block.tolist() == candle(T0) + candle(T0 + MINUTE)
+
+    def test_append_rejects_overlap(self, tmp_path):
+        """Test that a range can only be stored once."""
+        store = CandleStore(str(tmp_path))
+        store.append("x", "BTC/USDT", "1m", [candle(T0)], T0, T0 + MINUTE)
+        with pytest.raises(ValueError):
+            store.append("x", "BTC/USDT", "1m", [candle(T0)], T0, T0 + MINUTE)
+
+    def test_numpy_formats(self, tmp_path):
+        """Test the structured view and the 2-D block."""
+        np = pytest.importorskip("numpy")
+        store = CandleStore(str(tmp_path))
+        store.fill(FakeExchange().fetch_ohlcv, "x", "BTC/USDT", "1m", T0, T0 + 5 * MINUTE)
+
+        records = store.read("x", "BTC/USDT", "1m", T0, T0 + 5 * MINUTE, format="structured")
+        block = store.read("x", "BTC/USDT", "1m", T0, T0 + 5 * MINUTE, format="numpy")
+        assert records["timestamp"].dtype == np.int64 and records["timestamp"][0] == T0
+        assert block.shape == (5, 6) and block[4, 0] == T0 + 4 * MINUTE
+
+
+class TestGatewayCandleStore:
+    """Test fetch_ohlcv with a candle store."""
+
+    def test_fetch_ohlcv_uses_store(self, tmp_path):
+        """Test that a repeated fetch is served from disk and without since bypasses it."""
+        exchange = FakeExchange()
+        adapter = ProdAdapter("binance", {"sandbox": True})
+        adapter._exchange = Mock()
+        adapter._exchange.fetch_ohlcv.side_effect = exchange.fetch_ohlcv
+        gateway = MockXGateway(adapter, candle_store=CandleStore(str(tmp_path)))
+
+        first = gateway.fetch_ohlcv("BTC/USDT", "1m", since=T0 + 1, limit=30)
+        second = gateway.fetch_ohlcv("BTC/USDT", "1m", since=T0 + 1, limit=30)
+
+        assert first == second
+        assert first[0][0] == T0 + MINUTE and len(first) == 30
+        assert adapter._exchange.fetch_ohlcv.call_count == 1
+
+        gateway.fetch_ohlcv("BTC/USDT", "1m", limit=30)
+        assert adapter._exchange.fetch_ohlcv.call_count == 2
+
+
+class TestBackfill:
+    """Test the parallel backfill."""
+
+    def test_windows_are_fetched_in_parallel_without_duplicates(self, tmp_path):
+        """Test that windows cover the range once and progress reaches 100%."""
+        exchange = FakeExchange()
+        store = CandleStore(str(tmp_path), page_limit=10)
+        reports = []
+
+        progress = backfill(
+            store,
+            exchange.fetch_ohlcv,
+            "x",
+            "BTC/USDT",
+            "1m",
+            T0,
+            T0 + 200 * MINUTE,
+            max_concurrency=4,
+            window=25,
+            on_progress=lambda p: reports.append(p.fraction),
+        )
+
+        assert progress.windows == 8
+        assert progress.rows == 200 and progress.fraction == 1.0
+        # One page per report, plus the first-candle probe
+        assert progress.requests == len(exchange.calls) == len(reports) + 1 == 25
+        assert reports == sorted(reports)
+        rows = store.read("x", "BTC/USDT", "1m", T0, T0 + 200 * MINUTE)
+        assert [row[0] for row in rows] == [T0 + i * MINUTE for i in range(200)]
+
+    def test_range_before_listing(self, tmp_path):
+        """Test that windows start at the first candle and a re-run only probes again."""
+        exchange = FakeExchange(gap=(0, T0))  # listed at T0
+        store = CandleStore(str(tmp_path), page_limit=100)
+        args = ("x", "BTC/USDT", "1m", T0 - 100_000 * MINUTE, T0 + 1000 * MINUTE)
+
+        progress = backfill(store, exchange.fetch_ohlcv, *args, max_concurrency=4)
+
+        assert progress.start == T0 and progress.fraction == 1.0
+        assert progress.windows == 4 and progress.rows == 1000
+        assert exchange.calls[0] == (args[3], 1)
+
+        exchange.calls.clear()
+        again = backfill(store, exchange.fetch_ohlcv, *args, max_concurrency=4)
+        assert exchange.calls == [(args[3], 1)]
+        assert again.windows == 0 and again.fraction == 1.0
+
+    def test_default_windows(self, tmp_path):
+        """Test that windows are whole pages, about one per worker."""
+        store = CandleStore(str(tmp_path), page_limit=10)
+        windows = plan_windows(store, [(T0, T0 + 95 * MINUTE)], "1m", workers=4)
+        assert windows == [
+            (T0, T0 + 30 * MINUTE),
+            (T0 + 30 * MINUTE, T0 + 60 * MINUTE),
+            (T0 + 60 * MINUTE, T0 + 90 * MINUTE),
+            (T0 + 90 * MINUTE, T0 + 95 * MINUTE),
+        ]
+
+    def test_resume_after_failure(self, tmp_path):
+        """Test that a failed window is reported and a second run only fetches the rest."""
+        exchange = FakeExchange()
+        failing = {T0 + 30 * MINUTE}
+
+        def fetch(symbol, timeframe, since, limit):
+            if since in failing:
+                failing.clear()
+                raise NetworkError("connection reset")
+            return exchange.fetch_ohlcv(symbol, timeframe, since, limit)
+
+        store = CandleStore(str(tmp_path), page_limit=10)
+        args = ("x", "BTC/USDT", "1m", T0, T0 + 100 * MINUTE)
+        with pytest.raises(NetworkError):
+            backfill(store, fetch, *args, max_concurrency=2, window=50)
+        assert store.missing(*args) == [(T0 + 30 * MINUTE, T0 + 50 * MINUTE)]
+
+        exchange.calls.clear()
+        progress = backfill(store, fetch, *args, max_concurrency=2, window=50)
+        assert exchange.calls == [(T0 + 30 * MINUTE, 10), (T0 + 40 * MINUTE, 10)]
+        assert progress.rows == 20 and progress.fraction == 1.0
+        assert len(store.read(*args)) == 100
+
+    def test_gateway_backfill(self, tmp_path):
+        """Test backfill_ohlcv on the gateway and its store requirement."""
+        adapter = ProdAdapter("binance", {"sandbox": True})
+        adapter._exchange = Mock()
+        adapter._exchange.fetch_ohlcv.side_effect = FakeExchange().fetch_ohlcv
+
+        with pytest.raises(NotSupported):
+            MockXGateway(adapter).backfill_ohlcv("BTC/USDT", since=T0)
+
+        gateway = MockXGateway(adapter, candle_store=CandleStore(str(tmp_path), page_limit=20))
+        progress = gateway.backfill_ohlcv("BTC/USDT", "1m", since=T0, until=T0 + 100 * MINUTE - 1)
+
+        assert progress.rows == 100
+        assert adapter._exchange.fetch_ohlcv.call_count == 6
+        assert len(gateway.fetch_ohlcv("BTC/USDT", "1m", since=T0, limit=100)) == 100
+        assert adapter._exchange.fetch_ohlcv.call_count == 6
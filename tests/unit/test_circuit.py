@@ -0,0 +1,197 @@
+"""Unit tests for circuit breakers."""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+import ccxt
+import pytest
+
+from mockexchange_gateway import BadRequest, ExchangeFactory, RequestTimeout
+from mockexchange_gateway.adapters.prod import ProdAdapter
+from mockexchange_gateway.core.circuit import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakers,
+    get_circuit_breaker_registry,
+)
+from mockexchange_gateway.core.errors import (
+    DeadlineExceeded,
+    ExchangeNotAvailable,
+    RateLimitBudgetExceeded,
+)
+from tests.helpers.mock_server import MockExchangeServer, default_handler
+
+
+def failing(func, error):
+    """Call func and swallow the expected error."""
+    with pytest.raises(type(error)):
+        func(Mock(side_effect=error))
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions."""
+
+    def test_opens_after_threshold_and_fails_fast(self):
+        """Test that consecutive failures open the circuit."""
+        breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=60)
+        for _ in range(2):
+            failing(breaker.call, RequestTimeout("slow"))
+        func = Mock()
+
+        with pytest.raises(ExchangeNotAvailable, match="Circuit open"):
+            breaker.call(func)
+
+        func.assert_not_called()
+        assert breaker.state == OPEN
+        assert breaker.stats()["rejected"] == 1
+
+    def test_business_errors_do_not_trip(self):
+        """Test that errors from a healthy backend count as successes."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        failing(breaker.call, RequestTimeout("slow"))
+        failing(breaker.call, BadRequest("bad"))
+        failing(breaker.call, RequestTimeout("slow"))
+
+        assert breaker.state == CLOSED
+
+    def test_half_open_probe(self):
+        """Test that one probe is let through and its outcome decides the state."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+        failing(breaker.call, RequestTimeout("slow"))
+        time.sleep(0.06)
+
+        assert breaker.state == HALF_OPEN
+        failing(breaker.call, RequestTimeout("still slow"))
+        assert breaker.state == OPEN
+
+        time.sleep(0.06)
+        breaker.before_call()
+        assert not breaker.allow_request()
+        breaker.on_success()
+        assert breaker.state == CLOSED
+
+    def test_local_errors_are_neutral(self):
+        """Test that errors raised before sending neither trip nor reset the breaker."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+        failing(breaker.call, RequestTimeout("slow"))
+        failing(breaker.call, DeadlineExceeded("spent"))
+        failing(breaker.call, RateLimitBudgetExceeded("busy"))
+        assert breaker.state == CLOSED
+        assert breaker.stats()["consecutive_failures"] == 1
+
+        failing(breaker.call, RequestTimeout("slow"))
+        time.sleep(0.06)
+        # A probe that never reached the backend frees its slot
+        failing(breaker.call, DeadlineExceeded("spent"))
+        assert breaker.state == HALF_OPEN and breaker.allow_request()
+
+    def test_cancelled_probe_frees_its_slot(self):
+        """Test that a cancelled half-open probe does not block the breaker."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+        failing(breaker.call, RequestTimeout("slow"))
+        time.sleep(0.06)
+
+        async def probe():
+            await asyncio.wait_for(breaker.call_async(lambda: asyncio.sleep(1)), 0.01)
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(probe())
+        assert breaker.state == HALF_OPEN and breaker.allow_request()
+
+    def test_endpoint_classes_trip_independently(self):
+        """Test that failing market data does not block orders."""
+        breakers = CircuitBreakers("backend", failure_threshold=1, recovery_timeout=60)
+        failing(breakers.for_endpoint("fetch_ticker").call, RequestTimeout("slow"))
+
+        assert not breakers.allow_request("fetch_tickers")
+        assert breakers.allow_request("create_order")
+
+
+class TestAdapterBreakers:
+    """Test breakers in the adapters."""
+
+    def test_paper_fails_fast_while_backend_is_down(self):
+        """Test that an open circuit stops requests from reaching MockExchange."""
+
+        def handler(method, path, body):
+            if path == "/balance":
+                return 503, {"message": "down"}
+            return default_handler(method, path, body)
+
+        with MockExchangeServer(handler) as server:
+            gateway = ExchangeFactory.create_paper_gateway(
+                base_url=server.url,
+                api_key="k",
+                circuit_breaker={"failure_threshold": 2, "recovery_timeout": 60},
+            )
+            for _ in range(2):
+                with pytest.raises(ExchangeNotAvailable):
+                    gateway.fetch_balance()
+            with pytest.raises(ExchangeNotAvailable, match="Circuit open"):
+                gateway.fetch_balance()
+            gateway.close()
+
+        assert len(server.requests) == 2
+        assert gateway.circuit_stats()["market_data"]["state"] == OPEN
+        assert not gateway.is_available("fetch_balance")
+        assert gateway.is_available("create_order")
+
+    def test_server_errors_open_the_circuit(self):
+        """Test that repeated 5xx responses count as backend failures."""
+
+        def handler(method, path, body):
+            if path == "/balance":
+                return 500, {"message": "internal error"}
+            return default_handler(method, path, body)
+
+        with MockExchangeServer(handler) as server:
+            gateway = ExchangeFactory.create_paper_gateway(
+                base_url=server.url,
+                api_key="k",
+                circuit_breaker={"failure_threshold": 3, "recovery_timeout": 60},
+            )
+            for _ in range(3):
+                with pytest.raises(ExchangeNotAvailable, match="HTTP 500"):
+                    gateway.fetch_balance()
+            with pytest.raises(ExchangeNotAvailable, match="Circuit open"):
+                gateway.fetch_balance()
+            gateway.close()
+
+        assert len(server.requests) == 3
+        assert gateway.circuit_stats()["market_data"]["state"] == OPEN
+
+    def test_spent_deadlines_do_not_open_the_circuit(self):
+        """Test that calls rejected by their own deadline are not backend failures."""
+        url = "http://127.0.0.1:9"
+        gateway = ExchangeFactory.create_paper_gateway(
+            base_url=url, api_key="k", circuit_breaker={"failure_threshold": 2}
+        )
+        try:
+            for _ in range(3):
+                with gateway.deadline(0.0), pytest.raises(DeadlineExceeded):
+                    gateway.fetch_balance()
+            assert gateway.circuit_stats()["market_data"]["state"] == CLOSED
+            assert gateway.circuit_stats()["market_data"]["times_opened"] == 0
+        finally:
+            gateway.close()
+            get_circuit_breaker_registry().remove(url)
+
+    def test_prod_counts_ccxt_network_errors(self):
+        """Test that ccxt network errors trip the prod breaker."""
+        adapter = ProdAdapter(
+            "binance",
+            {"sandbox": True},
+            circuit_breakers=CircuitBreakers(failure_threshold=1, recovery_timeout=60),
+        )
+        adapter._exchange = Mock()
+        adapter._exchange.fetch_ticker.side_effect = ccxt.ExchangeNotAvailable("down")
+
+        with pytest.raises(ccxt.ExchangeNotAvailable):
+            adapter.fetch_ticker("BTC/USDT")
+        with pytest.raises(ExchangeNotAvailable):
+            adapter.fetch_ticker("BTC/USDT")
+
+        assert adapter._exchange.fetch_ticker.call_count == 1
@@ -0,0 +1,69 @@
+"""Unit tests for the paper adapter JSON codecs."""
+
+import pytest
+
+from mockexchange_gateway import ExchangeError
+from mockexchange_gateway.adapters.codec import JsonCodec, get_codec
+from mockexchange_gateway.adapters.paper import PaperAdapter
+from tests.helpers.mock_server import MockExchangeServer
+
+
+class TestGetCodec:
+    """Test codec resolution."""
+
+    def test_auto_falls_back_to_an_installed_codec(self):
+        """Test that auto always resolves to a working codec."""
+        codec = get_codec("auto")
+
+        assert codec.loads(codec.dumps({"a": [1, 2.5, "x"]})) == {"a": [1, 2.5, "x"]}
+
+    def test_default_is_stdlib_json(self):
+        """Test that faster codecs are only used when asked for."""
+        assert type(get_codec()) is JsonCodec
+        assert type(get_codec(None)) is JsonCodec
+        assert type(PaperAdapter("http://localhost:8000", "test-key").codec) is JsonCodec
+
+    def test_instance_and_unknown_name(self):
+        """Test that instances pass through and unknown names are rejected."""
+        codec = JsonCodec()
+
+        assert get_codec(codec) is codec
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+
+    def test_invalid_input_raises_value_error(self):
+        """Test that every installed codec reports bad JSON as ValueError."""
+        for name in ("json", "orjson", "msgspec"):
+            try:
+                codec = get_codec(name)
+            except ImportError:
+                continue
+            with pytest.raises(ValueError):
+                codec.loads(b"{not json")
+
+
+class TestPaperAdapterCodec:
+    """Test that the paper adapter encodes and decodes through its codec."""
+
+    def test_order_payload_round_trip(self):
+        """Test that order payloads and responses use the codec."""
+        with MockExchangeServer() as server:
+            adapter = PaperAdapter(server.url, "test-key", codec="json")
+            order = adapter.create_order("BTC/USDT", "limit", "buy", 1.0, 100.0)
+            headers = server.requests[0][2]
+            adapter.close()
+
+        assert order["id"] == "order-1"
+        assert order["info"]["limit_price"] == 100.0
+        assert headers["Content-Type"] == "application/json"
+
+    def test_invalid_json_response(self):
+        """Test that an undecodable body maps to ExchangeError."""
+        adapter = PaperAdapter("http://localhost:8000", "test-key")
+        adapter.codec = JsonCodec()
+        adapter.session.request = lambda **kwargs: type(
+            "Response", (), {"status_code": 200, "content": b"<html>"}
+        )()
+
+        with pytest.raises(ExchangeError, match="Invalid JSON"):
+            adapter.fetch_balance()
@@ -0,0 +1,167 @@
+"""Unit tests for columnar order and ticker mapping."""
+
+import math
+from array import array
+from unittest.mock import Mock
+
+import pytest
+
+from mockexchange_gateway import ExchangeFactory
+from mockexchange_gateway.adapters.columnar import (
+    CCXT_ORDER_COLUMNS,
+    ORDER_COLUMNS,
+    TICKER_COLUMNS,
+    ohlcv_to_array,
+    resolve_backend,
+    to_columns,
+)
+from mockexchange_gateway.adapters.prod import ProdAdapter
+from mockexchange_gateway.core.facade import MockXGateway
+from tests.helpers.mock_server import MockExchangeServer, default_handler
+
+RAW_ORDERS = [
+    {
+        "id": "order-1",
+        "symbol": "BTC/USDT",
+        "side": "buy",
+        "type": "limit",
+        "status": "filled",
+        "price": 100.0,
+        "amount": 2.0,
+        "filled": 2.0,
+        "remaining": 0.0,
+        "cost": 200.0,
+        "created_at": 1700000000000,
+    },
+    {"id": "order-2", "symbol": "ETH/USDT", "side": "sell", "type": "market", "amount": 1},
+]
+
+
+def handler(method, path, body):
+    """Serve RAW_ORDERS on GET /orders."""
+    if method == "GET" and path == "/orders":
+        return 200, RAW_ORDERS
+    return default_handler(method, path, body)
+
+
+class TestToColumns:
+    """Test the single-pass column builder."""
+
+    def test_array_backend(self):
+        """Test column types, mapped statuses and missing values."""
+        columns = to_columns(RAW_ORDERS, ORDER_COLUMNS, backend="array")
+
+        assert columns.rows == 2
+        assert columns.backend == "array"
+        assert columns["id"] == ["order-1", "order-2"]
+        assert columns["status"] == ["closed", "unknown"]
+        assert isinstance(columns["price"], array) and columns["price"].typecode == "d"
+        assert columns["amount"].tolist() == [2.0, 1.0]
+        assert math.isnan(columns["price"][1])
+        assert columns["timestamp"].typecode == "q"
+        assert columns["timestamp"].tolist() == [1700000000000, 0]
+
+    def test_values_are_coerced(self):
+        """Test float timestamps and numeric strings, and that bad values become missing."""
+        columns = to_columns(
+            [
+                {"symbol": "X", "timestamp": 1700000000000.5, "bid": "1.5", "ask": 2},
+                {"symbol": "Y", "timestamp": "1700000000000", "bid": "n/a", "ask": [1]},
+            ],
+            TICKER_COLUMNS,
+            backend="array",
+        )
+
+        assert columns["timestamp"].tolist() == [1700000000000, 1700000000000]
+        assert columns["bid"][0] == 1.5 and columns["ask"][0] == 2.0
+        assert math.isnan(columns["bid"][1]) and math.isnan(columns["ask"][1])
+
+    def test_numpy_backend(self):
+        """Test that numeric columns become float64/int64 NumPy arrays."""
+        np = pytest.importorskip("numpy")
+        columns = to_columns(RAW_ORDERS, ORDER_COLUMNS, backend="numpy")
+
+        assert columns["price"].dtype == np.float64
+        assert columns["timestamp"].dtype == np.int64
+        assert list(columns["side"] == "buy") == [True, False]
+        assert to_columns([], ORDER_COLUMNS, backend="numpy")["price"].shape == (0,)
+
+    def test_backend_resolution(self):
+        """Test that unknown backends are rejected and auto always resolves."""
+        assert resolve_backend("auto") in ("numpy", "array")
+        with pytest.raises(ValueError):
+            resolve_backend("arrow")
+
+
+class TestGatewayColumnar:
+    """Test the columnar gateway methods."""
+
+    def test_paper_orders_and_tickers(self):
+        """Test columnar orders and tickers from a paper gateway."""
+        with MockExchangeServer(handler) as server:
+            gateway = ExchangeFactory.create_paper_gateway(base_url=server.url, api_key="k")
+            orders = gateway.fetch_orders_columnar(backend="array")
+            tickers = gateway.fetch_tickers_columnar(backend="array")
+            gateway.close()
+
+        assert orders["symbol"] == ["BTC/USDT", "ETH/USDT"]
+        assert orders["cost"][0] == 200.0
+        assert tickers.rows == 2
+        assert tickers["symbol"] == ["BTC/USDT", "ETH/USDT"]
+        assert tickers["last"].tolist() == [1.0, 1.0]
+        assert tickers.skipped == {}
+
+    def test_prod_orders_use_ccxt_fields(self):
+        """Test that production orders are read from ccxt's unified fields."""
+        adapter = ProdAdapter("binance", {"sandbox": True})
+        adapter._exchange = Mock()
+        adapter._exchange.fetch_orders.return_value = [
+            {"id": "1", "symbol": "BTC/USDT", "status": "open", "price": 5.0, "timestamp": 42}
+        ]
+        gateway = MockXGateway(adapter)
+
+        columns = gateway.fetch_orders_columnar(backend="array")
+
+        assert columns["status"] == ["open"]
+        assert columns["timestamp"].tolist() == [42]
+        assert [name for name, *_ in CCXT_ORDER_COLUMNS] == [name for name, *_ in ORDER_COLUMNS]
+
+
+class TestOhlcvFormats:
+    """Test fetch_ohlcv result formats."""
+
+    ROWS = [[1700000000000, 1.0, 2.0, 0.5, 1.5, 10.0], [1700000060000, 1.5, 2.5, 1.0, 2.0, None]]
+
+    def test_array_format(self):
+        """Test the flat stdlib array, with None as NaN."""
+        block = ohlcv_to_array(self.ROWS, "array")
+
+        assert block.typecode == "d"
+        assert block.tolist()[:6] == [1700000000000, 1.0, 2.0, 0.5, 1.5, 10.0]
+        assert len(block) == 12 and math.isnan(block[11])
+
+    def test_numpy_formats(self):
+        """Test the 2-D block and the structured array."""
+        np = pytest.importorskip("numpy")
+        block = ohlcv_to_array(self.ROWS, "numpy")
+        records = ohlcv_to_array(self.ROWS, "structured")
+
+        assert block.shape == (2, 6) and block.dtype == np.float64
+        assert block.flags["C_CONTIGUOUS"]
+        assert records["timestamp"].dtype == np.int64
+        assert records["timestamp"][1] == 1700000060000
+        assert np.isnan(records["volume"][1])
+        assert ohlcv_to_array([], "numpy").shape == (0, 6)
+
+    def test_gateway_format_is_checked_before_fetching(self):
+        """Test that fetch_ohlcv converts rows and rejects unknown formats up front."""
+        adapter = ProdAdapter("binance", {"sandbox": True})
+        adapter._exchange = Mock()
+        adapter._exchange.fetch_ohlcv.return_value = self.ROWS
+        gateway = MockXGateway(adapter)
+
+        assert gateway.fetch_ohlcv("BTC/USDT") == self.ROWS
+        assert len(gateway.fetch_ohlcv("BTC/USDT", format="array")) == 12
+        with pytest.raises(ValueError):
+            gateway.fetch_ohlcv("BTC/USDT", format="frame")
+        assert adapter._exchange.fetch_ohlcv.call_count == 2
@@ -0,0 +1,127 @@
+"""Unit tests for deadline propagation."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from mockexchange_gateway import ExchangeFactory, RequestTimeout
+from mockexchange_gateway.adapters.prod_async import AsyncProdAdapter
+from mockexchange_gateway.core.batch import run_batch
+from mockexchange_gateway.core.deadline import deadline, remaining
+from mockexchange_gateway.core.retry import RetryPolicy
+from mockexchange_gateway.core.singleflight import SingleFlight
+from tests.helpers.mock_server import MockExchangeServer, default_handler
+
+
+class TestDeadline:
+    """Test the deadline context."""
+
+    def test_nested_deadline_only_shortens(self):
+        """Test that an inner deadline cannot extend the outer budget."""
+        assert remaining() is None
+        with deadline(0.1):
+            with deadline(10):
+                assert remaining() <= 0.1
+        assert remaining() is None
+
+    def test_deadline_follows_batch_threads(self):
+        """Test that worker threads see the caller's deadline."""
+        with deadline(5):
+            results = run_batch(lambda _: remaining(), range(4), max_concurrency=4)
+
+        assert all(r.ok and 0 < r.result <= 5 for r in results)
+
+    def test_retry_stops_at_deadline(self):
+        """Test that retries are not started past the context deadline."""
+        policy = RetryPolicy(max_attempts=100, base_delay=0.02, max_delay=0.02)
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            raise RequestTimeout("slow")
+
+        start = time.monotonic()
+        with deadline(0.1), pytest.raises(RequestTimeout):
+            policy.call(flaky)
+
+        assert time.monotonic() - start < 0.3
+        assert 1 < len(calls) < 100
+
+    def test_follower_gives_up_at_its_deadline(self):
+        """Test that a coalesced waiter does not outlive its own deadline."""
+        flight = SingleFlight()
+        release = threading.Event()
+        leader = threading.Thread(target=flight.do, args=("k", release.wait))
+        leader.start()
+        time.sleep(0.02)
+
+        with deadline(0.05), pytest.raises(RequestTimeout):
+            flight.do("k", lambda: None)
+
+        release.set()
+        leader.join()
+
+
+class TestPaperDeadline:
+    """Test deadlines in the paper adapter."""
+
+    def test_slow_response_times_out_within_budget(self):
+        """Test that the socket timeout shrinks to the time left."""
+
+        def handler(method, path, body):
+            if path == "/balance":
+                time.sleep(0.5)
+            return default_handler(method, path, body)
+
+        with MockExchangeServer(handler) as server:
+            gateway = ExchangeFactory.create_paper_gateway(base_url=server.url, api_key="k")
+            start = time.monotonic()
+            with gateway.deadline(0.1), pytest.raises(RequestTimeout):
+                gateway.fetch_balance()
+            elapsed = time.monotonic() - start
+
+            assert gateway.fetch_balance()["free"]["USDT"] == 100.0
+            gateway.close()
+
+        assert elapsed < 0.4
+
+    def test_spent_budget_skips_the_request(self):
+        """Test that calls after the deadline are never sent."""
+        with MockExchangeServer() as server:
+            gateway = ExchangeFactory.create_paper_gateway(base_url=server.url, api_key="k")
+            with gateway.deadline(0.01):
+                time.sleep(0.02)
+                with pytest.raises(RequestTimeout, match="Deadline exceeded"):
+                    gateway.fetch_balance()
+            gateway.close()
+
+        assert server.requests == []
+
+
+class TestAsyncProdDeadline:
+    """Test deadlines on the async production adapter."""
+
+    def test_slow_call_times_out_and_spent_budget_skips_it(self):
+        """Test that a ccxt call is cut off at the deadline and not started after it."""
+        adapter = AsyncProdAdapter("binance", {"sandbox": True})
+        adapter._exchange = AsyncMock()
+
+        async def slow(symbol):
+            await asyncio.sleep(1)
+
+        adapter._exchange.fetch_ticker.side_effect = slow
+
+        async def test():
+            with deadline(0.05), pytest.raises(RequestTimeout):
+                await adapter.fetch_ticker("BTC/USDT")
+            with deadline(0.0), pytest.raises(RequestTimeout):
+                await adapter.fetch_ticker("BTC/USDT")
+
+        started = time.perf_counter()
+        asyncio.run(test())
+
+        assert time.perf_counter() - started < 0.5
+        assert adapter._exchange.fetch_ticker.await_count == 1
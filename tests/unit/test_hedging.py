@@ -0,0 +1,141 @@
+"""Unit tests for hedged reads."""
+
+import asyncio
+import threading
+import time
+
+from mockexchange_gateway.adapters.paper import PaperAdapter
+from mockexchange_gateway.core.hedging import HedgePolicy, LatencyEstimator
+from tests.helpers.mock_server import MockExchangeServer, default_handler
+
+
+def warmed_policy(endpoint, seconds=0.01, **options):
+    """Build a policy with enough samples to hedge endpoint after ~seconds."""
+    policy = HedgePolicy(min_samples=5, **options)
+    for _ in range(5):
+        policy.estimator.record(endpoint, seconds)
+    return policy
+
+
+class TestLatencyEstimator:
+    """Test percentile estimation."""
+
+    def test_percentiles_over_window(self):
+        """Test that percentiles use only the most recent samples."""
+        estimator = LatencyEstimator(window=100)
+        for i in range(200):
+            estimator.record("fetch_ticker", i / 1000)
+
+        assert estimator.count("fetch_ticker") == 100
+        assert estimator.percentile("fetch_ticker", 0) == 0.1
+        assert abs(estimator.percentile("fetch_ticker", 50) - 0.15) < 0.002
+        assert estimator.percentile("fetch_order", 50) is None
+
+
+class TestHedgePolicy:
+    """Test hedging decisions."""
+
+    def test_cold_endpoint_is_not_hedged(self):
+        """Test that endpoints without enough samples run once."""
+        policy = HedgePolicy(min_samples=5)
+        calls = []
+
+        assert policy.call("fetch_ticker", lambda: calls.append(1) or "ok") == "ok"
+        assert calls == [1]
+        assert policy.stats()["hedged"] == 0
+
+    def test_slow_request_is_hedged_and_backup_wins(self):
+        """Test that a slow first request gets a backup whose answer is used."""
+        policy = warmed_policy("fetch_ticker")
+        lock = threading.Lock()
+        calls = []
+
+        def request():
+            with lock:
+                calls.append(1)
+                first = len(calls) == 1
+            time.sleep(0.5 if first else 0.01)
+            return "slow" if first else "fast"
+
+        start = time.monotonic()
+        result = policy.call("fetch_ticker", request)
+
+        assert result == "fast"
+        assert time.monotonic() - start < 0.3
+        assert policy.stats()["hedge_wins"] == 1
+        policy.close()
+
+    def test_failed_primary_falls_back_to_backup(self):
+        """Test that the backup answer is used when the primary fails."""
+        policy = warmed_policy("fetch_ticker")
+        calls = []
+
+        def request():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.05)
+                raise TimeoutError("primary")
+            time.sleep(0.1)
+            return "backup"
+
+        assert policy.call("fetch_ticker", request) == "backup"
+        policy.close()
+
+    def test_async_loser_is_cancelled(self):
+        """Test that the async path cancels the slower request."""
+        policy = warmed_policy("fetch_ticker")
+        cancelled = []
+
+        async def main():
+            calls = []
+
+            async def request():
+                calls.append(1)
+                try:
+                    await asyncio.sleep(0.5 if len(calls) == 1 else 0.01)
+                except asyncio.CancelledError:
+                    cancelled.append(1)
+                    raise
+                return len(calls)
+
+            result = await policy.call_async("fetch_ticker", request)
+            await asyncio.sleep(0)
+            return result
+
+        assert asyncio.run(main()) == 2
+        assert cancelled == [1]
+
+
+class TestPaperHedging:
+    """Test hedging in the paper adapter."""
+
+    def test_only_reads_are_hedged(self):
+        """Test that slow GETs are hedged and POSTs never are."""
+        state = {"balance": 0}
+        lock = threading.Lock()
+
+        def handler(method, path, body):
+            if path == "/balance":
+                with lock:
+                    state["balance"] += 1
+                    first = state["balance"] == 1
+                if first:
+                    time.sleep(0.3)
+            if method == "POST":
+                time.sleep(0.05)
+            return default_handler(method, path, body)
+
+        with MockExchangeServer(handler) as server:
+            policy = warmed_policy("fetch_balance", 0.005)
+            for _ in range(5):
+                policy.estimator.record("create_order", 0.005)
+            adapter = PaperAdapter(server.url, "k", hedge_policy=policy)
+
+            adapter.fetch_balance()
+            adapter.create_order("BTC/USDT", "market", "buy", 1.0)
+            adapter.close()
+
+        posts = [r for r in server.requests if r[0] == "POST"]
+        assert state["balance"] == 2
+        assert len(posts) == 1
+        assert policy.stats()["hedged"] == 1
@@ -0,0 +1,113 @@
+"""Unit tests for lazy order and ticker mapping."""
+
+import pytest
+
+from mockexchange_gateway import ExchangeFactory
+from mockexchange_gateway.adapters.mapping import (
+    DataMapper,
+    LazyOrder,
+    LazyTicker,
+    ccxt_order_status,
+)
+from tests.helpers.mock_server import MockExchangeServer, default_handler
+
+RAW_ORDER = {
+    "id": "order-7",
+    "client_order_id": "mx1",
+    "symbol": "BTC/USDT",
+    "type": "limit",
+    "side": "buy",
+    "price": 100.0,
+    "amount": 2.0,
+    "filled": 1.0,
+    "remaining": 1.0,
+    "cost": 100.0,
+    "status": "partially_canceled",
+    "created_at": 1700000000000,
+    "updated_at": 1700000001000,
+}
+
+RAW_TICKER = {
+    "symbol": "BTC/USDT",
+    "timestamp": 1700000000000,
+    "bid": 99.0,
+    "ask": 101.0,
+    "last": 100.0,
+}
+
+
+def handler(method, path, body):
+    """Serve a list of raw orders on GET /orders."""
+    if method == "GET" and path == "/orders":
+        return 200, [RAW_ORDER, dict(RAW_ORDER, id="order-8", status="new")]
+    return default_handler(method, path, body)
+
+
+class TestLazyRecords:
+    """Test LazyOrder and LazyTicker against the eager mapper."""
+
+    def test_order_matches_eager_mapping(self):
+        """Test that a lazy order has the same keys, order and values."""
+        order = LazyOrder(RAW_ORDER)
+        eager = DataMapper.mockexchange_order_to_ccxt(RAW_ORDER)
+
+        assert order == eager
+        assert list(order) == list(eager)
+        assert order.to_dict() == eager
+        assert order["status"] == "canceled"
+        assert order["datetime"] == "2023-11-14T22:13:20Z"
+        assert order.info is RAW_ORDER
+
+    def test_ticker_matches_eager_mapping(self):
+        """Test that a lazy ticker equals the eager ticker."""
+        assert LazyTicker(RAW_TICKER) == DataMapper.mockexchange_ticker_to_ccxt(RAW_TICKER)
+
+    def test_fields_are_mapped_once_on_access(self):
+        """Test that nothing is mapped until read and reads are cached."""
+        order = LazyOrder(RAW_ORDER)
+        assert order._values is None
+
+        assert order.get("status") == "canceled"
+        assert order._values == {"status": "canceled"}
+        assert "datetime" in order and "missing" not in order
+        assert order.get("missing") is None
+
+    def test_is_read_only(self):
+        """Test that records refuse assignment and copy to a mutable dict."""
+        order = LazyOrder(RAW_ORDER)
+        with pytest.raises(TypeError):
+            order["status"] = "open"
+        with pytest.raises(AttributeError):
+            order.extra = 1
+
+        copy = order.copy()
+        copy["status"] = "open"
+        assert order["status"] == "canceled"
+
+    def test_order_status(self):
+        """Test status mapping, including unknown and missing statuses."""
+        assert ccxt_order_status("filled") == "closed"
+        assert ccxt_order_status("pending") == "pending"
+        assert ccxt_order_status(None) == "unknown"
+
+
+class TestLazyResults:
+    """Test the lazy_results gateway option."""
+
+    def test_fetch_orders_returns_lazy_orders(self):
+        """Test that fetched orders and tickers are lazy when enabled."""
+        with MockExchangeServer(handler) as server:
+            gateway = ExchangeFactory.create_paper_gateway(
+                base_url=server.url, api_key="k", lazy_results=True
+            )
+            orders = gateway.fetch_orders()
+            ticker = gateway.fetch_ticker("BTC/USDT")
+            created = gateway.create_order("BTC/USDT", "limit", "buy", 1.0, 100.0)
+            gateway.close()
+
+        assert [type(order) for order in orders] == [LazyOrder, LazyOrder]
+        assert [order["status"] for order in orders] == ["canceled", "open"]
+        assert isinstance(ticker, LazyTicker)
+        assert ticker["symbol"] == "BTC/USDT"
+        # Created orders stay dicts so the client order id can be stamped on them
+        assert type(created) is dict
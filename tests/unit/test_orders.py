@@ -0,0 +1,159 @@
+"""Unit tests for client order ids and submission dedup."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from mockexchange_gateway import AsyncMockXGateway, ExchangeFactory, MockXGateway, OrderNotFound
+from mockexchange_gateway.adapters.mapping import DataMapper
+from mockexchange_gateway.adapters.paper import PaperAdapter
+from mockexchange_gateway.adapters.paper_async import AsyncPaperAdapter
+from mockexchange_gateway.core.batch import BatchResult
+from mockexchange_gateway.core.orders import ClientOrderTable, new_client_order_id
+from tests.helpers.mock_server import MockExchangeServer
+
+
+def make_gateway():
+    """Build a gateway whose adapter echoes orders with incrementing ids."""
+    adapter = PaperAdapter("http://localhost:8000", "test-key")
+    counter = iter(range(1, 1000))
+
+    def create_order(symbol, type, side, amount, price=None, params=None):
+        time.sleep(0.01)
+        return {"id": str(next(counter)), "symbol": symbol, "clientOrderId": None}
+
+    adapter.create_order = Mock(side_effect=create_order)
+    adapter.fetch_order = Mock(side_effect=lambda order_id, symbol=None: {"id": order_id})
+    return MockXGateway(adapter, client_orders=ClientOrderTable()), adapter
+
+
+class TestClientOrderIds:
+    """Test client order id generation and dedup on the gateway."""
+
+    def test_ids_are_generated_and_sent(self):
+        """Test that orders without a client id get one and it reaches the backend."""
+        with MockExchangeServer() as server:
+            gateway = ExchangeFactory.create_paper_gateway(
+                base_url=server.url, api_key="k", client_order_ids=True
+            )
+            order = gateway.create_order("BTC/USDT", "market", "buy", 1.0)
+            gateway.close()
+
+        assert order["clientOrderId"].startswith("mx")
+        assert order["info"]["clientOrderId"] == order["clientOrderId"]
+        assert len(new_client_order_id()) <= 32
+
+    def test_duplicate_submission_is_one_order(self):
+        """Test that resubmitting a client id returns the recorded order."""
+        gateway, adapter = make_gateway()
+        params = {"clientOrderId": "strategy-1"}
+
+        first = gateway.create_order("BTC/USDT", "market", "buy", 1.0, params=params)
+        second = gateway.create_order("BTC/USDT", "market", "buy", 1.0, params=params)
+
+        assert first is second
+        assert adapter.create_order.call_count == 1
+        assert gateway.client_order_stats()["duplicates"] == 1
+
+    def test_concurrent_duplicates_share_one_request(self):
+        """Test that simultaneous submissions of one client id place one order."""
+        gateway, adapter = make_gateway()
+        params = {"clientOrderId": "strategy-2"}
+        results = []
+
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    gateway.create_order("BTC/USDT", "market", "buy", 1.0, params=params)
+                )
+            )
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert adapter.create_order.call_count == 1
+        assert len({r["id"] for r in results}) == 1
+
+    def test_concurrent_async_duplicates_share_one_request(self):
+        """Test that simultaneous tasks submitting one client id place one order."""
+        adapter = AsyncPaperAdapter("http://localhost:8000", "test-key")
+
+        async def create_order(symbol, type, side, amount, price=None, params=None):
+            await asyncio.sleep(0.01)
+            return {"id": "1", "symbol": symbol, "clientOrderId": params["clientOrderId"]}
+
+        adapter.create_order = AsyncMock(side_effect=create_order)
+        gateway = AsyncMockXGateway(adapter, client_orders=ClientOrderTable())
+        params = {"clientOrderId": "strategy-3"}
+
+        async def submit_twice():
+            return await asyncio.gather(
+                *(
+                    gateway.create_order("BTC/USDT", "market", "buy", 1.0, params=params)
+                    for _ in range(2)
+                )
+            )
+
+        first, second = asyncio.run(submit_twice())
+
+        assert first is second
+        assert adapter.create_order.call_count == 1
+
+    def test_fetch_by_client_id_is_a_lookup(self):
+        """Test that lookups by client id go straight to fetch_order."""
+        gateway, adapter = make_gateway()
+        order = gateway.create_order("BTC/USDT", "market", "buy", 1.0)
+
+        fetched = gateway.fetch_order_by_client_id(order["clientOrderId"])
+
+        assert fetched == {"id": order["id"]}
+        adapter.fetch_order.assert_called_once_with(order["id"], None)
+        with pytest.raises(OrderNotFound):
+            gateway.fetch_order_by_client_id("unknown")
+
+    def test_batch_skips_known_client_ids(self):
+        """Test that create_orders only sends orders it has not placed yet."""
+        gateway, adapter = make_gateway()
+        gateway.create_order("BTC/USDT", "market", "buy", 1.0, params={"clientOrderId": "a"})
+        adapter.create_orders = Mock(
+            side_effect=lambda specs, n: [BatchResult(i, {"id": "9"}) for i in range(len(specs))]
+        )
+
+        results = gateway.create_orders(
+            [
+                {
+                    "symbol": "BTC/USDT",
+                    "type": "market",
+                    "side": "buy",
+                    "amount": 1,
+                    "params": {"clientOrderId": "a"},
+                },
+                {"symbol": "ETH/USDT", "type": "market", "side": "buy", "amount": 1},
+            ]
+        )
+
+        sent = adapter.create_orders.call_args[0][0]
+        assert [s["symbol"] for s in sent] == ["ETH/USDT"]
+        assert results[0].result["id"] == "1"
+        assert results[1].result["clientOrderId"] == sent[0]["params"]["clientOrderId"]
+
+    def test_table_is_bounded(self):
+        """Test that the oldest submissions are dropped when full."""
+        table = ClientOrderTable(max_size=2)
+        for i in range(3):
+            table.record(f"c{i}", {"id": str(i)})
+
+        assert table.get("c0") is None
+        assert table.exchange_id("c2") == "2"
+
+    def test_mapper_keeps_client_order_id(self):
+        """Test that MockExchange client ids are mapped to clientOrderId."""
+        order = DataMapper.mockexchange_order_to_ccxt({"id": "1", "client_order_id": "x"})
+
+        assert order["clientOrderId"] == "x"
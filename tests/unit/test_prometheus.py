@@ -0,0 +1,79 @@
+"""Unit tests for the Prometheus exporter."""
+
+import pytest
+import requests
+
+from mockexchange_gateway import ExchangeFactory
+from mockexchange_gateway.core.errors import ExchangeNotAvailable
+from mockexchange_gateway.runtime.prometheus import CONTENT_TYPE, MetricsExporter
+from tests.helpers.mock_server import MockExchangeServer, default_handler
+
+
+def handler(method, path, body):
+    """Fail /balance with 503, serve everything else normally."""
+    if path == "/balance":
+        return 503, {"message": "down"}
+    return default_handler(method, path, body)
+
+
+@pytest.fixture
+def gateway():
+    """Paper gateway with a cache, a rate limiter and breakers against a mock server."""
+    with MockExchangeServer(handler) as server:
+        gateway = ExchangeFactory.create_paper_gateway(
+            base_url=server.url,
+            api_key="k",
+            ticker_cache_ttl_ms=60_000,
+            rate_limit={"market_data_per_second": 1000},
+            rate_limit_key="prometheus-test",
+            circuit_breaker={"failure_threshold": 1, "recovery_timeout": 60},
+            stats=True,
+        )
+        yield gateway
+        gateway.close()
+
+
+class TestMetricsExporter:
+    """Test the exposition payload."""
+
+    def test_renders_every_metric_family(self, gateway):
+        """Test that requests, histograms, cache, limiter and breakers are exported."""
+        gateway.fetch_ticker("BTC/USDT")
+        gateway.fetch_ticker("BTC/USDT")
+        with pytest.raises(ExchangeNotAvailable):
+            gateway.fetch_balance()
+        exporter = MetricsExporter()
+        exporter.register(gateway)
+
+        payload = exporter.render()
+        base = 'mode="paper",exchange_id="mockexchange"'
+
+        assert f'mockx_gateway_requests_total{{{base},endpoint="fetch_ticker"}} 1' in payload
+        assert (
+            "mockx_gateway_request_errors_total"
+            f'{{{base},endpoint="fetch_balance",error="ExchangeNotAvailable"}} 1'
+        ) in payload
+        assert "# TYPE mockx_gateway_request_duration_seconds histogram" in payload
+        assert (
+            "mockx_gateway_request_duration_seconds_bucket"
+            f'{{{base},endpoint="fetch_ticker",phase="network",le="+Inf"}} 1'
+        ) in payload
+        assert f"mockx_gateway_ticker_cache_hits_total{{{base}}} 1" in payload
+        assert f'mockx_gateway_rate_limit_acquired_total{{{base},bucket="market_data"}}' in payload
+        assert f'mockx_gateway_circuit_state{{{base},endpoint_class="market_data"}} 2' in payload
+
+    def test_serves_metrics_over_http(self, gateway):
+        """Test the built-in /metrics endpoint."""
+        gateway.fetch_ticker("BTC/USDT")
+        exporter = MetricsExporter()
+        exporter.register(gateway)
+        server = exporter.serve(port=0)
+        try:
+            response = requests.get(f"http://127.0.0.1:{server.server_address[1]}/metrics")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"] == CONTENT_TYPE
+        assert "mockx_gateway_requests_total" in response.text
@@ -0,0 +1,148 @@
+"""Unit tests for client-side rate limiting.
+
+These tests verify token bucket pacing, endpoint classification and
+sharing of limiters between gateways.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from mockexchange_gateway import ExchangeFactory, RateLimitExceeded
+from mockexchange_gateway.adapters.prod import ProdAdapter
+from mockexchange_gateway.core.endpoints import MARKET_DATA, ORDERS, endpoint_class, paper_endpoint
+from mockexchange_gateway.core.ratelimit import RateLimiter, TokenBucket
+from tests.helpers.mock_server import MockExchangeServer
+
+
+class TestTokenBucket:
+    """Test the token bucket."""
+
+    def test_burst_then_paced(self):
+        """Test that the burst is free and further tokens wait for refill."""
+        bucket = TokenBucket(rate=100, capacity=5)
+
+        waits = [bucket.reserve() for _ in range(7)]
+
+        assert waits[:5] == [0.0] * 5
+        assert 0 < waits[5] < waits[6] <= 0.021
+        assert bucket.stats()["waited"] == 2
+
+    def test_threads_share_budget(self):
+        """Test that concurrent threads together stay within the rate."""
+        bucket = TokenBucket(rate=200, capacity=1)
+        start = time.monotonic()
+
+        threads = [
+            threading.Thread(target=lambda: [bucket.acquire() for _ in range(10)]) for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 40 tokens at 200/s with a burst of 1 need at least 39 / 200 seconds
+        assert time.monotonic() - start >= 0.19
+        assert bucket.stats()["acquired"] == 40
+
+    def test_max_wait_rejects_without_taking_tokens(self):
+        """Test that an over-budget reservation raises and leaves tokens alone."""
+        bucket = TokenBucket(rate=1, capacity=1)
+        bucket.reserve()
+
+        with pytest.raises(RateLimitExceeded):
+            bucket.reserve(max_wait=0.1)
+
+        assert bucket.stats()["rejected"] == 1
+        assert bucket.stats()["acquired"] == 1
+
+
+class TestEndpoints:
+    """Test endpoint naming and classification."""
+
+    def test_paper_routes(self):
+        """Test that MockExchange routes map to unified method names."""
+        assert paper_endpoint("GET", "/tickers/BTC/USDT") == "fetch_ticker"
+        assert paper_endpoint("GET", "/tickers/BTC/USDT,ETH/USDT") == "fetch_tickers"
+        assert paper_endpoint("POST", "/orders") == "create_order"
+        assert paper_endpoint("POST", "/orders/abc/cancel") == "cancel_order"
+        assert paper_endpoint("GET", "/orders/list") == "fetch_order_ids"
+        assert paper_endpoint("GET", "/orders/abc") == "fetch_order"
+        assert paper_endpoint("DELETE", "/foo") == "DELETE /foo"
+
+    def test_classes(self):
+        """Test that only order placement/cancellation uses the order budget."""
+        assert endpoint_class("create_order") == ORDERS
+        assert endpoint_class("cancel_order") == ORDERS
+        assert endpoint_class("fetch_order") == MARKET_DATA
+        assert endpoint_class("fetch_tickers") == MARKET_DATA
+
+
+class TestRateLimiter:
+    """Test the two-budget limiter and its integration."""
+
+    def test_weights_and_separate_budgets(self):
+        """Test that heavy endpoints drain market data without touching orders."""
+        limiter = RateLimiter(
+            orders_per_second=10, market_data_per_second=10, weights={"fetch_tickers": 10}
+        )
+
+        assert limiter.reserve("fetch_tickers") == 0.0
+        assert limiter.reserve("fetch_ticker") > 0
+        assert limiter.reserve("create_order") == 0.0
+
+        stats = limiter.stats()
+        assert stats[MARKET_DATA]["acquired"] == 2
+        assert stats[ORDERS]["acquired"] == 1
+
+    def test_gateways_share_account_limiter(self):
+        """Test that gateways for the same account share one budget."""
+        with MockExchangeServer() as server:
+            options = {"market_data_per_second": 1000, "market_data_burst": 1000}
+            first = ExchangeFactory.create_paper_gateway(
+                base_url=server.url, api_key="acct-1", rate_limit=options
+            )
+            second = ExchangeFactory.create_paper_gateway(
+                base_url=server.url, api_key="acct-1", rate_limit=options
+            )
+            other = ExchangeFactory.create_paper_gateway(
+                base_url=server.url, api_key="acct-2", rate_limit=options
+            )
+            first.fetch_balance()
+            second.fetch_balance()
+            other.fetch_balance()
+
+        assert first._adapter.rate_limiter is second._adapter.rate_limiter
+        assert other._adapter.rate_limiter is not first._adapter.rate_limiter
+        assert first.rate_limit_stats()[MARKET_DATA]["acquired"] == 2
+
+    def test_prod_calls_are_limited(self):
+        """Test that ccxt calls are charged by method name."""
+        limiter = Mock()
+        adapter = ProdAdapter("binance", {"sandbox": True}, rate_limiter=limiter)
+        adapter._exchange = Mock()
+
+        adapter.fetch_ticker("BTC/USDT")
+
+        limiter.acquire.assert_called_once_with("fetch_ticker")
+
+    def test_sync_and_async_prod_share_account_limiter(self):
+        """Test that async prod gateways draw from the same budget as sync ones."""
+        options = {"market_data_per_second": 1000, "market_data_burst": 1000}
+        sync = ExchangeFactory.create_prod_gateway(
+            "binance", api_key="acct-shared", sandbox=True, rate_limit=options
+        )
+        gateway = ExchangeFactory.create_async_prod_gateway(
+            "binance", api_key="acct-shared", sandbox=True, rate_limit=options
+        )
+        adapter = gateway._adapter
+        adapter._exchange = AsyncMock()
+
+        asyncio.run(adapter.fetch_ticker("BTC/USDT"))
+
+        assert adapter.rate_limiter is sync._adapter.rate_limiter
+        assert adapter.rate_limiter.stats()[MARKET_DATA]["acquired"] == 1
+        assert adapter.config["enableRateLimit"] is False
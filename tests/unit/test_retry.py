@@ -0,0 +1,137 @@
+"""Unit tests for the retry policy.
+
+These tests verify retryability classification, backoff bounds, the
+deadline, and that writes are only retried with an idempotency key.
+"""
+
+import time
+from unittest.mock import Mock
+
+import ccxt
+import pytest
+
+from mockexchange_gateway import BadRequest, RequestTimeout
+from mockexchange_gateway.adapters.paper import PaperAdapter
+from mockexchange_gateway.adapters.prod import ProdAdapter
+from mockexchange_gateway.core.errors import (
+    DeadlineExceeded,
+    ExchangeNotAvailable,
+    RateLimitBudgetExceeded,
+    RateLimitExceeded,
+)
+from mockexchange_gateway.core.retry import RetryPolicy
+from tests.helpers.mock_server import MockExchangeServer, default_handler
+
+
+def flaky(failures, status=503):
+    """Build a handler that fails the first `failures` requests."""
+    state = {"calls": 0}
+
+    def handler(method, path, body):
+        state["calls"] += 1
+        if state["calls"] <= failures:
+            return status, {"message": "try again"}
+        return default_handler(method, path, body)
+
+    return handler
+
+
+class TestRetryPolicy:
+    """Test the policy on plain callables."""
+
+    def test_retries_transient_errors(self):
+        """Test that retryable errors are retried until success."""
+        policy = RetryPolicy(max_attempts=3, base_delay=0)
+        func = Mock(side_effect=[RequestTimeout("slow"), RateLimitExceeded("429"), "ok"])
+
+        assert policy.call(func) == "ok"
+        assert func.call_count == 3
+        assert policy.stats() == {"calls": 1, "retries": 2, "recovered": 1, "exhausted": 0}
+
+    def test_does_not_retry_exchange_errors_or_writes(self):
+        """Test that non-transient errors and non-idempotent calls fail fast."""
+        policy = RetryPolicy(max_attempts=5, base_delay=0)
+        bad = Mock(side_effect=BadRequest("bad"))
+        write = Mock(side_effect=RequestTimeout("slow"))
+
+        with pytest.raises(BadRequest):
+            policy.call(bad)
+        with pytest.raises(RequestTimeout):
+            policy.call(write, idempotent=False)
+
+        assert bad.call_count == 1
+        assert write.call_count == 1
+
+    def test_does_not_retry_local_refusals(self):
+        """Test that spent deadlines and rate limit budgets are not retried."""
+        policy = RetryPolicy(max_attempts=5, base_delay=0)
+        for error in (DeadlineExceeded("spent"), RateLimitBudgetExceeded("over budget")):
+            func = Mock(side_effect=error)
+            with pytest.raises(type(error)):
+                policy.call(func)
+            assert func.call_count == 1
+        assert policy.stats()["retries"] == 0
+
+    def test_backoff_is_capped(self):
+        """Test that jittered delays stay within the exponential cap."""
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.5)
+
+        assert all(0 <= policy.backoff(1) <= 0.1 for _ in range(50))
+        assert all(0 <= policy.backoff(10) <= 0.5 for _ in range(50))
+
+    def test_deadline_stops_retries(self):
+        """Test that no retry starts after the deadline."""
+        policy = RetryPolicy(max_attempts=100, base_delay=0.05, max_delay=0.05, deadline=0.2)
+        func = Mock(side_effect=ExchangeNotAvailable("down"))
+        start = time.monotonic()
+
+        with pytest.raises(ExchangeNotAvailable):
+            policy.call(func)
+
+        assert time.monotonic() - start < 0.5
+        assert policy.stats()["exhausted"] == 1
+
+
+class TestAdapterRetries:
+    """Test retries in the adapters."""
+
+    def test_paper_read_rides_out_503(self):
+        """Test that a GET is retried through transient 503s."""
+        with MockExchangeServer(flaky(2)) as server:
+            adapter = PaperAdapter(
+                server.url, "test-key", retry_policy=RetryPolicy(max_attempts=3, base_delay=0)
+            )
+            balance = adapter.fetch_balance()
+            adapter.close()
+
+        assert balance["free"]["USDT"] == 100.0
+        assert len(server.requests) == 3
+
+    def test_paper_writes_are_not_retried(self):
+        """Test that POST /orders is not resent, even with a client order id."""
+        policy = RetryPolicy(max_attempts=3, base_delay=0)
+        with MockExchangeServer(flaky(2)) as server:
+            adapter = PaperAdapter(server.url, "test-key", retry_policy=policy)
+            with pytest.raises(ExchangeNotAvailable):
+                adapter.create_order("BTC/USDT", "market", "buy", 1.0)
+            with pytest.raises(ExchangeNotAvailable):
+                adapter.create_order(
+                    "BTC/USDT", "market", "buy", 1.0, params={"clientOrderId": "abc"}
+                )
+            adapter.close()
+
+        assert len(server.requests) == 2
+
+    def test_prod_retries_ccxt_network_errors(self):
+        """Test that ccxt network errors on reads are retried."""
+        adapter = ProdAdapter(
+            "binance", {"sandbox": True}, retry_policy=RetryPolicy(max_attempts=2, base_delay=0)
+        )
+        adapter._exchange = Mock()
+        adapter._exchange.fetch_ticker.side_effect = [ccxt.RequestTimeout("slow"), {"last": 1}]
+        adapter._exchange.create_order.side_effect = ccxt.RequestTimeout("slow")
+
+        assert adapter.fetch_ticker("BTC/USDT") == {"last": 1}
+        with pytest.raises(ccxt.RequestTimeout):
+            adapter.create_order("BTC/USDT", "market", "buy", 1.0)
+        assert adapter._exchange.create_order.call_count == 1
@@ -0,0 +1,98 @@
+"""Unit tests for HTTP session and connection pool handling.
+
+These tests run the paper adapter against an in-process HTTP server.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from mockexchange_gateway import ExchangeFactory
+from mockexchange_gateway.adapters.paper import PaperAdapter
+from mockexchange_gateway.adapters.session import (
+    PoolConfig,
+    SessionRegistry,
+    get_session_registry,
+)
+from tests.helpers.mock_server import MockExchangeServer
+
+
+class TestConnectionPooling:
+    """Test connection pool configuration and statistics."""
+
+    def test_factory_passes_pool_options(self):
+        """Test that factory options reach the adapter."""
+        gateway = ExchangeFactory.create_paper_gateway(
+            api_key="test-key",
+            pool_maxsize=32,
+            keep_alive=False,
+            connect_timeout=0.5,
+            read_timeout=3.0,
+        )
+
+        config = gateway.pool_stats()["config"]
+        assert config["pool_maxsize"] == 32
+        assert config["keep_alive"] is False
+        assert (config["connect_timeout"], config["read_timeout"]) == (0.5, 3.0)
+        assert gateway._adapter.session.headers["Connection"] == "close"
+
+    def test_connections_are_reused_across_threads(self):
+        """Test that a pool sized for the thread count reuses connections."""
+        with MockExchangeServer() as server:
+            adapter = PaperAdapter(server.url, "test-key", pool_config=PoolConfig(pool_maxsize=4))
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                list(pool.map(lambda _: adapter.fetch_balance(), range(40)))
+
+            (stats,) = adapter.pool_stats()["pools"]
+            adapter.close()
+
+        assert stats["requests_served"] == 40
+        assert stats["connections_opened"] <= 4
+        assert stats["maxsize"] == 4
+
+
+class TestSharedSessions:
+    """Test the process-wide session registry."""
+
+    def test_gateways_share_one_pool_with_own_credentials(self):
+        """Test that shared gateways reuse a session but send their own API key."""
+        with MockExchangeServer() as server:
+            gateways = [
+                ExchangeFactory.create_paper_gateway(
+                    base_url=server.url, api_key=f"key-{i}", share_session=True
+                )
+                for i in range(3)
+            ]
+            for gateway in gateways:
+                gateway.fetch_balance()
+
+            sessions = {id(g._adapter.session) for g in gateways}
+            keys = [headers.get("x-api-key") for _, _, headers in server.requests]
+            (entry,) = [
+                s for s in get_session_registry().stats()["sessions"] if s["base_url"] == server.url
+            ]
+
+            for gateway in gateways:
+                gateway.close()
+                gateway.close()
+
+        assert len(sessions) == 1
+        assert keys == ["key-0", "key-1", "key-2"]
+        assert entry["borrowers"] == 3
+        assert entry["pools"][0]["connections_opened"] == 1
+        assert all(s["base_url"] != server.url for s in get_session_registry().stats()["sessions"])
+
+    def test_registry_refcounts_sessions(self):
+        """Test that the session closes only after the last release."""
+        registry = SessionRegistry()
+        first = registry.acquire("http://example.test/")
+        second = registry.acquire("http://example.test")
+        other = registry.acquire("http://example.test", PoolConfig(pool_maxsize=50))
+
+        registry.release("http://example.test")
+        assert len(registry.stats()["sessions"]) == 2
+
+        registry.release("http://example.test")
+        registry.release("http://example.test", PoolConfig(pool_maxsize=50))
+
+        assert first is second
+        assert other is not first
+        assert registry.stats()["sessions"] == []
@@ -0,0 +1,105 @@
+"""Unit tests for single-flight request coalescing.
+
+These tests verify that identical concurrent reads share one backend
+call while writes are never coalesced.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from mockexchange_gateway import NetworkError
+from mockexchange_gateway.adapters.paper import PaperAdapter
+from mockexchange_gateway.adapters.prod import ProdAdapter
+from mockexchange_gateway.core.singleflight import SingleFlight, make_key
+
+
+def _slow(result, delay=0.05):
+    calls = []
+
+    def func(*args, **kwargs):
+        calls.append(args)
+        time.sleep(delay)
+        return result
+
+    return func, calls
+
+
+def _run_concurrently(func, n=8):
+    barrier = threading.Barrier(n)
+
+    def run(_):
+        barrier.wait()
+        return func()
+
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        return list(pool.map(run, range(n)))
+
+
+class TestSingleFlight:
+    """Test the SingleFlight primitive."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that concurrent callers with the same key share a result."""
+        flight = SingleFlight()
+        func, calls = _slow({"ok": True})
+
+        results = _run_concurrently(lambda: flight.do("key", func))
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+        assert flight.stats()["shared"] == 7
+
+    def test_errors_propagate_to_all_callers(self):
+        """Test that followers receive the leader's exception."""
+        flight = SingleFlight()
+
+        def fail():
+            time.sleep(0.05)
+            raise NetworkError("down")
+
+        def call():
+            with pytest.raises(NetworkError):
+                flight.do("key", fail)
+
+        _run_concurrently(call, n=4)
+        assert flight.stats()["in_flight"] == 0
+
+    def test_make_key_ignores_dict_order(self):
+        """Test that equal params produce equal keys."""
+        assert make_key("GET", "/orders", {"a": 1, "b": 2}) == make_key(
+            "GET", "/orders", {"b": 2, "a": 1}
+        )
+
+
+class TestAdapterCoalescing:
+    """Test coalescing in the paper and prod adapters."""
+
+    def test_paper_coalesces_gets_only(self):
+        """Test that paper GETs are coalesced and POSTs are not."""
+        adapter = PaperAdapter("http://localhost:8000", "test-key", coalesce_reads=True)
+        func, calls = _slow({"assets": []})
+        adapter._send_request = func
+
+        _run_concurrently(lambda: adapter._make_request("GET", "/balance"))
+        assert len(calls) == 1
+
+        _run_concurrently(lambda: adapter._make_request("POST", "/orders", json={"a": 1}))
+        assert len(calls) == 9
+
+    def test_prod_coalesces_reads_only(self):
+        """Test that prod reads are coalesced and order creation is not."""
+        adapter = ProdAdapter("binance", {"sandbox": True}, coalesce_reads=True)
+        exchange = Mock()
+        exchange.fetch_ticker, ticker_calls = _slow({"symbol": "BTC/USDT"})
+        exchange.create_order, order_calls = _slow({"id": "1"})
+        adapter._exchange = exchange
+
+        _run_concurrently(lambda: adapter.fetch_ticker("BTC/USDT"))
+        _run_concurrently(lambda: adapter.create_order("BTC/USDT", "market", "buy", 1))
+
+        assert len(ticker_calls) == 1
+        assert len(order_calls) == 8
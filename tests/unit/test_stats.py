@@ -0,0 +1,120 @@
+"""Unit tests for per-endpoint stats."""
+
+from unittest.mock import Mock
+
+import ccxt
+import pytest
+
+from mockexchange_gateway import ExchangeFactory
+from mockexchange_gateway.adapters.prod import ProdAdapter
+from mockexchange_gateway.core.errors import ExchangeNotAvailable
+from mockexchange_gateway.core.stats import GatewayStats, LatencyHistogram
+from tests.helpers.mock_server import MockExchangeServer, default_handler
+
+
+class TestLatencyHistogram:
+    """Test histogram precision."""
+
+    def test_percentiles_within_relative_error(self):
+        """Test that percentiles are within the bucket precision."""
+        histogram = LatencyHistogram()
+        for i in range(1, 10001):
+            histogram.record(i / 1000)  # 1ms .. 10s
+
+        assert histogram.count == 10000
+        for percentile, expected in ((50, 5.0), (99, 9.9), (99.9, 9.99)):
+            assert abs(histogram.percentile(percentile) - expected) / expected < 0.02
+        assert histogram.percentile(100) == 10.0
+        assert histogram.summary()["min"] == 1.0
+
+    def test_small_values_are_exact(self):
+        """Test that sub-bucket-range microsecond values keep full precision."""
+        histogram = LatencyHistogram()
+        for us in (3, 7, 100):
+            histogram.record(us / 1_000_000)
+
+        assert histogram.percentile(50) == 7 / 1_000_000
+
+
+class TestGatewayStats:
+    """Test the collector."""
+
+    def test_measure_records_errors_by_class(self):
+        """Test that failures are counted under their exception class."""
+        stats = GatewayStats()
+        stats.measure("fetch_ticker", lambda: 1)
+        with pytest.raises(ExchangeNotAvailable):
+            stats.measure("fetch_ticker", Mock(side_effect=ExchangeNotAvailable("down")))
+
+        ticker = stats.snapshot()["endpoints"]["fetch_ticker"]
+        assert ticker["count"] == 2
+        assert ticker["errors"] == {"ExchangeNotAvailable": 1}
+
+    def test_reset_starts_a_new_window(self):
+        """Test that snapshot(reset=True) returns the old window and clears it."""
+        stats = GatewayStats()
+        stats.measure("fetch_balance", lambda: 1)
+
+        assert stats.snapshot(reset=True)["endpoints"]["fetch_balance"]["count"] == 1
+        assert stats.snapshot()["endpoints"] == {}
+
+    def test_snapshot_summarizes_outside_the_lock(self, monkeypatch):
+        """Test that calls can be recorded while a snapshot computes percentiles."""
+        stats = GatewayStats()
+        stats.record("fetch_ticker", 0.01)
+        summary = LatencyHistogram.summary
+
+        def record_during_summary(histogram, bounds=None):
+            assert not stats._lock.locked()
+            stats.record("fetch_ticker", 0.02)
+            return summary(histogram, bounds)
+
+        monkeypatch.setattr(LatencyHistogram, "summary", record_during_summary)
+        snapshot = stats.snapshot(bounds=(0.05,))["endpoints"]["fetch_ticker"]
+
+        # The snapshot is a copy taken before the concurrent records
+        assert snapshot["count"] == 1 and snapshot["network_ms"]["buckets"] == [1]
+        assert stats._endpoints["fetch_ticker"].count == 3
+
+
+class TestAdapterStats:
+    """Test stats in the adapters."""
+
+    def test_paper_records_network_mapping_and_bytes(self):
+        """Test that paper calls record every dimension per endpoint."""
+        with MockExchangeServer(default_handler) as server:
+            gateway = ExchangeFactory.create_paper_gateway(
+                base_url=server.url, api_key="k", stats=True
+            )
+            gateway.fetch_balance()
+            gateway.create_order("BTC/USDT", "limit", "buy", 1.0, 100.0)
+            stats = gateway.stats()
+            gateway.close()
+
+        balance = stats["endpoints"]["fetch_balance"]
+        order = stats["endpoints"]["create_order"]
+        assert balance["count"] == 1
+        assert balance["bytes_out"] == 0 and balance["bytes_in"] > 0
+        assert balance["network_ms"]["count"] == 1
+        assert balance["mapping_ms"]["count"] == 1
+        assert order["bytes_out"] > 0
+
+    def test_prod_times_every_delegation(self):
+        """Test that prod calls are recorded by ccxt method name."""
+        adapter = ProdAdapter("binance", {"sandbox": True}, stats=GatewayStats())
+        adapter._exchange = Mock()
+        adapter._exchange.fetch_ticker.side_effect = [{"last": 1.0}, ccxt.NetworkError("x")]
+
+        adapter.fetch_ticker("BTC/USDT")
+        with pytest.raises(ccxt.NetworkError):
+            adapter.fetch_ticker("BTC/USDT")
+
+        ticker = adapter.stats.snapshot()["endpoints"]["fetch_ticker"]
+        assert ticker["count"] == 2
+        assert ticker["errors"] == {"NetworkError": 1}
+
+    def test_disabled_stats(self):
+        """Test that stats are off by default and then return an empty dict."""
+        gateway = ExchangeFactory.create_paper_gateway()
+        assert gateway.stats() == {}
+        gateway.close()
@@ -0,0 +1,133 @@
+"""Unit tests for tracing hooks."""
+
+import asyncio
+from contextlib import contextmanager
+from unittest.mock import Mock
+
+import pytest
+
+from mockexchange_gateway import ExchangeFactory
+from mockexchange_gateway.adapters.prod import ProdAdapter
+from mockexchange_gateway.core.errors import ExchangeNotAvailable
+from mockexchange_gateway.core.facade import MockXGateway
+from tests.helpers.mock_server import MockExchangeServer, default_handler
+
+
+class Span:
+    """Minimal span recording its name, attributes and parent."""
+
+    def __init__(self, name, attributes, parent):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.parent = parent
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+class Recorder:
+    """Tracer that keeps every span and tracks nesting."""
+
+    def __init__(self):
+        self.spans = []
+        self._stack = []
+
+    @contextmanager
+    def __call__(self, name, attributes):
+        span = Span(name, attributes, self._stack[-1].name if self._stack else None)
+        self.spans.append(span)
+        self._stack.append(span)
+        try:
+            yield span
+        finally:
+            self._stack.pop()
+
+    def named(self, name):
+        return next(s for s in self.spans if s.name == name)
+
+
+def handler(method, path, body):
+    """Fail /balance with 503, serve everything else normally."""
+    if path == "/balance":
+        return 503, {"message": "down"}
+    return default_handler(method, path, body)
+
+
+class TestPaperTracing:
+    """Test spans around paper calls."""
+
+    def test_spans_nest_from_gateway_to_http_and_mapping(self):
+        """Test the gateway, HTTP and mapping spans and their attributes."""
+        recorder = Recorder()
+        with MockExchangeServer(handler) as server:
+            gateway = ExchangeFactory.create_paper_gateway(
+                base_url=server.url, api_key="k", tracer=recorder
+            )
+            gateway.create_order("BTC/USDT", "limit", "buy", 1.0, 100.0)
+            with pytest.raises(ExchangeNotAvailable):
+                gateway.fetch_balance()
+            gateway.close()
+
+        order = recorder.named("gateway.create_order")
+        assert order.attributes["symbol"] == "BTC/USDT"
+        assert order.attributes["side"] == "buy"
+        assert order.attributes["order_id"] == "order-1"
+
+        http = recorder.named("mockexchange.create_order")
+        assert http.parent == "gateway.create_order"
+        assert http.attributes["http.status_code"] == 200
+        assert recorder.named("map.create_order").parent == "gateway.create_order"
+
+        failed = recorder.named("mockexchange.fetch_balance")
+        assert failed.attributes["http.status_code"] == 503
+        assert failed.attributes["error.type"] == "ExchangeNotAvailable"
+        assert recorder.named("gateway.fetch_balance").attributes["error.type"] == (
+            "ExchangeNotAvailable"
+        )
+
+    def test_async_gateway_spans(self):
+        """Test that the async gateway produces the same spans."""
+        recorder = Recorder()
+
+        async def main(url):
+            gateway = ExchangeFactory.create_async_paper_gateway(
+                base_url=url, api_key="k", tracer=recorder
+            )
+            try:
+                await gateway.fetch_ticker("BTC/USDT")
+            finally:
+                await gateway.close()
+
+        with MockExchangeServer() as server:
+            asyncio.run(main(server.url))
+
+        assert recorder.named("gateway.fetch_ticker").attributes["symbol"] == "BTC/USDT"
+        assert recorder.named("mockexchange.fetch_ticker").parent == "gateway.fetch_ticker"
+
+    def test_no_tracer_no_spans(self):
+        """Test that clearing the tracer stops producing spans."""
+        recorder = Recorder()
+        adapter = Mock()
+        adapter.fetch_order.return_value = {"id": "1", "symbol": "BTC/USDT"}
+        gateway = MockXGateway(adapter)
+        gateway.set_tracer(recorder)
+        gateway.fetch_order("1")
+        gateway.set_tracer(None)
+        gateway.fetch_order("1")
+
+        assert [s.name for s in recorder.spans] == ["gateway.fetch_order"]
+        assert adapter.tracer is None
+
+
+def test_prod_ccxt_span():
+    """Test that prod calls get a ccxt.<method> span."""
+    recorder = Recorder()
+    adapter = ProdAdapter("binance", {"sandbox": True})
+    adapter._exchange = Mock()
+    adapter._exchange.fetch_ticker.return_value = {"symbol": "BTC/USDT"}
+    gateway = MockXGateway(adapter)
+    gateway.set_tracer(recorder)
+
+    gateway.fetch_ticker("BTC/USDT")
+
+    assert recorder.named("ccxt.fetch_ticker").parent == "gateway.fetch_ticker"